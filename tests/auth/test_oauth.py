@@ -2,6 +2,7 @@ import json
 import os
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict
 from unittest import mock
@@ -9,6 +10,7 @@ from unittest import mock
 import pytest
 from requests import Response
 
+from ytmusicapi.auth.oauth import OAuthToken, RefreshingToken
 from ytmusicapi.auth.types import AuthType
 from ytmusicapi.constants import OAUTH_CLIENT_ID, OAUTH_CLIENT_SECRET
 from ytmusicapi.setup import main
@@ -112,3 +114,18 @@ class TestOAuth:
     def test_partial_credentials(self):
         with pytest.raises(KeyError):
             OAuthCredentials(client_id="yes")
+
+    def test_single_refresh(self):
+        refreshed = []
+
+        def refresh_token(refresh_token):
+            time.sleep(0.05)  # let all threads find the expiring token
+            refreshed.append(refresh_token)
+            return {"access_token": "fresh", "expires_in": 3600}
+
+        credentials = mock.Mock(refresh_token=refresh_token)
+        token = RefreshingToken(OAuthToken("stale", "refresh", "scope", "Bearer", expires_in=0), credentials)
+        with ThreadPoolExecutor(8) as executor:
+            access_tokens = list(executor.map(lambda _: token.access_token, range(8)))
+        assert access_tokens == ["fresh"] * 8
+        assert refreshed == ["refresh"]
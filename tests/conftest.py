@@ -1,9 +1,13 @@
 import configparser
 from pathlib import Path
+from typing import Callable, Iterator
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
 
-from ytmusicapi import YTMusic
+from ytmusicapi import YTMusic, bootstrap
+from ytmusicapi.testing import InnerTubeServer
+from ytmusicapi.transport import FakeTransport
 
 
 def get_resource(file: str) -> str:
@@ -11,6 +15,12 @@ def get_resource(file: str) -> str:
     return data_dir.joinpath(file).as_posix()
 
 
+@pytest.fixture(autouse=True)
+def clear_bootstrap():
+    """isolate tests serving different homepages"""
+    bootstrap.shared.clear()
+
+
 @pytest.fixture(name="config")
 def fixture_config() -> configparser.RawConfigParser:
     config = configparser.RawConfigParser()
@@ -85,3 +95,31 @@ def fixture_yt_brand(config) -> YTMusic:
 @pytest.fixture(name="yt_empty")
 def fixture_yt_empty(config) -> YTMusic:
     return YTMusic(config["auth"]["headers_empty"], config["auth"]["brand_account_empty"])
+
+
+@pytest.fixture(name="server")
+def fixture_server() -> Iterator[InnerTubeServer]:
+    """stand-in API, only used to build responses, the socket is never served"""
+    server = InnerTubeServer(collection_size=250, page_size=100)
+    yield server
+    server.httpd.server_close()
+
+
+@pytest.fixture(name="stand_in")
+def fixture_stand_in(server) -> Callable[[str], Callable]:
+    """builds FakeTransport handlers answering requests of an endpoint like the stand-in API"""
+
+    def stand_in(endpoint):
+        def handler(request):
+            query = {key: values[0] for key, values in parse_qs(urlsplit(request.url).query).items()}
+            return server.respond(endpoint, query, request.body)[1]
+
+        return handler
+
+    return stand_in
+
+
+@pytest.fixture(name="fake")
+def fixture_fake(stand_in) -> FakeTransport:
+    """offline transport serving playlists and search results of the stand-in API"""
+    return FakeTransport({"browse": stand_in("browse"), "search": stand_in("search")})
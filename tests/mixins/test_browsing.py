@@ -2,7 +2,10 @@ import warnings
 
 import pytest
 
-from ytmusicapi.models import CoreTrack
+from ytmusicapi import YTMusic
+from ytmusicapi.models import Album, Artist, CoreTrack
+from ytmusicapi.testing import templates
+from ytmusicapi.transport import FakeTransport
 
 
 class TestBrowsing:
@@ -21,6 +24,9 @@ class TestBrowsing:
         artist = yt.get_artist("MPLAUCmMUZbaYdNH0bEd1PAlAqsA")
         assert len(artist) == 17
 
+        model = yt.get_artist("MPLAUCmMUZbaYdNH0bEd1PAlAqsA", result_format="model")
+        assert isinstance(model, Artist) and model.model_dump(exclude_unset=True) == artist
+
         # make sure artists are correctly filled for categories
         for k in ["songs", "videos"]:
             assert {"id": "UCmMUZbaYdNH0bEd1PAlAqsA", "name": "Oasis"} in artist[k]["items"][0]["artists"]
@@ -96,6 +102,8 @@ class TestBrowsing:
         # assert all(item["views"] is not None for item in album["tracks"])
         assert album["tracks"][0]["track_number"] == 1
         assert "feedback_tokens" in album["tracks"][0]
+        model = yt_auth.get_album(sample_album, track_format="model")
+        assert isinstance(model, Album) and model.tracks[0].track_number == 1
         album = yt.get_album("MPREb_BQZvl3BFGay")
         assert len(album["tracks"]) == 7
         assert len(album["tracks"][0]["artists"]) == 1
@@ -183,6 +191,11 @@ class TestBrowsing:
         track = yt.get_track(sample_video)
         assert isinstance(track, CoreTrack)
 
+    def test_get_track_stand_in(self, stand_in):
+        yt = YTMusic(transport=FakeTransport({"player": stand_in("player")}))
+        track = yt.get_track("abc")
+        assert isinstance(track, CoreTrack) and track == CoreTrack(**templates.player("abc")["videoDetails"])
+
     def test_get_song_related_content(self, yt_oauth, sample_video):
         song = yt_oauth.get_watch_playlist(sample_video)
         song = yt_oauth.get_song_related(song["related"])
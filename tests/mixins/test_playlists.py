@@ -1,7 +1,21 @@
+import asyncio
+import json
 import time
+import tracemalloc
 
 import pytest
 
+from ytmusicapi import YTMusic
+from ytmusicapi.columns import TrackColumns
+from ytmusicapi.models import AlbumRef, Playlist, Track
+from ytmusicapi.navigation import MENU_ENTRIES
+from ytmusicapi.parsers import playlists
+from ytmusicapi.parsers.playlists import parse_playlist_columns
+from ytmusicapi.records import TrackRecord
+from ytmusicapi.testing import templates
+from ytmusicapi.tracks import LazyTrack
+from ytmusicapi.transport import FakeTransport
+
 
 class TestPlaylists:
     def test_get_playlist_foreign(self, yt, yt_auth, yt_oauth):
@@ -82,3 +96,171 @@ class TestPlaylists:
         assert len(outer["artists"]) == 1
         assert outer["artists"][0]["name"] == "Joey Gx"
         assert outer["artists"][0]["id"] is None
+
+
+class TestBulk:
+    def test_get_playlists(self, stand_in):
+        def handler(request):
+            if request.body["browseId"] == "VLPLbroken":
+                return {}
+            return stand_in("browse")(request)
+
+        fake = FakeTransport({"browse": handler})
+        ids = [f"PL{index}" for index in range(10)] + ["PLbroken"]
+        results = {result.id: result for result in YTMusic(transport=fake).get_playlists(ids, limit=None)}
+        assert set(results) == set(ids)
+        assert results["PLbroken"].result is None and isinstance(results["PLbroken"].error, KeyError)
+        assert all(len(results[playlist_id].result["tracks"]) == 250 for playlist_id in ids[:-1])
+        # the visitor id was requested once before the threads were started
+        assert sum(request.method == "GET" for request in fake.requests) == 1
+
+    def test_get_playlists_async(self, server):
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("greenlet")
+        from ytmusicapi import AsyncYTMusic
+
+        def handler(request):
+            if request.method == "GET":
+                return httpx.Response(200, text=templates.HOMEPAGE)
+            body = json.loads(request.content)
+            if body["browseId"] == "VLPLbroken":
+                return httpx.Response(404, json=templates.error(404, "Requested entity was not found."))
+            query = dict(request.url.params)
+            return httpx.Response(200, json=server.respond("browse", query, body)[1])
+
+        async def collect():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncYTMusic(client=client) as yt:
+                return [
+                    result async for result in yt.get_playlists(["PL1", "PLbroken", "PL2"], max_workers=2)
+                ]
+
+        results = {result.id: result for result in asyncio.run(collect())}
+        assert len(results["PL1"].result["tracks"]) == 100
+        assert "HTTP 404" in str(results["PLbroken"].error)
+
+
+class TestFields:
+    def test_projection(self, fake):
+        yt = YTMusic(transport=fake)
+        tracks = yt.get_playlist("PLstandin", fields=["video_id", "set_video_id", "duration_s"])["tracks"]
+        full = yt.get_playlist("PLstandin")["tracks"]
+        assert tracks == [
+            {key: track[key] for key in ("video_id", "set_video_id", "duration_s")} for track in full
+        ]
+        assert next(yt.iter_playlist_tracks("PLstandin", fields=["name"])) == {"name": "Song 0"}
+
+    def test_menu_entries(self):
+        row = templates.track("PLhistory", 0)
+        menu = row["musicResponsiveListItemRenderer"]["menu"]["menuRenderer"]
+        token = {"feedbackEndpoint": {"feedbackToken": "remove-token"}}
+        menu["items"].append({"menuServiceItemRenderer": {"serviceEndpoint": token}})
+        assert playlists.parse_playlist_items([row], MENU_ENTRIES)[0]["feedback_token"] == "remove-token"
+        lazy = playlists.parse_playlist_items([row], MENU_ENTRIES, track_format="lazy")
+        assert lazy[0]["feedback_token"] == "remove-token"
+        projected = playlists.parse_playlist_items([row], MENU_ENTRIES, fields=frozenset({"feedback_token"}))
+        assert projected == [{"feedback_token": "remove-token"}]
+
+    def test_invalid(self, fake):
+        with pytest.raises(Exception, match="Invalid fields album_art"):
+            YTMusic(transport=fake).get_playlist("PLstandin", fields=["video_id", "album_art"])
+        assert not fake.requests
+
+
+class TestTrackFormats:
+    def test_lazy(self, fake, monkeypatch):
+        yt = YTMusic(transport=fake)
+        expected = yt.get_playlist("PLstandin", limit=None)["tracks"]
+        artists = []
+        parse_artists = playlists.parse_pl_song_artists
+        monkeypatch.setattr(
+            playlists,
+            "parse_pl_song_artists",
+            lambda *args, **kwargs: artists.append(1) or parse_artists(*args, **kwargs),
+        )
+        tracks = yt.get_playlist("PLstandin", limit=None, track_format="lazy")["tracks"]
+        assert [track["video_id"] for track in tracks] == [track["video_id"] for track in expected]
+        assert not artists
+        assert tracks[5]["artists"] == expected[5]["artists"] and len(artists) == 1
+        assert tracks == expected
+        assert isinstance(tracks[0], LazyTrack) and dict(tracks[0]) == expected[0]
+
+        lazy = yt.get_playlist("PLstandin", fields=["video_id", "name"], track_format="lazy")["tracks"]
+        assert dict(lazy[0]) == {"video_id": expected[0]["video_id"], "name": "Song 0"}
+        with pytest.raises(KeyError):
+            lazy[0]["artists"]
+        with pytest.raises(Exception, match="Invalid track_format"):
+            yt.get_playlist("PLstandin", track_format="rows")
+
+        # keys the track doesn't have are parsed once, and left out when all keys are parsed
+        parsed = []
+        track = LazyTrack(
+            lambda keys: parsed.append(keys) or {"name": "Song 0"}, frozenset({"name", "album"})
+        )
+        for _ in range(2):
+            assert track.get("album") is None
+            with pytest.raises(KeyError):
+                track["album"]
+        assert parsed == [frozenset({"album"})]
+        assert track["name"] == "Song 0" and dict(track) == {"name": "Song 0"}
+
+    def test_records(self, fake):
+        yt = YTMusic(transport=fake)
+        expected = yt.get_playlist("PLstandin", limit=None)["tracks"]
+        tracks = yt.get_playlist("PLstandin", limit=None, track_format="record")["tracks"]
+        assert all(isinstance(track, TrackRecord) for track in tracks)
+        assert [track.as_dict() for track in tracks] == expected
+        assert tracks[3].artists[0].name == expected[3]["artists"][0]["name"]
+        assert TrackRecord.from_dict(expected[3]) == tracks[3]
+
+        def allocated(build):
+            tracemalloc.start()
+            result = build()  # noqa: F841
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return size
+
+        assert allocated(lambda: [track.as_dict() for track in tracks]) > 2 * allocated(
+            lambda: [TrackRecord.from_dict(track) for track in expected]
+        )
+
+    def test_columns(self, fake, monkeypatch):
+        yt = YTMusic(transport=fake)
+        expected = yt.get_playlist("PLstandin", limit=None)["tracks"]
+        merged = []
+        extend = TrackColumns.extend
+        monkeypatch.setattr(
+            TrackColumns, "extend", lambda self, other: merged.append(len(other)) or extend(self, other)
+        )
+        columns = yt.get_playlist("PLstandin", limit=None, track_format="columns")["tracks"]
+        assert merged == [100, 100, 50]  # pages are parsed to columns one at a time
+        monkeypatch.undo()
+        assert isinstance(columns, TrackColumns) and len(columns) == len(expected) == 250
+        for key, values in columns.to_pydict().items():
+            assert values == [track.get(key) for track in expected], key
+        sliced = columns[95:105].to_pydict()
+        assert sliced == {key: values[95:105] for key, values in columns.to_pydict().items()}
+        assert columns.buffers["duration_s"][7] == expected[7]["duration_s"]
+        assert columns.buffers["available"][7] is expected[7]["available"]
+
+        first = yt.get_playlist(
+            "PLstandin", limit=120, fields=["video_id", "artists"], track_format="columns"
+        )
+        tracks = first["tracks"]
+        assert tracks.fields == {"video_id", "artists"} and len(tracks) == 120
+        tracks.extend(parse_playlist_columns([], fields=tracks.fields))
+        tracks.extend(tracks)
+        assert tracks.to_pydict()["artists"] == [track["artists"] for track in expected[:120]] * 2
+        with pytest.raises(Exception, match="Invalid track_format"):
+            yt.iter_playlist_tracks("PLstandin", track_format="columns")
+
+    def test_models(self, fake):
+        yt = YTMusic(transport=fake)
+        playlist = yt.get_playlist("PLstandin", limit=None)
+        model = yt.get_playlist("PLstandin", limit=None, track_format="model")
+        assert isinstance(model, Playlist) and model.model_dump(exclude_unset=True) == playlist
+        tracks = model.tracks
+        assert all(isinstance(track, Track) for track in tracks)
+        assert [track.model_dump(exclude_unset=True) for track in tracks] == playlist["tracks"]
+        assert tracks[3].artists[0].name == playlist["tracks"][3]["artists"][0]["name"]
+        assert isinstance(tracks[3].album, AlbumRef) and tracks[3].model_extra == {}
@@ -1,5 +1,8 @@
 import pytest
 
+from ytmusicapi import YTMusic
+from ytmusicapi.models import SearchResult
+
 
 class TestSearch:
     def test_search_exceptions(self, yt_auth):
@@ -102,3 +105,16 @@ class TestSearch:
         assert "video_id" not in results[0]
         assert len(results[0]["artists"]) == 1
         assert results[0]["artists"][0] == {"id": "UCykKxVGTgKUm3L4vWqrO6eQ", "name": "The Knocks"}
+
+    def test_search_fields(self, fake):
+        yt = YTMusic(transport=fake)
+        results = yt.search("oasis", only="songs", limit=5, fields=("video_id", "result_type"))
+        assert [set(result) for result in results] == [{"video_id", "result_type"}] * 5
+
+    def test_search_models(self, fake):
+        yt = YTMusic(transport=fake)
+        results = yt.search("standin", result_format="model")
+        assert all(isinstance(result, SearchResult) for result in results)
+        assert [result.model_dump(exclude_unset=True) for result in results] == yt.search("standin")
+        with pytest.raises(Exception, match="Invalid result_format"):
+            yt.search("standin", result_format="record")
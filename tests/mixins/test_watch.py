@@ -1,3 +1,9 @@
+from ytmusicapi import YTMusic
+from ytmusicapi.parsers import watch
+from ytmusicapi.testing import templates
+from ytmusicapi.transport import FakeTransport
+
+
 class TestWatch:
     def test_get_watch_playlist(self, config, yt, yt_brand, yt_oauth):
         playlist = yt_oauth.get_watch_playlist(
@@ -14,3 +20,22 @@ class TestWatch:
         assert len(playlist["tracks"]) == config.getint("albums", "album_track_length")
         playlist = yt_brand.get_watch_playlist(playlist_id=config["playlists"]["own"], shuffle=True)
         assert len(playlist["tracks"]) == config.getint("playlists", "own_length")
+
+    def test_get_watch_playlist_fields(self, stand_in):
+        yt = YTMusic(transport=FakeTransport({"next": stand_in("next")}))
+        tracks = yt.get_watch_playlist("abc", fields=["video_id", "artists"])["tracks"]
+        assert tracks and all(set(track) == {"video_id", "artists"} for track in tracks)
+
+        song, video = templates.watch_track("song", 0, "RDAMVM"), templates.watch_track("video", 0, "RDAMVM")
+        wrapper = {
+            "playlistPanelVideoWrapperRenderer": {
+                "primaryRenderer": song,
+                "counterpart": [{"counterpartRenderer": video}],
+            }
+        }
+        complete = watch.parse_watch_playlist([wrapper])[0]["counterpart"]
+        assert complete == watch.parse_watch_track(video["playlistPanelVideoRenderer"])
+        projected = watch.parse_watch_playlist([wrapper], frozenset({"video_id", "counterpart"}))
+        assert projected == [
+            {"video_id": song["playlistPanelVideoRenderer"]["videoId"], "counterpart": complete}
+        ]
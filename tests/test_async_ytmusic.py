@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("greenlet")
+
+from ytmusicapi import AsyncYTMusic  # noqa: E402
+from ytmusicapi.helpers import YTM_DOMAIN  # noqa: E402
+
+HOMEPAGE = 'ytcfg.set({"VISITOR_DATA": "visitor"}); "jsUrl":"/s/player/abc/base.js"'
+LYRICS = {
+    "contents": {
+        "sectionListRenderer": {
+            "contents": [
+                {
+                    "musicDescriptionShelfRenderer": {
+                        "description": {"runs": [{"text": "la la la"}]},
+                        "footer": {"runs": [{"text": "Source: LyricFind"}]},
+                    }
+                }
+            ]
+        }
+    }
+}
+
+
+def handler(request):
+    if request.method == "GET" and str(request.url) == YTM_DOMAIN:
+        return httpx.Response(200, text=HOMEPAGE)
+    if request.method == "GET" and request.url.path.endswith("base.js"):
+        return httpx.Response(200, text="var x={signatureTimestamp:19834}")
+    if request.url.path.endswith("/browse"):
+        body = json.loads(request.content)
+        assert body["context"]["client"]["clientName"] == "WEB_REMIX"
+        return httpx.Response(200, json=LYRICS)
+    return httpx.Response(404, json={"error": {"message": "not found"}})
+
+
+@pytest.fixture(name="yt_async")
+def fixture_yt_async() -> AsyncYTMusic:
+    return AsyncYTMusic(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+class TestAsyncYTMusic:
+    def test_concurrent_requests(self, yt_async):
+        async def run():
+            async with yt_async:
+                return await asyncio.gather(*(yt_async.get_lyrics("MPLYt_x") for _ in range(20)))
+
+        results = asyncio.run(run())
+        assert len(results) == 20
+        assert all(result["lyrics"] == "la la la" for result in results)
+
+    def test_nested_method_calls(self, yt_async):
+        # get_signature_timestamp calls get_basejs_url internally
+        assert asyncio.run(yt_async.get_signature_timestamp()) == 19834
+
+    def test_signature_timestamp(self):
+        timestamps = []
+        scripts = []
+
+        async def player(request):
+            if request.url.path.endswith("/player"):
+                body = json.loads(request.content)
+                timestamps.append(body["playbackContext"]["contentPlaybackContext"]["signatureTimestamp"])
+                return httpx.Response(200, json={})
+            if request.url.path.endswith("base.js"):
+                scripts.append(request.url)
+                await asyncio.sleep(0.05)
+            return handler(request)
+
+        async def run():
+            async with AsyncYTMusic(client=httpx.AsyncClient(transport=httpx.MockTransport(player))) as yt:
+                await asyncio.gather(*(yt.get_song("abc") for _ in range(5)))
+                await yt.get_song("abc")
+
+        asyncio.run(run())
+        assert timestamps == [19834] * 6
+        assert len(scripts) == 1  # concurrent calls wait for the same download
+
+    def test_single_homepage_download(self):
+        homepages = []
+
+        async def slow_homepage(request):
+            if request.method == "GET" and str(request.url) == YTM_DOMAIN:
+                homepages.append(request.url)
+                await asyncio.sleep(0.05)
+            return handler(request)
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(slow_homepage))
+            async with AsyncYTMusic(client=client) as yt:
+                results = await asyncio.gather(*(yt.get_lyrics("MPLYt_x") for _ in range(5)))
+                return results, yt.headers["X-Goog-Visitor-Id"]
+
+        results, visitor_id = asyncio.run(run())
+        assert [result["lyrics"] for result in results] == ["la la la"] * 5
+        assert visitor_id == "visitor"
+        assert len(homepages) == 1
+
+    def test_errors_propagate(self, yt_async):
+        with pytest.raises(Exception, match="HTTP 404"):
+            asyncio.run(yt_async.get_search_suggestions("faded"))
@@ -0,0 +1,145 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ytmusicapi import YTMusic, bootstrap
+from ytmusicapi.helpers import YTM_DOMAIN
+from ytmusicapi.mixins._utils import get_datestamp
+from ytmusicapi.transport import FakeTransport
+
+from .test_transport import LYRICS
+
+HOMEPAGE = 'ytcfg.set({"VISITOR_DATA": "visitor"}); "jsUrl":"/s/player/abc/base.js"'
+
+
+def homepage_requests(fake):
+    return [request for request in fake.requests if request.url == YTM_DOMAIN]
+
+
+class TestBootstrap:
+    def test_shared_fetch(self):
+        fake = FakeTransport({YTM_DOMAIN: HOMEPAGE, "browse": LYRICS})
+        for _ in range(3):
+            yt = YTMusic(transport=fake)
+            yt.get_lyrics("MPLYt_x")
+            yt.get_lyrics("MPLYt_x")
+            assert yt.headers["X-Goog-Visitor-Id"] == "visitor"
+            assert yt.get_basejs_url() == YTM_DOMAIN + "/s/player/abc/base.js"
+        assert len(homepage_requests(fake)) == 1
+
+    def test_ttl(self, monkeypatch):
+        fake = FakeTransport({YTM_DOMAIN: HOMEPAGE})
+        cache = bootstrap.BootstrapCache(ttl=60)
+        cache.get(fake.get)
+        entry = cache.get(fake.get)
+        monkeypatch.setattr(bootstrap.time, "time", lambda: entry.fetched + 60)
+        cache.get(fake.get)
+        assert len(homepage_requests(fake)) == 2
+
+    def test_disk(self, tmp_path):
+        fake = FakeTransport({YTM_DOMAIN: HOMEPAGE})
+        bootstrap.BootstrapCache(path=tmp_path / "bootstrap.json").get(fake.get)
+        entry = bootstrap.BootstrapCache(path=tmp_path / "bootstrap.json").get(fake.get)
+        assert entry.visitor_id == "visitor"
+        assert entry.ytcfg == {"VISITOR_DATA": "visitor"}
+        assert len(homepage_requests(fake)) == 1
+
+    def test_error_not_cached(self):
+        fake = FakeTransport()
+        fake.add(YTM_DOMAIN, FakeTransport().get("https://unmatched"))
+        cache = bootstrap.BootstrapCache()
+        assert cache.get(fake.get).visitor_id == ""
+        cache.get(fake.get)
+        assert len(homepage_requests(fake)) == 2
+
+    def test_missing_visitor_id_not_cached(self):
+        # i.e. a consent page served with status 200
+        fake = FakeTransport({YTM_DOMAIN: '"jsUrl":"/s/player/abc/base.js"'})
+        fake.add(YTM_DOMAIN, HOMEPAGE)
+        cache = bootstrap.BootstrapCache()
+        assert cache.get(fake.get).visitor_id == ""
+        assert cache.get(fake.get).visitor_id == "visitor"
+        cache.get(fake.get)
+        assert len(homepage_requests(fake)) == 2
+
+    def test_missing_js_url(self):
+        yt = YTMusic(transport=FakeTransport())
+        with pytest.raises(Exception, match="base.js"):
+            yt.get_basejs_url()
+
+
+def player_timestamps(fake):
+    return [
+        request.body["playbackContext"]["contentPlaybackContext"]["signatureTimestamp"]
+        for request in fake.requests
+        if request.url.split("?")[0].endswith("/player")
+    ]
+
+
+def wait_for_background(cache):
+    for thread in threading.enumerate():
+        if thread.name == "ytmusicapi-basejs":
+            thread.join()
+    assert not cache._pending
+
+
+class TestSignatureTimestamp:
+    def test_cached_per_url(self):
+        fake = FakeTransport({YTM_DOMAIN: HOMEPAGE, "base.js": "signatureTimestamp:19834"})
+        yt = YTMusic(transport=fake)
+        assert yt.get_signature_timestamp() == 19834
+        assert YTMusic(transport=fake).get_signature_timestamp() == 19834
+        assert len([request for request in fake.requests if request.url.endswith("base.js")]) == 1
+
+    def test_get_song(self):
+        fake = FakeTransport({YTM_DOMAIN: HOMEPAGE, "base.js": "signatureTimestamp:19834", "player": {}})
+        yt = YTMusic(transport=fake)
+        yt.get_song("abc")  # base.js is downloaded before the first request
+        yt.get_song("abc")
+        yt.get_song("abc", signature_timestamp=1)
+        assert player_timestamps(fake) == [19834, 19834, 1]
+        assert len([request for request in fake.requests if request.url.endswith("base.js")]) == 1
+
+    def test_get_song_without_timestamp(self):
+        fake = FakeTransport({YTM_DOMAIN: HOMEPAGE, "base.js": "no timestamp", "player": {}})
+        YTMusic(transport=fake).get_song("abc")
+        assert player_timestamps(fake) == [get_datestamp() - 1]
+
+    def test_single_download(self):
+        def base_js(request):
+            time.sleep(0.2)
+            return "signatureTimestamp:19834"
+
+        fake = FakeTransport({"base.js": base_js})
+        cache = bootstrap.BootstrapCache()
+        with ThreadPoolExecutor(4) as executor:
+            timestamps = list(
+                executor.map(lambda _: cache.signature_timestamp("/base.js", fake.get), range(4))
+            )
+        assert timestamps == [19834] * 4
+        assert len(fake.requests) == 1
+
+    def test_new_release(self, monkeypatch):
+        fake = FakeTransport({"base.js": "signatureTimestamp:1"})
+        fake.add(YTM_DOMAIN, HOMEPAGE)
+        fake.add(YTM_DOMAIN, HOMEPAGE.replace("abc", "def"))
+        fake.add(YTM_DOMAIN + "/s/player/def/base.js", "signatureTimestamp:2")
+        cache = bootstrap.BootstrapCache(ttl=60)
+        assert cache.signature_timestamp(cache.get(fake.get).js_url, fake.get) == 1
+
+        fetched = cache.get(fake.get).fetched
+        monkeypatch.setattr(bootstrap.time, "time", lambda: fetched + 60)
+        js_url = cache.get(fake.get).js_url
+        wait_for_background(cache)
+        fake.reset()
+        assert cache.signature_timestamp(js_url, fake.get) == 2
+        assert not fake.requests
+
+    def test_disk(self, tmp_path):
+        fake = FakeTransport({"base.js": "signatureTimestamp:1"})
+        bootstrap.BootstrapCache(path=tmp_path / "bootstrap.json").signature_timestamp("/base.js", fake.get)
+        cache = bootstrap.BootstrapCache(path=tmp_path / "bootstrap.json")
+        assert cache.signature_timestamp("/base.js", fake.get) == 1
+        assert len(fake.requests) == 1
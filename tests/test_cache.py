@@ -0,0 +1,147 @@
+import multiprocessing
+
+import pytest
+
+from ytmusicapi import YTMusic
+from ytmusicapi.cache import MemoryCache, SQLiteCache, base
+from ytmusicapi.transport import FakeTransport
+
+from .test_transport import LYRICS
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    current = [1000.0]
+    monkeypatch.setattr(base, "now", lambda: current[0])
+    return current
+
+
+def fill(path, worker):
+    cache = SQLiteCache(path)
+    for i in range(50):
+        cache.set(f"{worker}-{i}", b"value" * 100, ttl=60, tags=[f"MPRE{worker}"])
+
+
+def browse_requests(fake):
+    return [request for request in fake.requests if request.url.split("?")[0].endswith("/browse")]
+
+
+class TestCache:
+    def test_cached_browse(self):
+        fake = FakeTransport({"browse": LYRICS})
+        yt = YTMusic(transport=fake, cache=MemoryCache())
+        assert yt.get_lyrics("MPLYt_x")["lyrics"] == "la la la"
+        assert yt.get_lyrics("MPLYt_x")["lyrics"] == "la la la"
+        assert len(browse_requests(fake)) == 1
+        assert (yt.cache.stats.hits, yt.cache.stats.misses) == (1, 1)
+
+        yt.get_lyrics("MPLYt_y")
+        assert len(browse_requests(fake)) == 2
+
+    def test_key_context(self):
+        cache = MemoryCache()
+        fake = FakeTransport({"browse": LYRICS})
+        YTMusic(transport=fake, cache=cache).get_lyrics("MPLYt_x")
+        YTMusic(transport=fake, cache=cache, language="de").get_lyrics("MPLYt_x")
+        YTMusic(transport=fake, cache=cache, location="DE").get_lyrics("MPLYt_x")
+        YTMusic(transport=fake, cache=cache).get_lyrics("MPLYt_x")
+        assert len(browse_requests(fake)) == 3
+
+    def test_uncached_endpoint(self):
+        fake = FakeTransport({"browse": LYRICS})
+        yt = YTMusic(transport=fake, cache=MemoryCache(ttls={"browse:MPLY": 0}))
+        yt.get_lyrics("MPLYt_x")
+        yt.get_lyrics("MPLYt_x")
+        assert len(browse_requests(fake)) == 2
+        assert len(yt.cache) == 0
+
+    def test_expiry(self, clock):
+        cache = MemoryCache()
+        cache.set("a", b"1", ttl=10)
+        assert cache.get("a") == b"1"
+        clock[0] += 10
+        assert cache.get("a") is None
+        assert cache.size == 0
+
+    def test_lru_eviction(self):
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", b"1234", ttl=60)
+        cache.set("b", b"1234", ttl=60)
+        cache.get("a")
+        cache.set("c", b"1234", ttl=60)
+        assert cache.get("b") is None
+        assert cache.get("a") == cache.get("c") == b"1234"
+        assert cache.size == 8
+        assert cache.stats.evictions == 1
+        cache.set("d", b"x" * 11, ttl=60)
+        assert cache.get("d") is None
+
+    def test_write_invalidates(self):
+        fake = FakeTransport({"browse": LYRICS, "like/like": {}})
+        yt = YTMusic(transport=fake, cache=MemoryCache(ttls={"browse:VL": 60}))
+        yt.cache.set("unrelated", b"{}", ttl=60, tags=["MPLYt_x"])
+        yt._send_request("browse", {"browseId": "VLPL1"})
+        assert len(yt.cache) == 2
+
+        yt._send_request("like/like", {"target": {"playlistId": "PL1"}})
+        assert len(yt.cache) == 1
+        assert yt.cache.stats.invalidations == 1
+        assert [request.url.split("?")[0].rsplit("/", 1)[-1] for request in fake.requests][-1] == "like"
+
+
+class TestSQLiteCache:
+    def test_warm_start(self, tmp_path):
+        fake = FakeTransport({"browse": LYRICS})
+        YTMusic(transport=fake, cache=SQLiteCache(tmp_path / "cache.db")).get_lyrics("MPLYt_x")
+        yt = YTMusic(transport=fake, cache=SQLiteCache(tmp_path / "cache.db"))
+        assert yt.get_lyrics("MPLYt_x")["lyrics"] == "la la la"
+        assert len(browse_requests(fake)) == 1
+        assert yt.cache.stats.hits == 1
+
+    def test_compression(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.db")
+        cache.set("a", b"x" * 10000, ttl=60)
+        assert cache.size < 1000
+        assert cache.get("a") == b"x" * 10000
+
+    def test_expiry(self, tmp_path, clock):
+        cache = SQLiteCache(tmp_path / "cache.db")
+        cache.set("a", b"1", ttl=10)
+        cache.set("b", b"1", ttl=20)
+        clock[0] += 10
+        assert cache.get("a") is None
+        assert cache.purge() == 1
+        assert len(cache) == 1
+
+    def test_size_cap(self, tmp_path, clock):
+        cache = SQLiteCache(tmp_path / "cache.db", max_bytes=200, compression_level=0)
+        for key in "abc":
+            cache.set(key, b"x" * 80, ttl=1000)
+            clock[0] += 100
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+        assert cache.size <= 200
+        assert cache.stats.evictions == 1
+
+    def test_invalidate(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.db")
+        cache.set("a", b"1", ttl=60, tags=["VLPL1"])
+        cache.set("b", b"1", ttl=60, tags=["FEmusic_liked_albums"])
+        cache.set("c", b"1", ttl=60, tags=["MPREb_1"])
+        cache.invalidate(["VLPL1"], ["FEmusic_"])
+        assert len(cache) == 1
+        assert cache.stats.invalidations == 2
+
+    def test_processes(self, tmp_path):
+        path = tmp_path / "cache.db"
+        SQLiteCache(path)
+        processes = [multiprocessing.Process(target=fill, args=(path, worker)) for worker in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            assert process.exitcode == 0
+        cache = SQLiteCache(path)
+        assert len(cache) == 200
+        cache.invalidate(prefixes=["MPRE1"])
+        assert len(cache) == 150
@@ -0,0 +1,78 @@
+import pytest
+
+from ytmusicapi.columns import TRACK_COLUMNS, TrackColumns
+from ytmusicapi.parsers.playlists import parse_playlist_columns
+from ytmusicapi.testing import templates
+
+UNKNOWN = {
+    "video_id": "unknown",
+    "set_video_id": None,
+    "name": "Unknown",
+    "artists": [],
+    "album": None,
+    "track_number": None,
+    "like_status": None,
+    "in_library": None,
+    "available": False,
+    "explicit": True,
+    "video_type": None,
+    "duration_s": None,
+}
+
+
+@pytest.fixture
+def columns() -> TrackColumns:
+    columns = parse_playlist_columns([templates.track("PLcolumns", i) for i in range(20)])
+    # tracks with unknown values and values the stand-in rows don't have
+    for track in (UNKNOWN, {**UNKNOWN, "in_library": True, "track_number": 4, "duration_s": 0}):
+        for field in TRACK_COLUMNS:
+            columns.appender(field)(track[field])
+        columns.rows += 1
+    return columns
+
+
+class TestColumns:
+    def test_to_arrow(self, columns):
+        pa = pytest.importorskip("pyarrow")
+        expected = columns.to_pydict()
+        table = columns.to_arrow()
+        assert table.num_rows == len(columns) == 22
+        assert table.column_names == list(expected)
+        assert table.schema.field("artists").type == pa.large_list(
+            pa.struct([("name", pa.string()), ("id", pa.string())])
+        )
+        for field in ("track_number", "duration_s"):
+            assert table.schema.field(field).type == pa.int64()
+        for field in ("in_library", "available", "explicit"):
+            assert table.schema.field(field).type == pa.bool_()
+        for field in ("video_id", "name", "like_status", "video_type"):
+            assert table.schema.field(field).type == pa.string()
+        for field, values in expected.items():
+            column = table.column(field)
+            assert column.is_null().to_pylist() == [value is None for value in values], field
+        assert table.to_pydict() == expected
+        assert expected["in_library"][-2:] == [None, True] and expected["track_number"][-2:] == [None, 4]
+
+    def test_to_numpy(self, columns):
+        np = pytest.importorskip("numpy")
+        expected = columns.to_pydict()
+        arrays = columns.to_numpy()
+        assert list(arrays) == list(columns.buffers)
+        assert {column: len(values) for column, values in arrays.items()} == {
+            column: len(buffer) for column, buffer in columns.buffers.items()
+        }
+        assert len(arrays["video_id"]) == len(columns) and len(arrays["artist_offsets"]) == len(columns) + 1
+        assert arrays["duration_s"].dtype == np.int64 and arrays["in_library"].dtype == np.int8
+        assert arrays["available"].dtype == arrays["explicit"].dtype == np.bool_
+        assert arrays["video_id"].dtype == object
+        for column in ("track_number", "duration_s", "in_library"):
+            assert (arrays[column] < 0).tolist() == [value is None for value in expected[column]]
+        assert arrays["duration_s"].tolist() == [
+            -1 if value is None else value for value in expected["duration_s"]
+        ]
+        for column in ("available", "explicit", "video_id", "name"):
+            assert arrays[column].tolist() == expected[column]
+        offsets = arrays["artist_offsets"]
+        assert [
+            list(arrays["artist_name"][offsets[row] : offsets[row + 1]]) for row in range(len(columns))
+        ] == [[artist["name"] for artist in artists] for artists in expected["artists"]]
@@ -0,0 +1,276 @@
+import asyncio
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ytmusicapi import YTMusic
+from ytmusicapi.continuations import (
+    parse_limited,
+    resend_request_until_parsed_response_is_valid,
+    validate_response,
+)
+from ytmusicapi.metrics import ValidationStats
+from ytmusicapi.navigation import SINGLE_COLUMN_SECTION_LIST_ITEM, nav
+from ytmusicapi.testing import templates
+from ytmusicapi.transport import FakeTransport
+
+
+class TestIterators:
+    def test_playlist_tracks(self, fake):
+        yt = YTMusic(transport=fake)
+        tracks = list(yt.iter_playlist_tracks("PLstandin"))
+        assert len(tracks) == 250
+        assert tracks == yt.get_playlist("PLstandin", limit=None)["tracks"]
+
+    def test_playlist_tracks_lazy(self, fake):
+        tracks = YTMusic(transport=fake).iter_playlist_tracks("PLstandin")
+        browsed = lambda: sum("/browse" in request.url for request in fake.requests)
+        assert browsed() == 0
+        assert len(list(itertools.islice(tracks, 100))) == 100
+        assert browsed() == 1
+        next(tracks)
+        assert browsed() == 2
+
+    def test_search(self, fake):
+        yt = YTMusic(transport=fake)
+        results = list(itertools.islice(yt.iter_search("oasis", only="songs"), 50))
+        assert results == yt.search("oasis", only="songs", limit=50)[:50]
+        assert len(list(yt.iter_search("oasis", only="songs"))) == 250
+
+    def test_search_invalid_filter(self, fake):
+        with pytest.raises(Exception, match="Invalid filter"):
+            next(YTMusic(transport=fake).iter_search("oasis", only="tracks"))
+
+    def test_playlist_cursor(self, fake):
+        yt = YTMusic(transport=fake)
+        expected = list(yt.iter_playlist_tracks("PLstandin"))
+        for position in [0, 50, 100, 150, 249]:
+            tracks = yt.iter_playlist_tracks("PLstandin")
+            consumed = list(itertools.islice(tracks, position))
+            resumed = list(yt.iter_playlist_tracks("PLstandin", cursor=tracks.cursor))
+            assert consumed + resumed == expected
+        list(tracks)
+        assert tracks.cursor is None
+
+    def test_get_playlist_cursor(self, fake):
+        yt = YTMusic(transport=fake)
+        playlist = yt.get_playlist("PLstandin", limit=200)
+        assert len(playlist["tracks"]) == 200
+        fake.reset()
+        remaining = list(yt.iter_playlist_tracks("PLstandin", cursor=playlist["cursor"]))
+        assert len(remaining) == 50
+        assert remaining[0]["name"] == "Song 200"
+        assert len(fake.requests) == 1
+        assert yt.get_playlist("PLstandin", limit=None)["cursor"] is None
+
+        # the rest of a partially parsed page is parsed again
+        playlist = yt.get_playlist("PLstandin", limit=150)
+        remaining = list(yt.iter_playlist_tracks("PLstandin", cursor=playlist["cursor"]))
+        assert remaining[0]["name"] == "Song 150"
+        assert len(remaining) == 100
+
+    def test_cursor_mismatch(self, fake):
+        yt = YTMusic(transport=fake)
+        tracks = yt.iter_playlist_tracks("PLstandin")
+        next(tracks)
+        with pytest.raises(Exception, match="different results"):
+            yt.iter_playlist_tracks("PLother", cursor=tracks.cursor)
+        with pytest.raises(Exception, match="Invalid cursor"):
+            yt.iter_playlist_tracks("PLstandin", cursor="garbage")
+
+    def test_search_cursor(self, fake):
+        yt = YTMusic(transport=fake)
+        results = yt.iter_search("oasis", only="songs")
+        consumed = list(itertools.islice(results, 30))
+        resumed = list(yt.iter_search("oasis", only="songs", cursor=results.cursor))
+        assert consumed + resumed == list(yt.iter_search("oasis", only="songs"))
+
+    def test_exact_limit(self, fake):
+        yt = YTMusic(transport=fake)
+        assert len(yt.get_playlist("PLstandin", limit=101)["tracks"]) == 101
+        assert sum("/browse" in request.url for request in fake.requests) == 2
+        assert len(yt.get_playlist("PLstandin", limit=100)["tracks"]) == 100
+        assert sum("/browse" in request.url for request in fake.requests) == 3
+        assert len(yt.search("oasis", only="songs", limit=30)) == 30
+        assert len(yt.search("oasis", only="songs", limit=5)) == 5
+
+    def test_limit_with_skipped_rows(self, stand_in):
+        def browse(request):
+            response = stand_in("browse")(request)
+            shelf = response.get("continuationContents", {}).get("musicPlaylistShelfContinuation")
+            if shelf is None:
+                shelf = nav(response, SINGLE_COLUMN_SECTION_LIST_ITEM + ["musicPlaylistShelfRenderer"])
+            # the first rows of every page are no tracks and skipped by the parser
+            shelf["contents"][:10] = [{"musicNotifierShelfRenderer": {}}] * 10
+            return response
+
+        yt = YTMusic(transport=FakeTransport({"browse": browse}))
+        tracks = yt.get_playlist("PLstandin", limit=None)["tracks"]
+        assert len(tracks) == 220
+        for limit in (95, 185):
+            assert yt.get_playlist("PLstandin", limit=limit)["tracks"] == tracks[:limit]
+            assert yt.get_playlist("PLstandin", limit=limit, track_format="lazy")["tracks"] == tracks[:limit]
+            columns = yt.get_playlist("PLstandin", limit=limit, track_format="columns")["tracks"]
+            assert columns.to_pydict()["video_id"] == [track["video_id"] for track in tracks[:limit]]
+        consumed = yt.iter_playlist_tracks("PLstandin")
+        assert list(itertools.islice(consumed, 95)) == tracks[:95]
+        assert list(yt.iter_playlist_tracks("PLstandin", cursor=consumed.cursor)) == tracks[95:]
+
+    def test_parse_limited(self):
+        parsed = []
+
+        def parse_func(rows):
+            parsed.extend(rows)
+            return [row for row in rows if row % 2]
+
+        assert parse_limited(list(range(10)), parse_func, 3) == [1, 3, 5]
+        assert parsed == [0, 1, 2, 3, 4, 5]
+        assert parse_limited(list(range(10)), parse_func, None) == [1, 3, 5, 7, 9]
+
+    def test_validated_retries(self):
+        sizes = iter([10, 20, 25])
+        stats = ValidationStats()
+        parsed = resend_request_until_parsed_response_is_valid(
+            lambda params: next(sizes),
+            None,
+            lambda size: {"parsed": list(range(size))},
+            lambda parsed: validate_response(parsed, 25, 100, 0),
+            3,
+            stats=stats,
+        )
+        assert len(parsed["parsed"]) == 25
+        assert (stats.pages, stats.short, stats.retries, stats.unresolved) == (1, 2, 2, 0)
+
+    def test_hedged_retries(self):
+        def request(delays, sizes):
+            lock = threading.Lock()
+
+            def request_func(params):
+                with lock:
+                    delay, size = next(delays), next(sizes)
+                time.sleep(delay)
+                return size
+
+            return resend_request_until_parsed_response_is_valid(
+                request_func,
+                None,
+                lambda size: {"parsed": list(range(size))},
+                lambda parsed: validate_response(parsed, 25, 100, 0),
+                2,
+                executor,
+                0.05,
+                stats,
+            )
+
+        stats = ValidationStats()
+        with ThreadPoolExecutor(3) as executor:
+            # the first response is late, the duplicate wins the race
+            start = time.perf_counter()
+            assert len(request(iter([0.5, 0]), iter([10, 25]))["parsed"]) == 25
+            assert time.perf_counter() - start < 0.3
+            assert (stats.pages, stats.hedges, stats.short) == (1, 1, 0)
+
+            # short responses are retried immediately, the longest one is used
+            stats.reset()
+            assert len(request(iter([0, 0, 0]), iter([10, 20, 15]))["parsed"]) == 20
+            assert (stats.pages, stats.short, stats.retries, stats.unresolved) == (1, 3, 2, 1)
+
+    def test_hedged_concurrent(self):
+        yt = YTMusic(hedge_after=0.05)
+
+        def request(_):
+            delays = iter([0.5, 0])
+            lock = threading.Lock()
+
+            def request_func(params):
+                with lock:
+                    delay = next(delays)
+                time.sleep(delay)
+                return 25
+
+            return resend_request_until_parsed_response_is_valid(
+                request_func,
+                None,
+                lambda size: {"parsed": list(range(size))},
+                lambda parsed: validate_response(parsed, 25, 100, 0),
+                3,
+                yt._hedger,
+                yt.hedge_after,
+                yt.validation_stats,
+            )
+
+        # the duplicates of each caller don't queue behind the late requests of the others
+        with yt, ThreadPoolExecutor(6) as callers:
+            start = time.perf_counter()
+            assert [len(parsed["parsed"]) for parsed in callers.map(request, range(6))] == [25] * 6
+            assert time.perf_counter() - start < 0.4
+        assert (yt.validation_stats.pages, yt.validation_stats.hedges) == (6, 6)
+
+    def test_prefetch(self, stand_in, fake):
+        threads = []
+
+        def handler(request):
+            threads.append(threading.current_thread().name)
+            return stand_in("browse")(request)
+
+        expected = YTMusic(transport=fake).get_playlist("PLstandin", limit=None)["tracks"]
+        with YTMusic(transport=FakeTransport({"browse": handler}), prefetch=True) as yt:
+            assert yt.get_playlist("PLstandin", limit=None)["tracks"] == expected
+            # the first continuation is requested directly, the following one ahead of time
+            assert [name.startswith("ytmusicapi-prefetch") for name in threads] == [False, False, True]
+            assert len(list(yt.iter_playlist_tracks("PLstandin"))) == 250
+
+    def test_prefetch_concurrent(self, stand_in):
+        lock = threading.Lock()
+        active, overlap = set(), []
+
+        def handler(request):
+            name = threading.current_thread().name
+            if name.startswith("ytmusicapi-prefetch"):
+                with lock:
+                    active.add(name)
+                    overlap.append(len(active))
+                time.sleep(0.1)
+                with lock:
+                    active.discard(name)
+            return stand_in("browse")(request)
+
+        with YTMusic(transport=FakeTransport({"browse": handler}), prefetch=True) as yt:
+            yt._prepare_headers()
+            # the listings don't queue behind each other's prefetched pages
+            with ThreadPoolExecutor(3) as executor:
+                playlists = list(executor.map(lambda _: yt.get_playlist("PLstandin", limit=None), range(3)))
+            assert [len(playlist["tracks"]) for playlist in playlists] == [250] * 3
+            assert max(overlap) == 3
+
+    def test_async(self, server):
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("greenlet")
+        from ytmusicapi import AsyncYTMusic
+
+        def handler(request):
+            if request.method == "GET":
+                return httpx.Response(200, text=templates.HOMEPAGE)
+            query = dict(request.url.params)
+            return httpx.Response(200, json=server.respond("browse", query, json.loads(request.content))[1])
+
+        async def collect():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncYTMusic(client=client) as yt:
+                tracks = yt.iter_playlist_tracks("PLstandin")
+                consumed = []
+                async for track in tracks:
+                    consumed.append(track)
+                    if len(consumed) == 120:
+                        break
+                resumed = yt.iter_playlist_tracks("PLstandin", cursor=tracks.cursor)
+                return consumed, [track async for track in resumed]
+
+        consumed, resumed = asyncio.run(collect())
+        assert len(consumed) == 120
+        assert len(resumed) == 130
+        assert resumed[0]["name"] == "Song 120"
@@ -0,0 +1,61 @@
+import copy
+
+import pytest
+
+from ytmusicapi.navigation import SINGLE_COLUMN_TAB, TAB_CONTENT, Path, nav
+
+ROOT = {"contents": [{"title": {"runs": [{"text": "a"}, {"text": "b"}]}}, {"title": None}]}
+
+
+class TestPath:
+    @pytest.mark.parametrize(
+        "keys",
+        [
+            ["contents", 0, "title", "runs", -1, "text"],
+            ["contents", 1, "title"],
+            ["contents", 1, "title", "runs"],
+            ["contents", 2],
+            ["contents", -3],
+            ["contents", "title"],
+            ["contents", 0, "title", "runs", 0, "text", "missing"],
+            ["missing"],
+        ],
+    )
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_same_as_list(self, keys, sparse):
+        assert nav(ROOT, Path(keys, sparse), True) == nav(ROOT, keys, True)
+        try:
+            expected = nav(ROOT, keys)
+        except Exception as error:
+            with pytest.raises(type(error)):
+                nav(ROOT, Path(keys, sparse))
+        else:
+            assert nav(ROOT, Path(keys, sparse)) == expected
+
+    def test_concatenation(self):
+        assert type(SINGLE_COLUMN_TAB + ["x"]) is list
+        assert ["x"] + SINGLE_COLUMN_TAB == [
+            "x",
+            "contents",
+            "singleColumnBrowseResultsRenderer",
+            *TAB_CONTENT,
+        ]
+        assert nav(None, SINGLE_COLUMN_TAB, True) is None
+        with pytest.raises(TypeError):
+            Path(["contents", 0.5])
+
+    def test_immutable(self):
+        path = Path(["contents", 0], sparse=True)
+        for modify in [
+            lambda: path.append("title"),
+            lambda: path.extend(["title"]),
+            lambda: path.__setitem__(0, "items"),
+            lambda: path.pop(),
+        ]:
+            with pytest.raises(TypeError):
+                modify()
+        with pytest.raises(TypeError):
+            path += ["title"]
+        assert path == ["contents", 0]
+        assert copy.deepcopy(path) == path
+        assert nav(ROOT, copy.copy(path), True) == ROOT["contents"][0]
@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ytmusicapi.testing import InnerTubeServer
+
+CLIENT = """
+import json
+from ytmusicapi import YTMusic
+
+yt = YTMusic()
+playlist = yt.get_playlist("PLstandin", limit=None)
+print(json.dumps({
+    "tracks": len(playlist["tracks"]),
+    "track_count": playlist["track_count"],
+    "first": playlist["tracks"][0]["name"],
+    "search": len(yt.search("oasis", only="songs", limit=50)),
+    "watch": len(yt.get_watch_playlist("abc", limit=60)["tracks"]),
+    "song": yt.get_song("abc")["videoDetails"]["videoId"],
+    "suggestions": len(yt.get_search_suggestions("oas")),
+    "timestamp": yt.get_signature_timestamp(),
+}))
+"""
+
+
+def run_client(server, script=CLIENT):
+    env = {**os.environ, "YTM_DOMAIN": server.url, "YTM_BASE_API": server.base_api}
+    return subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=60)
+
+
+class TestServer:
+    def test_endpoints(self):
+        with InnerTubeServer(collection_size=250) as server:
+            result = run_client(server)
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout) == {
+            "tracks": 250,
+            "track_count": 250,
+            "first": "Song 0",
+            "search": 50,
+            "watch": 60,
+            "song": "abc",
+            "suggestions": 7,
+            "timestamp": 19999,
+        }
+        assert server.requests["browse"] == 3
+        assert server.requests["search"] == 3
+        assert server.requests["next"] == 3
+
+    def test_error_injection(self):
+        with InnerTubeServer(error_rate=1, error_statuses=[429]) as server:
+            result = run_client(server, "from ytmusicapi import YTMusic; YTMusic().get_playlist('PL1')")
+        assert result.returncode != 0
+        assert "Server returned HTTP 429" in result.stderr
+        assert server.errors[429] == 1
+
+    @pytest.mark.parametrize("endpoint", ["browse", "unknown"])
+    def test_not_found(self, endpoint):
+        server = InnerTubeServer()
+        assert server.respond(endpoint, {}, {"browseId": "FEmusic_home"})[0] == 404
+        server.httpd.server_close()
@@ -0,0 +1,127 @@
+import json
+import time
+
+import pytest
+
+from ytmusicapi import YTMusic
+from ytmusicapi.helpers import YTM_DOMAIN, json_loads
+from ytmusicapi.transport import FakeTransport, RecordingTransport, ReplayTransport, RequestsTransport
+
+LYRICS = {
+    "contents": {
+        "sectionListRenderer": {
+            "contents": [
+                {
+                    "musicDescriptionShelfRenderer": {
+                        "description": {"runs": [{"text": "la la la"}]},
+                        "footer": {"runs": [{"text": "Source: LyricFind"}]},
+                    }
+                }
+            ]
+        }
+    }
+}
+
+
+class TestTransport:
+    def test_default_transport(self):
+        assert isinstance(YTMusic()._transport, RequestsTransport)
+
+    def test_fake_transport(self):
+        fake = FakeTransport({"browse": LYRICS})
+        yt = YTMusic(transport=fake)
+        assert yt.get_lyrics("MPLYt_x")["lyrics"] == "la la la"
+        request = fake.requests[-1]
+        assert request.method == "POST"
+        assert request.body["browseId"] == "MPLYt_x"
+        assert request.body["context"]["client"]["hl"] == "en"
+
+    def test_fake_transport_sequence(self):
+        fake = FakeTransport()
+        fake.add("base.js", "signatureTimestamp:1")
+        fake.add("base.js", "signatureTimestamp:2")
+        yt = YTMusic(transport=fake)
+        timestamps = [yt._send_get_request(YTM_DOMAIN + "/base.js").text[-1] for _ in range(3)]
+        assert timestamps == ["1", "2", "2"]
+
+    def test_fake_transport_unmatched(self):
+        yt = YTMusic(transport=FakeTransport())
+        with pytest.raises(Exception, match="HTTP 404"):
+            yt.get_lyrics("MPLYt_x")
+
+    def test_httpx_transport(self):
+        httpx = pytest.importorskip("httpx")
+        from ytmusicapi.transport import HTTPXTransport
+
+        client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=LYRICS)))
+        yt = YTMusic(transport=HTTPXTransport(client))
+        assert yt.get_lyrics("MPLYt_x")["source"] == "Source: LyricFind"
+
+
+class TestCassette:
+    def test_record_replay(self, tmp_path):
+        cassette = tmp_path / "cassette.jsonl"
+        fake = FakeTransport({"browse": LYRICS})
+        fake.add(YTM_DOMAIN, 'ytcfg.set({"VISITOR_DATA": "visitor"}); "jsUrl":"/s/player/abc/base.js"')
+        fake.add("base.js", "signatureTimestamp:1")
+        yt = YTMusic(transport=RecordingTransport(cassette, fake))
+        assert yt.get_lyrics("MPLYt_x")["lyrics"] == "la la la"
+        assert yt.get_signature_timestamp() == 1
+
+        replay = ReplayTransport(cassette)
+        assert len(replay) == len(fake.requests)
+        yt = YTMusic(transport=replay)
+        assert yt.get_lyrics("MPLYt_x")["lyrics"] == "la la la"
+        assert yt.get_signature_timestamp() == 1
+        with pytest.raises(Exception, match="No recorded response"):
+            yt.get_lyrics("MPLYt_y")
+
+    def test_replay_latency(self, tmp_path):
+        cassette = tmp_path / "cassette.jsonl"
+        YTMusic(transport=RecordingTransport(cassette, FakeTransport({"browse": LYRICS}))).get_lyrics(
+            "MPLYt_x"
+        )
+        yt = YTMusic(transport=ReplayTransport(cassette, latency=0.05))
+        start = time.perf_counter()
+        yt.get_lyrics("MPLYt_x")
+        assert time.perf_counter() - start >= 0.05
+
+
+class TestDecode:
+    def test_json_loads(self):
+        assert json_loads(b'{"a": "\\u00e9", "b": "\\ud83d"}') == {"a": "é", "b": "\ud83d"}
+
+    def test_timings(self):
+        yt = YTMusic(transport=FakeTransport({"browse": LYRICS}))
+        yt.get_lyrics("MPLYt_x")
+        yt.get_lyrics("MPLYt_x")
+        assert yt.timings.requests == 2
+        assert yt.timings.network > 0 and yt.timings.decode > 0
+        assert yt.timings.bytes == 2 * len(json.dumps(LYRICS))
+        yt.timings.reset()
+        assert yt.timings.requests == 0
+
+    def test_album_browse_id(self):
+        page = "<script>initialData.push({data: '{\\x22browseId\\x22:\\x22MPREb_Ab-1\\x22}'})</script>"
+        yt = YTMusic(transport=FakeTransport({YTM_DOMAIN + "/playlist": page}))
+        assert yt.get_album_browse_id("OLAK5uy_x") == "MPREb_Ab-1"
+
+
+class TestCompression:
+    def test_threshold(self):
+        fake = FakeTransport({"browse/edit_playlist": {"status": "STATUS_SUCCEEDED"}})
+        yt = YTMusic(transport=fake, compression_threshold=1024)
+        actions = [{"action": "ACTION_ADD_VIDEO", "addedVideoId": f"video{i:06d}"} for i in range(100)]
+        yt._send_request("browse/edit_playlist", {"playlistId": "PL1", "actions": actions[:1]})
+        yt._send_request("browse/edit_playlist", {"playlistId": "PL1", "actions": actions})
+        small, large = fake.requests[-2:]
+        assert "content-encoding" not in small.headers
+        assert large.headers["content-encoding"] == "gzip"
+        assert large.headers["content-type"] == "application/json"
+        assert large.body["actions"] == actions
+
+    def test_disabled(self):
+        fake = FakeTransport({"browse": LYRICS})
+        yt = YTMusic(transport=fake, compression_threshold=None)
+        yt._send_request("browse", {"browseId": "MPLYt_x", "padding": "x" * 100000})
+        assert "content-encoding" not in fake.requests[-1].headers
@@ -1,6 +1,46 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from ytmusicapi import YTMusic
+from ytmusicapi.helpers import YTM_DOMAIN
+from ytmusicapi.parsers.search import get_search_result_type
+from ytmusicapi.transport import FakeTransport
+
+from .test_transport import LYRICS
 
 
 def test_ytmusic_context():
     with YTMusic(requests_session=False) as yt:
         assert isinstance(yt, YTMusic)
+
+
+def test_shared_between_threads():
+    def homepage(request):
+        time.sleep(0.05)  # let all threads reach the visitor id lookup
+        return 'ytcfg.set({"VISITOR_DATA": "visitor"});'
+
+    fake = FakeTransport({YTM_DOMAIN: homepage, "browse": LYRICS})
+    yt = YTMusic(transport=fake)
+    barrier = threading.Barrier(8)
+
+    def get_lyrics(_):
+        barrier.wait()
+        return yt.get_lyrics("MPLYt_x")
+
+    with ThreadPoolExecutor(8) as executor:
+        assert all(lyrics["lyrics"] == "la la la" for lyrics in executor.map(get_lyrics, range(8)))
+    assert len([request for request in fake.requests if request.url == YTM_DOMAIN]) == 1
+    assert all(request.headers["X-Goog-Visitor-Id"] == "visitor" for request in fake.requests[1:])
+    # every request gets its own headers
+    assert yt.headers is not yt.headers
+
+
+def test_languages():
+    german, english = YTMusic(language="de"), YTMusic(language="en")
+    assert YTMusic(language="de").parser is german.parser
+    assert german.parser.search_result_types["künstler"] == "artist"
+    assert get_search_result_type("Künstler", german.parser.search_result_types) == "artist"
+    assert get_search_result_type("Künstler", english.parser.search_result_types) == "album"
+    assert get_search_result_type("Artist", english.parser.search_result_types) == "artist"
+    assert german.parser.channel_shelves["alben"][0] == "albums"
@@ -12,4 +12,13 @@ except PackageNotFoundError:
 __copyright__ = "Copyright 2023 sigma67"
 __license__ = "MIT"
 __title__ = "ytmusicapi"
-__all__ = ["YTMusic", "setup_oauth", "setup"]
+__all__ = ["YTMusic", "AsyncYTMusic", "setup_oauth", "setup"]
+
+
+def __getattr__(name):
+    # AsyncYTMusic depends on the optional async extra, only import it on first use
+    if name == "AsyncYTMusic":
+        from ytmusicapi.async_ytmusic import AsyncYTMusic
+
+        return AsyncYTMusic
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,87 @@
+"""
+Run the synchronous mixin code inside greenlets so that its network calls can be awaited.
+
+Every mixin method ends up in :py:meth:`YTMusicBase._send_request` or
+:py:meth:`YTMusicBase._send_get_request`. Instead of duplicating all mixins as coroutines,
+an async client runs the unchanged method body in a child greenlet. Whenever the body needs
+I/O, :py:func:`await_only` hands the awaitable back to the event loop and resumes the body
+with the result. No OS threads are involved.
+"""
+
+import sys
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+import greenlet  # type: ignore[import-untyped]
+
+T = TypeVar("T")
+
+
+class _BridgeGreenlet(greenlet.greenlet):
+    """greenlet running a sync method body on behalf of the event loop greenlet ``driver``"""
+
+    def __init__(self, fn: Callable, driver: greenlet.greenlet):
+        super().__init__(fn, driver)
+        self.driver = driver
+
+
+def in_bridge() -> bool:
+    """True if called from sync code that was started by :py:func:`greenlet_spawn`"""
+    return isinstance(greenlet.getcurrent(), _BridgeGreenlet)
+
+
+def await_only(awaitable: Awaitable[T]) -> T:
+    """
+    Wait for an awaitable from synchronous code running inside :py:func:`greenlet_spawn`.
+
+    :param awaitable: coroutine or future to be awaited by the event loop
+    :return: result of the awaitable
+    """
+    current = greenlet.getcurrent()
+    if not isinstance(current, _BridgeGreenlet):
+        raise RuntimeError("await_only() can only be used inside of an async client call.")
+
+    return current.driver.switch(awaitable)
+
+
+async def greenlet_spawn(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run the synchronous callable ``fn`` until completion, awaiting every awaitable
+    it passes to :py:func:`await_only` on the running event loop.
+    """
+    context = _BridgeGreenlet(fn, greenlet.getcurrent())
+    result = context.switch(*args, **kwargs)
+    while not context.dead:
+        try:
+            value = await result
+        except BaseException:
+            result = context.throw(*sys.exc_info())
+        else:
+            result = context.switch(value)
+
+    return result
+
+
+class SpawnedIterator:
+    """
+    Async iterator advancing a synchronous iterator with :py:func:`greenlet_spawn`,
+    so that every request made while producing the next item is awaited.
+    Other attributes, like the ``cursor`` of paginated results, are read from the wrapped iterator.
+    """
+
+    def __init__(self, iterator: Iterator):
+        self._iterator = iterator
+
+    def __aiter__(self) -> "SpawnedIterator":
+        return self
+
+    async def __anext__(self) -> Any:
+        item = await greenlet_spawn(next, self._iterator, _exhausted)
+        if item is _exhausted:
+            raise StopAsyncIteration
+        return item
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._iterator, name)
+
+
+_exhausted = object()
@@ -0,0 +1,166 @@
+from functools import wraps
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Union
+
+try:
+    import httpx
+
+    from ytmusicapi._bridge import SpawnedIterator, greenlet_spawn, in_bridge
+    from ytmusicapi.transport.aio import AsyncHTTPXTransport
+except ImportError as err:  # pragma: no cover
+    raise ImportError(
+        "AsyncYTMusic requires the optional dependencies httpx and greenlet. "
+        "Install them with: pip install ytmusicapi[async]"
+    ) from err
+
+from ytmusicapi.auth import OAuthCredentials
+from ytmusicapi.bulk import BulkResult, gather_concurrently
+from ytmusicapi.cache import ResponseCache
+from ytmusicapi.mixins.browsing import BrowsingMixin
+from ytmusicapi.mixins.explore import ExploreMixin
+from ytmusicapi.mixins.library import LibraryMixin
+from ytmusicapi.mixins.playlists import PlaylistsMixin
+from ytmusicapi.mixins.search import SearchMixin
+from ytmusicapi.mixins.uploads import UploadsMixin
+from ytmusicapi.mixins.watch import WatchMixin
+from ytmusicapi.ytmusic import YTMusic
+
+
+def _mirror(method):
+    """Expose a sync mixin method as a coroutine running on the greenlet bridge."""
+
+    @wraps(method)
+    def _impl(self, *method_args, **method_kwargs):
+        # mixin methods calling each other (i.e. get_liked_songs -> get_playlist) stay synchronous
+        if in_bridge():
+            return method(self, *method_args, **method_kwargs)
+        if method.__name__.startswith("iter_"):  # iterators send their requests lazily
+            return SpawnedIterator(method(self, *method_args, **method_kwargs))
+        return greenlet_spawn(method, self, *method_args, **method_kwargs)
+
+    return _impl
+
+
+class AsyncYTMusic(YTMusic):
+    """
+    asyncio version of :py:class:`YTMusic` backed by a non-blocking ``httpx.AsyncClient``.
+
+    Every public method of :py:class:`YTMusic` is available with the same arguments and
+    return values, but must be awaited::
+
+        async with AsyncYTMusic() as ytmusic:
+            playlists = await asyncio.gather(*(ytmusic.get_playlist(pid) for pid in playlist_ids))
+
+    The ``iter_*`` methods return async iterators instead::
+
+        tracks = ytmusic.iter_playlist_tracks(playlist_id)
+        async for track in tracks:
+            checkpoint = tracks.cursor
+
+    ``get_playlists``, ``get_albums`` and ``get_artists`` run concurrent tasks instead of threads
+    and return async iterators as well::
+
+        async for playlist_id, playlist, error in ytmusic.get_playlists(playlist_ids):
+            ...
+
+    Response parsing is shared with the synchronous client and still happens on the event loop thread.
+    Requires the ``async`` extra: ``pip install ytmusicapi[async]``
+    """
+
+    def __init__(
+        self,
+        auth: Optional[Union[str, Dict]] = None,
+        user: Optional[str] = None,
+        client: Optional["httpx.AsyncClient"] = None,
+        proxies: Optional[Dict[str, str]] = None,
+        language: str = "en",
+        location: str = "",
+        oauth_credentials: Optional[OAuthCredentials] = None,
+        cache: Optional[ResponseCache] = None,
+        compression_threshold: Optional[int] = 16 * 1024,
+    ):
+        """
+        Create a new asynchronous instance to interact with YouTube Music.
+
+        :param client: Optional. An ``httpx.AsyncClient`` to send requests with.
+            Default: A new client with a request timeout of 30s and up to 100 pooled connections.
+        :param proxies: Optional. Proxy URL to use for all requests of a newly created client,
+            i.e. ``{"https": "http://10.10.1.10:1080"}``. Ignored if ``client`` is passed.
+
+        See :py:class:`YTMusic` for the remaining parameters.
+        """
+        transport = AsyncHTTPXTransport(client, proxy=next(iter(proxies.values()), None) if proxies else None)
+        super().__init__(
+            auth,
+            user,
+            False,
+            proxies,
+            language,
+            location,
+            oauth_credentials,
+            transport=transport,
+            cache=cache,
+            compression_threshold=compression_threshold,
+        )
+        self._transport: AsyncHTTPXTransport = transport
+
+    def get_playlists(  # type: ignore[override]
+        self,
+        playlist_ids: Iterable[str],
+        limit: Optional[int] = 100,
+        max_workers: int = 8,
+        fields: Optional[Iterable[str]] = None,
+        track_format: str = "dict",
+    ) -> AsyncIterator[BulkResult]:
+        """Async version of :py:meth:`YTMusic.get_playlists`, awaiting up to ``max_workers`` playlists at once."""
+        return self._gather(
+            lambda playlist_id: self.get_playlist(
+                playlist_id, limit, fields=fields, track_format=track_format
+            ),
+            playlist_ids,
+            max_workers,
+        )
+
+    def get_albums(  # type: ignore[override]
+        self, browse_ids: Iterable[str], max_workers: int = 8
+    ) -> AsyncIterator[BulkResult]:
+        """Async version of :py:meth:`YTMusic.get_albums`, awaiting up to ``max_workers`` albums at once."""
+        return self._gather(self.get_album, browse_ids, max_workers)
+
+    def get_artists(  # type: ignore[override]
+        self, channel_ids: Iterable[str], max_workers: int = 8
+    ) -> AsyncIterator[BulkResult]:
+        """Async version of :py:meth:`YTMusic.get_artists`, awaiting up to ``max_workers`` artists at once."""
+        return self._gather(self.get_artist, channel_ids, max_workers)
+
+    async def _gather(
+        self, fetch: Callable[[str], Any], ids: Iterable[str], max_workers: int
+    ) -> AsyncIterator[BulkResult]:
+        # a single visitor id request instead of one per task
+        await greenlet_spawn(self._prepare_headers)
+        async for result in gather_concurrently(fetch, ids, max_workers):
+            yield result
+
+    async def aclose(self) -> None:
+        """Close the underlying http client and its connection pool."""
+        await self._transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, execType=None, execValue=None, trackback=None):
+        await self.aclose()
+
+
+for _mixin in (
+    BrowsingMixin,
+    SearchMixin,
+    WatchMixin,
+    ExploreMixin,
+    LibraryMixin,
+    PlaylistsMixin,
+    UploadsMixin,
+):
+    for _name, _method in vars(_mixin).items():
+        # methods with a native async implementation are kept
+        if not _name.startswith("_") and callable(_method) and _name not in vars(AsyncYTMusic):
+            setattr(AsyncYTMusic, _name, _mirror(_method))
@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 from typing import Optional
 
 from .credentials import Credentials
@@ -12,6 +13,7 @@ class RefreshingToken(Token):
     Compositional implementation of Token that automatically refreshes
     an underlying OAuthToken when required (credential expiration <= 1 min)
     upon access_token attribute access.
+    Threads accessing an expiring token concurrently wait for a single refresh.
     """
 
     @classmethod
@@ -47,6 +49,7 @@ class RefreshingToken(Token):
         #: protected/property attribute enables auto writing token
         #  values to new file location via setter
         self._local_cache = local_cache
+        self._refresh_lock = threading.Lock()
 
     @property
     def token_type(self) -> Bearer:
@@ -65,9 +68,12 @@ class RefreshingToken(Token):
     @property
     def access_token(self) -> str:
         if self.token.is_expiring:
-            fresh = self.credentials.refresh_token(self.token.refresh_token)
-            self.token.update(fresh)
-            self.store_token()
+            with self._refresh_lock:
+                # refreshed by another thread while waiting
+                if self.token.is_expiring:
+                    fresh = self.credentials.refresh_token(self.token.refresh_token)
+                    self.token.update(fresh)
+                    self.store_token()
 
         return self.token.access_token
 
@@ -0,0 +1,283 @@
+"""process-wide cache of the values extracted from the YouTube Music homepage and player script"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import suppress
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from ytmusicapi.constants import YTM_DOMAIN
+
+
+class Bootstrap(NamedTuple):
+    """values extracted from the homepage"""
+
+    visitor_id: str  #: value of the X-Goog-Visitor-Id header
+    js_url: Optional[str]  #: absolute url of the player script base.js
+    ytcfg: Dict[str, Any]  #: first configuration object set by the page
+    fetched: float  #: unix time of the download
+
+
+def _in_bridge() -> bool:
+    # requests of AsyncYTMusic can only be awaited from its greenlets, not from other threads
+    bridge = sys.modules.get("ytmusicapi._bridge")
+    return bridge is not None and bridge.in_bridge()
+
+
+class _Flight:
+    """
+    Download in progress whose result the other callers wait for instead of downloading it again.
+    Greenlets of AsyncYTMusic await it on their event loop, so the download can progress meanwhile.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._waiters: List[Tuple[Any, Any]] = []  #: event loops and futures of waiting greenlets
+        self.result: Any = None  #: downloaded value, None if the download failed
+
+    def wait(self, timeout: float) -> bool:
+        """Wait until the download ended, False after timeout seconds"""
+        if not _in_bridge():
+            return self._event.wait(timeout)
+
+        import asyncio
+
+        bridge = sys.modules["ytmusicapi._bridge"]
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self._event.is_set():
+                return True
+            self._waiters.append((loop, future))
+        try:
+            bridge.await_only(asyncio.wait_for(future, timeout))
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def land(self) -> None:
+        """Wake up all callers waiting for the download"""
+        with self._lock:
+            self._event.set()
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            with suppress(RuntimeError):  # the event loop was closed meanwhile
+                loop.call_soon_threadsafe(_resolve, future)
+
+
+def _resolve(future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def parse_signature_timestamp(text: str) -> int:
+    """Extract the signatureTimestamp from the player script base.js."""
+    match = re.search(r"signatureTimestamp[:=](\d+)", text)
+    if match is None:
+        raise Exception("Unable to identify the signatureTimestamp.")
+    return int(match.group(1))
+
+
+def parse_homepage(text: str, fetched: Optional[float] = None) -> Bootstrap:
+    """Extract the visitor id, ytcfg and base.js url from the homepage html."""
+    ytcfg = {}
+    if match := re.search(r"ytcfg\.set\s*\(\s*({.+?})\s*\)\s*;", text):
+        ytcfg = json.loads(match.group(1))
+    js_url = re.search(r'jsUrl"\s*:\s*"([^"]+)"', text)
+    return Bootstrap(
+        ytcfg.get("VISITOR_DATA", ""),
+        YTM_DOMAIN + js_url.group(1) if js_url else None,
+        ytcfg,
+        time.time() if fetched is None else fetched,
+    )
+
+
+class BootstrapCache:
+    """
+    Shares a single homepage download between all YTMusic instances of a process.
+    Used for the visitor id sent with unauthenticated requests and by :py:meth:`get_basejs_url`.
+
+    The signatureTimestamp needed for streaming urls is cached per base.js url, so the player
+    script is downloaded once per release. Once a timestamp was requested, a homepage download
+    reporting a new base.js url downloads its timestamp in a background thread.
+
+    :param ttl: Seconds before the homepage is downloaded again. Default: 6 hours
+    :param path: Optional. JSON file to persist the values in, so other processes can reuse them.
+    """
+
+    def __init__(self, ttl: float = 6 * 3600, path: Optional[Union[str, os.PathLike]] = None):
+        self.ttl = ttl
+        self.path = os.fspath(path) if path is not None else None
+        self._entries: Dict[str, Bootstrap] = {}
+        self._timestamps: Dict[str, int] = {}  #: signatureTimestamp by base.js url
+        self._pending: Dict[str, _Flight] = {}  #: homepage and base.js urls being downloaded
+        # never held during downloads, callers of the same url wait for its flight instead
+        self._lock = threading.Lock()
+
+    def configure(self, ttl: Optional[float] = None, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        """
+        Change the time to live or the file of the cache.
+
+        :param ttl: Optional. Seconds before the homepage is downloaded again.
+        :param path: Optional. JSON file to persist the values in.
+        """
+        with self._lock:
+            if ttl is not None:
+                self.ttl = ttl
+            if path is not None:
+                self.path = os.fspath(path)
+
+    def get(self, request_func: Callable, refresh: bool = False) -> Bootstrap:
+        """
+        Values extracted from the homepage, downloading it if no fresh copy is cached.
+        Callers requesting it while it is downloaded wait for that download.
+
+        :param request_func: function sending a GET request to a url and returning the response
+        :param refresh: Download the homepage even if a fresh copy is cached. Default: False
+        """
+        while True:
+            with self._lock:
+                entry = None if refresh else self._load()
+                if entry is not None:
+                    return entry
+                flight = self._pending.get(YTM_DOMAIN)
+                if flight is None:
+                    flight = self._pending[YTM_DOMAIN] = _Flight()
+                    break
+            # a download started meanwhile is fresh enough for a refresh, a failed one is retried
+            if not flight.wait(30):
+                return self._fetch_homepage(request_func)
+            if flight.result is not None:
+                return flight.result
+
+        try:
+            flight.result = self._fetch_homepage(request_func)
+            return flight.result
+        finally:
+            self._land(YTM_DOMAIN, flight)
+
+    def signature_timestamp(self, js_url: str, request_func: Callable) -> int:
+        """
+        signatureTimestamp of a base.js version, downloading the script once per url.
+        Callers requesting the same url while it is downloaded wait for that download.
+
+        :param js_url: url of base.js, see :py:attr:`Bootstrap.js_url`
+        :param request_func: function sending a GET request to a url and returning the response
+        """
+        while True:
+            with self._lock:
+                if (timestamp := self._load_timestamp(js_url)) is not None:
+                    return timestamp
+                flight = self._pending.get(js_url)
+                if flight is None:
+                    flight = self._pending[js_url] = _Flight()
+                    break
+            # a failed download is retried by the next caller
+            if not flight.wait(30):
+                return self._fetch_timestamp(js_url, request_func)
+
+        try:
+            return self._fetch_timestamp(js_url, request_func)
+        finally:
+            self._land(js_url, flight)
+
+    def clear(self) -> None:
+        """Forget all cached values, including the file."""
+        with self._lock:
+            self._entries.clear()
+            self._timestamps.clear()
+            if self.path is not None and os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _fresh(self, entry: Optional[Bootstrap]) -> bool:
+        return entry is not None and time.time() - entry.fetched < self.ttl
+
+    def _load(self) -> Optional[Bootstrap]:
+        entry = self._entries.get(YTM_DOMAIN)
+        if self._fresh(entry):
+            return entry
+        if self.path is not None:
+            try:
+                with open(self.path, encoding="utf-8") as file:
+                    stored = json.load(file).get(YTM_DOMAIN)
+            except (OSError, ValueError):
+                stored = None
+            if stored and self._fresh(loaded := Bootstrap(**stored)):
+                self._entries[YTM_DOMAIN] = loaded
+                return loaded
+        return None
+
+    def _store(self, entry: Bootstrap) -> None:
+        self._entries[YTM_DOMAIN] = entry
+        self._update_file(lambda stored: stored.update({YTM_DOMAIN: entry._asdict()}))
+
+    def _fetch_homepage(self, request_func: Callable) -> Bootstrap:
+        response = request_func(YTM_DOMAIN)
+        entry = parse_homepage(response.text)
+        # consent pages and other unexpected responses have no visitor id and are requested again
+        if response.status_code < 400 and entry.visitor_id:
+            with self._lock:
+                self._store(entry)
+                timestamps_used = bool(self._timestamps)
+            if entry.js_url and timestamps_used:  # timestamps are in use, prepare the new release
+                self._fetch_in_background(entry.js_url, request_func)
+        return entry
+
+    def _load_timestamp(self, js_url: str) -> Optional[int]:
+        if js_url not in self._timestamps and self.path is not None:
+            with suppress(OSError, ValueError, KeyError):
+                with open(self.path, encoding="utf-8") as file:
+                    self._timestamps[js_url] = json.load(file)["signatureTimestamps"][js_url]
+        return self._timestamps.get(js_url)
+
+    def _fetch_timestamp(self, js_url: str, request_func: Callable) -> int:
+        timestamp = parse_signature_timestamp(request_func(js_url).text)
+        with self._lock:
+            self._timestamps[js_url] = timestamp
+            self._update_file(
+                lambda stored: stored.setdefault("signatureTimestamps", {}).update({js_url: timestamp})
+            )
+        return timestamp
+
+    def _fetch_in_background(self, js_url: str, request_func: Callable) -> None:
+        with self._lock:
+            if _in_bridge() or js_url in self._pending or js_url in self._timestamps:
+                return
+            flight = self._pending[js_url] = _Flight()
+
+        def fetch():
+            try:
+                self._fetch_timestamp(js_url, request_func)
+            except Exception:
+                pass  # retried on the next request for this url
+            finally:
+                self._land(js_url, flight)
+
+        threading.Thread(target=fetch, name="ytmusicapi-basejs", daemon=True).start()
+
+    def _land(self, js_url: str, flight: _Flight) -> None:
+        with self._lock:
+            del self._pending[js_url]
+        flight.land()
+
+    def _update_file(self, update: Callable[[Dict], Any]) -> None:
+        if self.path is None:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                stored = json.load(file)
+        except (OSError, ValueError):
+            stored = {}
+        update(stored)
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(stored, file)
+        os.replace(temporary, self.path)
+
+
+#: cache shared by all instances of the process
+shared = BootstrapCache()
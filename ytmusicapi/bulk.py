@@ -0,0 +1,58 @@
+"""fetching many independent pages concurrently"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, NamedTuple, Optional
+
+
+class BulkResult(NamedTuple):
+    """outcome of fetching a single id, yielded in order of completion"""
+
+    id: str  #: requested id
+    result: Any  #: return value of the single fetch, None if it failed
+    error: Optional[BaseException] = None  #: exception raised by the single fetch
+
+
+def fetch_concurrently(
+    fetch: Callable[[str], Any], ids: Iterable[str], max_workers: int
+) -> Iterator[BulkResult]:
+    """
+    Call fetch for every id on a pool of threads, yielding the results as they complete.
+    Pending calls are cancelled if the iteration is stopped early.
+
+    :param fetch: function fetching a single id
+    :param ids: ids to fetch
+    :param max_workers: maximum number of concurrent calls
+    """
+    executor = ThreadPoolExecutor(max_workers, thread_name_prefix="ytmusicapi-bulk")
+    futures = {executor.submit(fetch, item_id): item_id for item_id in ids}
+    try:
+        for future in as_completed(futures):
+            error = future.exception()
+            yield BulkResult(futures[future], None if error else future.result(), error)
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def gather_concurrently(
+    fetch: Callable[[str], Awaitable], ids: Iterable[str], max_workers: int
+) -> AsyncIterator[BulkResult]:
+    """Like :py:func:`fetch_concurrently`, but awaits coroutines on the running event loop."""
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(item_id: str) -> BulkResult:
+        async with semaphore:
+            try:
+                return BulkResult(item_id, await fetch(item_id))
+            except Exception as error:
+                return BulkResult(item_id, None, error)
+
+    tasks = [asyncio.ensure_future(run(item_id)) for item_id in ids]
+    try:
+        for completed in asyncio.as_completed(tasks):
+            yield await completed
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,13 @@
+from .base import DEFAULT_TTLS, CacheStats, ResponseCache, cache_key, invalidation_targets
+from .memory import MemoryCache
+from .sqlite import SQLiteCache
+
+__all__ = [
+    "DEFAULT_TTLS",
+    "CacheStats",
+    "MemoryCache",
+    "ResponseCache",
+    "SQLiteCache",
+    "cache_key",
+    "invalidation_targets",
+]
@@ -0,0 +1,140 @@
+"""response cache interface and cache key rules"""
+
+import json
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+#: default time to live in seconds, keyed by endpoint or ``endpoint:browseId prefix``
+DEFAULT_TTLS: Dict[str, float] = {
+    "browse:MPRE": 24 * 3600,  # albums
+    "browse:UC": 6 * 3600,  # artists, channels
+    "browse:MPAD": 6 * 3600,  # artist albums and singles
+    "browse:MPLY": 7 * 24 * 3600,  # lyrics
+    "browse:MPTR": 24 * 3600,  # related songs
+    "browse:FEmusic_moods_and_genres": 24 * 3600,  # mood categories and playlists
+}
+
+#: endpoints modifying data, never cached
+WRITE_ENDPOINTS = ("browse/edit_playlist", "playlist/", "like/", "feedback", "subscription/")
+
+
+@dataclass
+class CacheStats:
+    """counters of a response cache"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache(ABC):
+    """
+    Base class for caches of raw InnerTube responses used by :py:meth:`YTMusicBase._send_request`.
+
+    Only requests with a configured time to live are cached. Responses are stored as the
+    raw response body, so each hit is decoded into new objects that may be modified freely.
+
+    :param ttls: Optional. Time to live in seconds keyed by endpoint (i.e. ``next``) or by
+        ``endpoint:browseId prefix`` (i.e. ``browse:MPRE`` for albums). Merged with :py:data:`DEFAULT_TTLS`.
+        Set a value to 0 to disable caching of a default entry.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None):
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.stats = CacheStats()
+
+    def ttl_for(self, endpoint: str, body: Dict) -> Optional[float]:
+        """Time to live of a request or None if it must not be cached."""
+        browse_id = body.get("browseId")
+        ttl = None
+        for key, value in self.ttls.items():
+            target, _, prefix = key.partition(":")
+            if target == endpoint and (not prefix or (browse_id and browse_id.startswith(prefix))):
+                ttl = value
+                if prefix:
+                    break
+        return ttl if ttl else None
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached response body for key or None if absent or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()) -> None:
+        """
+        Store a response body.
+
+        :param key: cache key as created by :py:func:`cache_key`
+        :param value: raw response body
+        :param ttl: time to live in seconds
+        :param tags: identifiers used to invalidate the entry, i.e. the browseId
+        """
+
+    @abstractmethod
+    def invalidate(self, tags: Iterable[str] = (), prefixes: Iterable[str] = ()) -> None:
+        """Remove entries having one of the tags or a tag starting with one of the prefixes."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+
+def cache_key(endpoint: str, body: Dict, context: Dict, additional_params: str = "") -> str:
+    """
+    Canonical cache key of a request.
+    Includes language, location and user of the context but not the daily changing client version.
+    """
+    client = context["context"]["client"]
+    request = {k: v for k, v in body.items() if k != "context"}
+    return "|".join(
+        [
+            endpoint + additional_params,
+            client.get("hl", ""),
+            client.get("gl", ""),
+            context["context"]["user"].get("onBehalfOfUser", ""),
+            json.dumps(request, sort_keys=True, separators=(",", ":")),
+        ]
+    )
+
+
+def invalidation_targets(endpoint: str, body: Dict) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Tags and tag prefixes of cached responses affected by a write request.
+
+    :return: tuple of tags and prefixes, both empty for read requests
+    """
+    if not endpoint.startswith(WRITE_ENDPOINTS):
+        return (), ()
+
+    tags = []
+    prefixes = []
+    playlist_id = body.get("playlistId") or body.get("target", {}).get("playlistId")
+    if playlist_id:
+        playlist_id = playlist_id[2:] if playlist_id.startswith("VL") else playlist_id
+        tags += [playlist_id, "VL" + playlist_id]
+
+    if endpoint.startswith("like/"):
+        prefixes += ["FEmusic_liked", "VLLM"]
+        if playlist_id and playlist_id.startswith("OLAK"):  # album like status
+            prefixes.append("MPRE")
+
+    elif endpoint == "feedback":  # library status and history
+        prefixes += ["FEmusic_", "MPRE"]
+
+    elif endpoint.startswith("subscription/"):
+        tags += body.get("channelIds", [])
+        prefixes.append("FEmusic_library_corpus")
+
+    return tuple(tags), tuple(prefixes)
+
+
+def now() -> float:
+    return time.time()
@@ -0,0 +1,78 @@
+"""in-process response cache"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from . import base
+from .base import ResponseCache
+
+
+class _Entry(NamedTuple):
+    expires: float
+    tags: Tuple[str, ...]
+    value: bytes
+
+
+class MemoryCache(ResponseCache):
+    """
+    Thread-safe in-process cache with per-entry expiry and least recently used eviction.
+
+    :param max_bytes: Maximum total size of the stored response bodies. Default: 64 MiB
+    :param ttls: Optional. Time to live per endpoint, see :py:class:`ResponseCache`.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttls: Optional[Dict[str, float]] = None):
+        super().__init__(ttls)
+        self.max_bytes = max_bytes
+        self.size = 0  #: total size of the stored response bodies
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires <= base.now():
+                if entry is not None:
+                    self._remove(key)
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(base.now() + ttl, tuple(tags), value)
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def invalidate(self, tags: Iterable[str] = (), prefixes: Iterable[str] = ()) -> None:
+        tags = set(tags)
+        prefixes = tuple(prefixes)
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if any(tag in tags or tag.startswith(prefixes) for tag in entry.tags)
+            ]
+            for key in stale:
+                self._remove(key)
+            self.stats.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key: str) -> None:
+        self.size -= len(self._entries.pop(key).value)
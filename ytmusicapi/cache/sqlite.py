@@ -0,0 +1,165 @@
+"""persistent response cache shared between processes"""
+
+import os
+import sqlite3
+import threading
+import zlib
+from typing import Dict, Iterable, Optional, Union
+
+from . import base
+from .base import ResponseCache
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL,
+    value BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL REFERENCES entries (key) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS tags_tag ON tags (tag);
+CREATE INDEX IF NOT EXISTS tags_key ON tags (key);
+"""
+
+#: seconds between access time updates of an entry, avoids a write for every hit
+ACCESS_RESOLUTION = 60
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Response cache persisted in a SQLite database, so restarted or parallel worker processes
+    share warm entries. The database uses write-ahead logging, so readers never block each other.
+
+    Response bodies are stored zlib compressed. When the database grows beyond ``max_bytes``,
+    expired entries and then the least recently used entries are removed.
+    Each thread and process opens its own connection.
+
+    :param path: Database file, created if missing
+    :param max_bytes: Maximum total size of the compressed response bodies. Default: 256 MiB
+    :param ttls: Optional. Time to live per endpoint, see :py:class:`ResponseCache`.
+    :param compression_level: zlib compression level from 0 (none) to 9. Default: 6
+    :param timeout: Seconds to wait for a lock held by another connection. Default: 30
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        max_bytes: int = 256 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        compression_level: int = 6,
+        timeout: float = 30,
+    ):
+        super().__init__(ttls)
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT count(*) FROM entries").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """total size of the stored compressed response bodies"""
+        return self._connection().execute("SELECT total(size) FROM entries").fetchone()[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        connection = self._connection()
+        now = base.now()
+        row = connection.execute(
+            "SELECT accessed, value FROM entries WHERE key = ? AND expires > ?", (key, now)
+        ).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+
+        if now - row[0] > ACCESS_RESOLUTION:
+            with connection:
+                connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        self.stats.hits += 1
+        return zlib.decompress(row[1])
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()) -> None:
+        blob = zlib.compress(value, self.compression_level)
+        if len(blob) > self.max_bytes:
+            return
+        now = base.now()
+        with self._connection() as connection:
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            connection.execute(
+                "INSERT INTO entries (key, expires, accessed, size, value) VALUES (?, ?, ?, ?, ?)",
+                (key, now + ttl, now, len(blob), blob),
+            )
+            connection.executemany("INSERT INTO tags (tag, key) VALUES (?, ?)", [(tag, key) for tag in tags])
+            self._shrink(connection, now)
+
+    def invalidate(self, tags: Iterable[str] = (), prefixes: Iterable[str] = ()) -> None:
+        tags = list(tags)
+        prefixes = list(prefixes)
+        conditions = ["tag = ?"] * len(tags) + ["substr(tag, 1, ?) = ?"] * len(prefixes)
+        if not conditions:
+            return
+        params = tags + [value for prefix in prefixes for value in (len(prefix), prefix)]
+        with self._connection() as connection:
+            removed = connection.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM tags WHERE "
+                + " OR ".join(conditions)
+                + ")",
+                params,
+            ).rowcount
+        self.stats.invalidations += removed
+
+    def clear(self) -> None:
+        with self._connection() as connection:
+            connection.execute("DELETE FROM entries")
+
+    def purge(self) -> int:
+        """
+        Remove all expired entries.
+
+        :return: number of removed entries
+        """
+        with self._connection() as connection:
+            return connection.execute("DELETE FROM entries WHERE expires <= ?", (base.now(),)).rowcount
+
+    def close(self) -> None:
+        """Close the connection of the current thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _shrink(self, connection: sqlite3.Connection, now: float) -> None:
+        size = connection.execute("SELECT total(size) FROM entries").fetchone()[0]
+        if size <= self.max_bytes:
+            return
+        size -= connection.execute("SELECT total(size) FROM entries WHERE expires <= ?", (now,)).fetchone()[0]
+        connection.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+        evict = []
+        for key, entry_size in connection.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            if size <= self.max_bytes:
+                break
+            evict.append((key,))
+            size -= entry_size
+        connection.executemany("DELETE FROM entries WHERE key = ?", evict)
+        self.stats.evictions += len(evict)
+
+    def _connection(self) -> sqlite3.Connection:
+        # connections must not be shared between threads or inherited by forked processes
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute("PRAGMA foreign_keys = ON")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
@@ -0,0 +1,278 @@
+"""column buffers holding the parsed tracks of large playlists and libraries"""
+
+from array import array
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List
+
+#: buffers of :py:class:`TrackColumns` per key of a parsed track
+TRACK_COLUMNS = {
+    "video_id": ("video_id",),
+    "set_video_id": ("set_video_id",),
+    "name": ("name",),
+    "artists": ("artist_offsets", "artist_id", "artist_name"),
+    "album": ("album_id", "album_name"),
+    "track_number": ("track_number",),
+    "like_status": ("like_status",),
+    "in_library": ("in_library",),
+    "available": ("available",),
+    "explicit": ("explicit",),
+    "video_type": ("video_type",),
+    "duration_s": ("duration_s",),
+}
+#: keys of a parsed track that have columns, thumbnails and feedback_tokens have none
+TRACK_COLUMN_FIELDS = frozenset(TRACK_COLUMNS)
+
+# typecodes of the integer buffers, -1 marks unknown values
+_INTEGERS = {"artist_offsets": "q", "track_number": "q", "duration_s": "q", "in_library": "b"}
+_BITS = {"available", "explicit"}
+
+
+class BitArray:
+    """Booleans packed into bytes, least significant bit first like the boolean buffers of Arrow."""
+
+    __slots__ = ("buffer", "_length")
+
+    def __init__(self, values: Iterable[bool] = ()):
+        self.buffer = bytearray()  #: packed bits
+        self._length = 0
+        self.extend(values)
+
+    def append(self, value: bool) -> None:
+        bit = self._length & 7
+        if not bit:
+            self.buffer.append(0)
+        if value:
+            self.buffer[-1] |= 1 << bit
+        self._length += 1
+
+    def extend(self, values: Iterable[bool]) -> None:
+        for value in values:
+            self.append(value)
+
+    def __getitem__(self, index: int) -> bool:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("BitArray index out of range")
+        return bool(self.buffer[index >> 3] >> (index & 7) & 1)
+
+    def __iter__(self) -> Iterator[bool]:
+        return (self[index] for index in range(self._length))
+
+    def __len__(self) -> int:
+        return self._length
+
+
+class TrackColumns:
+    """
+    Parsed tracks stored as one buffer per column instead of a dictionary per track.
+    Returned by methods called with ``track_format="columns"``.
+
+    Strings are lists, numbers are :py:class:`array.array` buffers with -1 for unknown values and
+    ``available`` and ``explicit`` are :py:class:`BitArray` buffers. The artists of track ``i`` are
+    ``artist_id[artist_offsets[i]:artist_offsets[i + 1]]`` and the same slice of ``artist_name``.
+    ``in_library`` is 1, 0 or -1 if the track has no library toggle.
+    """
+
+    __slots__ = ("fields", "buffers", "rows")
+
+    def __init__(self, fields: Iterable[str] = TRACK_COLUMN_FIELDS):
+        """
+        :param fields: keys of a parsed track to hold columns for
+        """
+        self.fields: FrozenSet[str] = frozenset(fields)  #: keys of a parsed track with columns
+        self.buffers: Dict[str, Any] = {}  #: buffers by column name
+        for field, columns in TRACK_COLUMNS.items():
+            if field in self.fields:
+                for column in columns:
+                    self.buffers[column] = _buffer(column)
+        self.rows = 0  #: number of tracks
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} of {self.rows} tracks: {', '.join(self.buffers)}>"
+
+    def __getitem__(self, index: slice) -> "TrackColumns":
+        """Tracks of a slice as new columns, i.e. ``columns[:100]``"""
+        start, stop, step = index.indices(self.rows)
+        if step != 1:
+            raise Exception("Columns can only be sliced with a step of 1.")
+        stop = max(start, stop)
+        sliced = TrackColumns(self.fields)
+        offsets: Any = self.buffers.get("artist_offsets")
+        for column, buffer in self.buffers.items():
+            if column == "artist_offsets":
+                buffer = array("q", (offset - offsets[start] for offset in buffer[start : stop + 1]))
+            elif column in ("artist_id", "artist_name"):
+                buffer = buffer[offsets[start] : offsets[stop]]
+            elif isinstance(buffer, BitArray):
+                buffer = BitArray(buffer[row] for row in range(start, stop))
+            else:
+                buffer = buffer[start:stop]
+            sliced.buffers[column] = buffer
+        sliced.rows = stop - start
+        return sliced
+
+    def extend(self, other: "TrackColumns") -> None:
+        """Append the tracks of other columns with the same fields, i.e. of another page or playlist."""
+        if other.fields != self.fields:
+            raise Exception("Columns with different fields can't be combined.")
+        for column, buffer in self.buffers.items():
+            if column == "artist_offsets":
+                shift = buffer[-1]
+                buffer.extend(offset + shift for offset in other.buffers[column][1:])
+            else:
+                buffer.extend(other.buffers[column])
+        self.rows += other.rows
+
+    def appender(self, field: str) -> Callable[[Any], None]:
+        """
+        Function appending the value of a key of a parsed track to the buffers of the key, with None
+        for unknown values. Parsers count :py:attr:`rows` themselves once all keys of a track were appended.
+        """
+        buffers = self.buffers
+        if field == "artists":
+            offsets, ids, names = (buffers[column] for column in TRACK_COLUMNS[field])
+
+            def append_artists(artists):
+                for artist in artists or []:
+                    ids.append(artist["id"])
+                    names.append(artist["name"])
+                offsets.append(len(ids))
+
+            return append_artists
+        if field == "album":
+            ids, names = buffers["album_id"], buffers["album_name"]
+
+            def append_album(album):
+                ids.append(album["id"] if album else None)
+                names.append(album["name"] if album else None)
+
+            return append_album
+        if field in _INTEGERS:
+            append = buffers[field].append
+            return lambda value: append(-1 if value is None else int(value))
+        return buffers[field].append
+
+    def to_pydict(self) -> Dict[str, List]:
+        """
+        Lists per key of a parsed track, with None for unknown numbers.
+        Artists and albums are dictionaries like in the default format.
+        """
+        buffers = self.buffers
+        result: Dict[str, List] = {}
+        for field in TRACK_COLUMNS:
+            if field not in self.fields:
+                continue
+            if field == "artists":
+                offsets, ids, names = (buffers[column] for column in TRACK_COLUMNS[field])
+                result[field] = [
+                    [{"name": names[i], "id": ids[i]} for i in range(offsets[row], offsets[row + 1])]
+                    for row in range(self.rows)
+                ]
+            elif field == "album":
+                ids, names = buffers["album_id"], buffers["album_name"]
+                result[field] = [{"name": name, "id": album_id} for album_id, name in zip(ids, names)]
+            elif field == "in_library":
+                result[field] = [None if value < 0 else bool(value) for value in buffers[field]]
+            elif field in _INTEGERS:
+                result[field] = [None if value < 0 else value for value in buffers[field]]
+            else:
+                result[field] = list(buffers[field])
+        return result
+
+    def to_arrow(self):
+        """
+        :py:class:`pyarrow.Table` with a column per key of a parsed track, artists as a list of structs
+        and albums as structs. Numbers and booleans are handed over without copying Python objects.
+        Requires the optional dependency pyarrow.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as err:  # pragma: no cover
+            raise ImportError(
+                "TrackColumns.to_arrow requires the optional dependency pyarrow. "
+                "Install it with: pip install ytmusicapi[arrow]"
+            ) from err
+
+        buffers = self.buffers
+        arrays = {}
+        for field in TRACK_COLUMNS:
+            if field not in self.fields:
+                continue
+            if field == "artists":
+                artists = pa.StructArray.from_arrays(
+                    [
+                        pa.array(buffers["artist_name"], pa.string()),
+                        pa.array(buffers["artist_id"], pa.string()),
+                    ],
+                    names=["name", "id"],
+                )
+                offsets = pa.array(buffers["artist_offsets"], pa.int64())
+                arrays[field] = pa.LargeListArray.from_arrays(offsets, artists)
+            elif field == "album":
+                arrays[field] = pa.StructArray.from_arrays(
+                    [
+                        pa.array(buffers["album_name"], pa.string()),
+                        pa.array(buffers["album_id"], pa.string()),
+                    ],
+                    names=["name", "id"],
+                )
+            elif field == "in_library":
+                values = buffers[field]
+                arrays[field] = pa.Array.from_buffers(
+                    pa.bool_(),
+                    self.rows,
+                    [
+                        pa.py_buffer(BitArray(value >= 0 for value in values).buffer),
+                        pa.py_buffer(BitArray(value > 0 for value in values).buffer),
+                    ],
+                )
+            elif field in _INTEGERS:
+                values = buffers[field]
+                validity = BitArray(value >= 0 for value in values).buffer
+                arrays[field] = pa.Array.from_buffers(
+                    pa.int64(), self.rows, [pa.py_buffer(validity), pa.py_buffer(values)]
+                )
+            elif field in _BITS:
+                arrays[field] = pa.Array.from_buffers(
+                    pa.bool_(), self.rows, [None, pa.py_buffer(buffers[field].buffer)]
+                )
+            else:
+                arrays[field] = pa.array(buffers[field], pa.string())
+        return pa.table(arrays)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        :py:class:`numpy.ndarray` per buffer: integer arrays with -1 for unknown values, boolean arrays
+        and object arrays of strings. Requires the optional dependency numpy.
+        """
+        try:
+            import numpy as np
+        except ImportError as err:  # pragma: no cover
+            raise ImportError(
+                "TrackColumns.to_numpy requires the optional dependency numpy. "
+                "Install it with: pip install ytmusicapi[numpy]"
+            ) from err
+
+        arrays = {}
+        for column, buffer in self.buffers.items():
+            if isinstance(buffer, BitArray):
+                bits = np.frombuffer(bytes(buffer.buffer), np.uint8)
+                arrays[column] = np.unpackbits(bits, count=len(buffer), bitorder="little").astype(bool)
+            elif isinstance(buffer, array):
+                arrays[column] = np.array(buffer)
+            else:
+                arrays[column] = np.array(buffer, dtype=object)
+        return arrays
+
+
+def _buffer(column: str) -> Any:
+    if column in _BITS:
+        return BitArray()
+    if column == "artist_offsets":
+        return array("q", [0])
+    if column in _INTEGERS:
+        return array(_INTEGERS[column])
+    return []
@@ -1,33 +1,314 @@
+import base64
+import hashlib
+import json
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from itertools import islice
+from typing import Any, Iterator, List, NamedTuple, Optional, Set
+
 from ytmusicapi.navigation import nav
 
 
 def get_continuations(
-    results, continuation_type, limit, request_func, parse_func, ctoken_path="", reloadable=False
+    results,
+    continuation_type,
+    limit,
+    request_func,
+    parse_func,
+    ctoken_path="",
+    reloadable=False,
+    prefetch=None,
+    items=None,
 ):
-    items = []
-    while "continuations" in results and (limit is None or len(items) < limit):
-        additional_params = (
-            get_reloadable_continuation_params(results)
-            if reloadable
-            else get_continuation_params(results, ctoken_path)
-        )
-        response = request_func(additional_params)
-        if "continuationContents" in response:
-            results = response["continuationContents"][continuation_type]
-        else:
-            break
-        contents = get_continuation_contents(results, parse_func)
-        if len(contents) == 0:
-            break
+    """
+    Parsed contents of all continuation pages appended to items, a new list by default.
+    Containers other than lists, i.e. :py:class:`~ytmusicapi.columns.TrackColumns`, are merged page by page.
+    """
+    items = [] if items is None else items
+    for contents in iter_continuation_pages(
+        results, continuation_type, request_func, parse_func, ctoken_path, reloadable, prefetch, limit
+    ):
         items.extend(contents)
 
     return items
 
 
+def iter_continuation_pages(
+    results,
+    continuation_type,
+    request_func,
+    parse_func,
+    ctoken_path="",
+    reloadable=False,
+    prefetch=None,
+    limit=None,
+):
+    """Yield the parsed contents of each continuation page, requesting a page only once it is needed"""
+    for page in iter_continuation_requests(
+        results,
+        continuation_type,
+        request_func,
+        parse_func,
+        ctoken_path,
+        reloadable,
+        prefetch=prefetch,
+        limit=limit,
+    ):
+        yield page.items
+
+
+def iter_continuation_requests(
+    results,
+    continuation_type,
+    request_func,
+    parse_func,
+    ctoken_path="",
+    reloadable=False,
+    additional_params=None,
+    prefetch=None,
+    limit=None,
+):
+    """
+    Yield a :py:class:`Page` for each continuation page, like :py:func:`iter_continuation_pages`.
+    If additional_params are set, the page they request is the first one instead of the one following results.
+    If prefetch is an executor, the next page is requested on it while the current page is parsed.
+    Once limit items were parsed, no further rows are parsed and no further pages are requested.
+    """
+    if additional_params is None:
+        additional_params = get_next_continuation_params(results, ctoken_path, reloadable)
+    remaining = limit
+    pending = None
+    try:
+        while additional_params is not None and (remaining is None or remaining > 0):
+            response = pending.result() if pending is not None else request_func(additional_params)
+            pending = None
+            if "continuationContents" in response:
+                results = response["continuationContents"][continuation_type]
+            else:
+                break
+            next_params = get_next_continuation_params(results, ctoken_path, reloadable)
+            rows = get_continuation_rows(results)
+            if (
+                prefetch is not None
+                and next_params is not None
+                and (remaining is None or len(rows) < remaining)
+            ):
+                pending = prefetch.submit(request_func, next_params)
+            contents, parsed = parse_limited_rows(rows, parse_func, remaining)
+            if len(contents) == 0:
+                break
+            if remaining is not None:
+                remaining -= len(contents)
+                # rows beyond the limit were not parsed, a cursor resumes within this page
+                if remaining <= 0 and parsed < len(rows):
+                    next_params = None
+            yield Page(additional_params, contents, next_params=next_params)
+            additional_params = next_params
+    finally:
+        # the caller stopped early, i.e. because its limit was reached
+        if pending is not None:
+            pending.cancel()
+
+
+def get_next_continuation_params(results, ctoken_path="", reloadable=False):
+    """continuation parameters requesting the page following results, None if there is none"""
+    data = "reloadContinuationData" if reloadable else "next" + ctoken_path + "ContinuationData"
+    ctoken = nav(results, ["continuations", 0, data, "continuation"], True)
+    return get_continuation_string(ctoken) if ctoken else None
+
+
+class Page(NamedTuple):
+    """parsed items of one response of paginated results"""
+
+    params: Optional[str]  #: continuation parameters requesting the page, None for the first request
+    items: List
+    context: Any = None  #: JSON-serializable values needed to parse pages requested by a cursor
+    next_params: Optional[str] = None  #: continuation parameters of the following page, if known
+
+
+class Cursor(NamedTuple):
+    """position in paginated results, stored by callers as the string returned by :py:meth:`dumps`"""
+
+    source: str  #: identifies the results, see :py:func:`cursor_source`
+    params: Optional[str]  #: continuation parameters of the current page, None for the first request
+    offset: int  #: number of items of the current page already consumed
+    context: Any = None  #: see :py:attr:`Page.context`
+
+    def dumps(self) -> str:
+        return base64.urlsafe_b64encode(json.dumps(list(self)).encode()).decode()
+
+    @classmethod
+    def loads(cls, cursor: str, source: str) -> "Cursor":
+        """
+        Restore a cursor returned by :py:meth:`dumps`.
+
+        :param cursor: serialized cursor
+        :param source: source of the results the cursor is used with
+        """
+        try:
+            loaded = cls(*json.loads(base64.urlsafe_b64decode(cursor.encode())))
+        except (ValueError, TypeError) as e:
+            raise Exception("Invalid cursor. Please pass a cursor returned by this method.") from e
+        if loaded.source != source:
+            raise Exception("The cursor belongs to different results. Please pass the same arguments.")
+        return loaded
+
+
+def cursor_source(*args) -> str:
+    """
+    Short identifier of the JSON-serializable arguments requesting paginated results.
+    Request bodies must be passed before they are sent, since the request context is added to them.
+    """
+    return hashlib.sha1(json.dumps(args, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class ContinuationIterator(Iterator):
+    """
+    Iterator over the items of paginated results, requesting each page only once it is needed.
+    :py:attr:`cursor` allows resuming the iteration later at the next item.
+
+    :param source: identifies the results, see :py:func:`cursor_source`
+    :param pages: iterator of the :py:class:`Page` objects of the results
+    :param start: Optional. Cursor the pages start at, so its offset is skipped.
+    """
+
+    def __init__(self, source: str, pages: Iterator[Page], start: Optional[Cursor] = None):
+        self.source = source
+        self._pages = pages
+        self._page = Page(start.params, [], start.context) if start else Page(None, [])
+        self._index = 0
+        self._skip = start.offset if start else 0
+        self._offset = self._skip  #: items of pages with the same params before the current page
+        self._done = False
+
+    def __next__(self) -> Any:
+        while self._index >= len(self._page.items):
+            if not self._advance():
+                raise StopIteration
+        item = self._page.items[self._index]
+        self._index += 1
+        return item
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """serialized position of the next item, None once all items were consumed"""
+        if self._done:
+            return None
+        if self._index >= len(self._page.items) and self._page.next_params is not None:
+            return Cursor(self.source, self._page.next_params, 0, self._page.context).dumps()
+        return Cursor(self.source, self._page.params, self._offset + self._index, self._page.context).dumps()
+
+    def take(self, limit: Optional[int]) -> List:
+        """
+        Consume the next items. Afterwards, :py:attr:`cursor` points to the item following them.
+
+        :param limit: Number of items. `None` consumes all items.
+        """
+        return list(islice(self, limit))
+
+    def take_into(self, items, limit: Optional[int]):
+        """
+        Like :py:meth:`take`, but appends the next items to items page by page with its extend method,
+        for pages that are no lists such as :py:class:`~ytmusicapi.columns.TrackColumns`.
+
+        :param items: container the items are appended to, which is returned
+        :param limit: Number of items. `None` consumes all items.
+        """
+        taken = 0
+        while limit is None or taken < limit:
+            if self._index >= len(self._page.items) and not self._advance():
+                break
+            page = self._page.items
+            end = len(page) if limit is None else min(len(page), self._index + limit - taken)
+            items.extend(page if self._index == 0 and end == len(page) else page[self._index : end])
+            taken += end - self._index
+            self._index = end
+        return items
+
+    def _advance(self) -> bool:
+        page = next(self._pages, None)
+        if page is None:
+            self._done = True
+            return False
+        # several pages from the same response share the offset, i.e. the shelves of a search
+        self._offset = self._offset + len(self._page.items) if page.params == self._page.params else 0
+        self._page, self._index = page, 0
+        if self._skip:
+            self._index = min(self._skip, len(page.items))
+            self._skip -= self._index
+            self._offset -= self._index
+        return True
+
+
+def paginate(
+    source,
+    cursor,
+    first_page,
+    continuation_type,
+    request_func,
+    parse_func,
+    ctoken_path="",
+    reloadable=False,
+    prefetch=None,
+    limit=None,
+):
+    """
+    :py:class:`ContinuationIterator` over the results starting at a serialized cursor.
+
+    :param source: identifies the results, see :py:func:`cursor_source`
+    :param cursor: Optional. Cursor returned by :py:attr:`ContinuationIterator.cursor`
+    :param first_page: function sending the first request and returning the results containing
+        the continuations and at most limit parsed items, or None if there are no results
+    :param limit: Optional. Number of items after which no further rows are parsed and no pages requested.
+    """
+    start = Cursor.loads(cursor, source) if cursor else None
+
+    def pages():
+        remaining = limit
+        if start is not None and start.params is not None:
+            results = {}
+            additional_params = start.params
+        else:
+            first = first_page(limit)
+            if first is None:
+                return
+            results, contents = first
+            additional_params = None
+            next_params = get_next_continuation_params(results, ctoken_path, reloadable)
+            if remaining is not None:
+                remaining -= len(contents)
+                # rows beyond the limit may not have been parsed, a cursor resumes within this page
+                if remaining <= 0 and count_continuation_rows(results) > len(contents):
+                    next_params = None
+            yield Page(None, contents, next_params=next_params)
+        yield from iter_continuation_requests(
+            results,
+            continuation_type,
+            request_func,
+            parse_func,
+            ctoken_path,
+            reloadable,
+            additional_params,
+            prefetch,
+            remaining,
+        )
+
+    return ContinuationIterator(source, pages(), start)
+
+
 def get_validated_continuations(
-    results, continuation_type, limit, per_page, request_func, parse_func, ctoken_path=""
+    results,
+    continuation_type,
+    limit,
+    per_page,
+    request_func,
+    parse_func,
+    ctoken_path="",
+    executor=None,
+    hedge_after=None,
+    stats=None,
+    items=None,
 ):
-    items = []
+    items = [] if items is None else items
     while "continuations" in results and len(items) < limit:
         additional_params = get_continuation_params(results, ctoken_path)
         wrapped_parse_func = lambda raw_response: get_parsed_continuation_items(
@@ -36,12 +317,19 @@ def get_validated_continuations(
         validate_func = lambda parsed: validate_response(parsed, per_page, limit, len(items))
 
         response = resend_request_until_parsed_response_is_valid(
-            request_func, additional_params, wrapped_parse_func, validate_func, 3
+            request_func,
+            additional_params,
+            wrapped_parse_func,
+            validate_func,
+            3,
+            executor,
+            hedge_after,
+            stats,
         )
         results = response["results"]
         items.extend(response["parsed"])
 
-    return items
+    return items[:limit]
 
 
 def get_parsed_continuation_items(response, parse_func, continuation_type):
@@ -63,30 +351,153 @@ def get_continuation_string(ctoken):
     return "&ctoken=" + ctoken + "&continuation=" + ctoken
 
 
-def get_continuation_contents(continuation, parse_func):
+def get_continuation_contents(continuation, parse_func, limit=None):
+    for term in ["contents", "items"]:
+        if term in continuation:
+            return parse_limited(continuation[term], parse_func, limit)
+
+    return []
+
+
+def get_continuation_rows(continuation):
     for term in ["contents", "items"]:
         if term in continuation:
-            return parse_func(continuation[term])
+            return continuation[term]
 
     return []
 
 
+def count_continuation_rows(continuation):
+    return len(get_continuation_rows(continuation))
+
+
+def parse_limited(rows, parse_func, limit):
+    """Parse rows until limit items were parsed, leaving the remaining rows unparsed. None parses all rows."""
+    return parse_limited_rows(rows, parse_func, limit)[0]
+
+
+def parse_limited_rows(rows, parse_func, limit):
+    """Like :py:func:`parse_limited`, also returning the number of rows that were parsed"""
+    if limit is None:
+        return parse_func(rows), len(rows)
+    parsed = min(limit, len(rows))
+    items = parse_func(rows[:parsed])
+    # parse functions skip unavailable rows, so a slice may yield fewer items than rows
+    if len(items) < limit and parsed < len(rows) and not hasattr(items, "extend"):
+        items = list(items)  # lazy tracks are read-only, other containers such as columns keep their type
+    while len(items) < limit and parsed < len(rows):
+        end = min(parsed + limit - len(items), len(rows))
+        items.extend(parse_func(rows[parsed:end]))
+        parsed = end
+
+    return items[:limit] if len(items) > limit else items, parsed
+
+
 def resend_request_until_parsed_response_is_valid(
-    request_func, request_additional_params, parse_func, validate_func, max_retries
+    request_func,
+    request_additional_params,
+    parse_func,
+    validate_func,
+    max_retries,
+    executor=None,
+    hedge_after=None,
+    stats=None,
 ):
+    """
+    Send a request again while its parsed response is invalid, keeping the longest response.
+    With an executor and hedge_after, requests are hedged: a duplicate is sent whenever no response
+    arrived within hedge_after seconds or the last one was invalid, and the first valid response wins.
+    """
+    if executor is not None and hedge_after is not None:
+        return request_hedged(
+            request_func,
+            request_additional_params,
+            parse_func,
+            validate_func,
+            max_retries,
+            executor,
+            hedge_after,
+            stats,
+        )
+
     response = request_func(request_additional_params)
     parsed_object = parse_func(response)
     retry_counter = 0
-    while not validate_func(parsed_object) and retry_counter < max_retries:
+    valid = validate_func(parsed_object)
+    while not valid and retry_counter < max_retries:
+        if stats is not None:
+            stats.record(short=1, retries=1)
         response = request_func(request_additional_params)
         attempt = parse_func(response)
         if len(attempt["parsed"]) > len(parsed_object["parsed"]):
             parsed_object = attempt
         retry_counter += 1
+        valid = validate_func(attempt)
 
+    if stats is not None:
+        stats.record(pages=1, short=0 if valid else 1, unresolved=0 if valid else 1)
     return parsed_object
 
 
+def request_hedged(
+    request_func,
+    request_additional_params,
+    parse_func,
+    validate_func,
+    max_retries,
+    executor,
+    hedge_after,
+    stats,
+):
+    pending: Set[Future] = set()
+    sent = 0
+    best = None
+    error: Optional[BaseException] = None
+
+    def send():
+        nonlocal sent
+        sent += 1
+        pending.add(executor.submit(lambda: parse_func(request_func(request_additional_params))))
+
+    send()
+    try:
+        while pending:
+            done, _ = wait(pending, hedge_after if sent <= max_retries else None, FIRST_COMPLETED)
+            if not done:  # the response is late, race a duplicate against it
+                if stats is not None:
+                    stats.record(hedges=1)
+                send()
+                continue
+            for future in done:
+                pending.discard(future)
+                try:
+                    parsed_object = future.result()
+                except Exception as e:  # a hedge still in flight may succeed
+                    error = error or e
+                    continue
+                if validate_func(parsed_object):
+                    if stats is not None:
+                        stats.record(pages=1)
+                    return parsed_object
+                if stats is not None:
+                    stats.record(short=1)
+                if best is None or len(parsed_object["parsed"]) > len(best["parsed"]):
+                    best = parsed_object
+            if not pending and sent <= max_retries:
+                if stats is not None:
+                    stats.record(retries=1)
+                send()
+    finally:
+        for future in pending:  # responses of running requests are ignored
+            future.cancel()
+
+    if best is None:
+        raise error  # type: ignore[misc]
+    if stats is not None:
+        stats.record(pages=1, unresolved=1)
+    return best
+
+
 def validate_response(response, per_page, limit, current_count):
     remaining_items_count = limit - current_count
     expected_items_count = min(per_page, remaining_items_count)
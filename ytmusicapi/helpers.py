@@ -6,8 +6,14 @@ import unicodedata
 from hashlib import sha1
 from http.cookies import SimpleCookie
 
+from ytmusicapi import bootstrap
 from ytmusicapi.constants import *
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 def initialize_headers():
     return {
@@ -15,7 +21,6 @@ def initialize_headers():
         "accept": "*/*",
         "accept-encoding": "gzip, deflate",
         "content-type": "application/json",
-        "content-encoding": "gzip",
         "origin": YTM_DOMAIN,
     }
 
@@ -32,14 +37,28 @@ def initialize_context():
     }
 
 
+def json_loads(data):
+    """
+    Parse JSON directly from the response bytes, without decoding them to text first.
+    Uses orjson if it is installed (``pip install ytmusicapi[orjson]``).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # i.e. lone surrogate escapes, which the standard library accepts
+    return json.loads(data)
+
+
+def json_dumps(body) -> bytes:
+    """Serialize a request body to compact UTF-8 JSON, using orjson if it is installed."""
+    if orjson is not None:
+        return orjson.dumps(body)
+    return json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
 def get_visitor_id(request_func):
-    response = request_func(YTM_DOMAIN)
-    matches = re.findall(r"ytcfg\.set\s*\(\s*({.+?})\s*\)\s*;", response.text)
-    visitor_id = ""
-    if len(matches) > 0:
-        ytcfg = json.loads(matches[0])
-        visitor_id = ytcfg.get("VISITOR_DATA")
-    return {"X-Goog-Visitor-Id": visitor_id}
+    return {"X-Goog-Visitor-Id": bootstrap.shared.get(request_func).visitor_id}
 
 
 def sapisid_from_cookie(raw_cookie):
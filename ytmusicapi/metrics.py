@@ -0,0 +1,67 @@
+"""counters describing the requests of a YTMusic instance"""
+
+import threading
+from dataclasses import dataclass, field
+
+
+@dataclass
+class RequestTimings:
+    """
+    Cumulative time spent in :py:meth:`YTMusicBase._send_request`, split into waiting for the
+    network and decoding the JSON response, to tell slow connections from expensive parsing.
+    """
+
+    requests: int = 0  #: responses received from the transport
+    cached: int = 0  #: responses served from the response cache
+    network: float = 0.0  #: seconds spent sending requests and receiving responses
+    decode: float = 0.0  #: seconds spent decoding JSON responses
+    bytes: int = 0  #: size of the decoded response bodies
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, network: float, decode: float, size: int, cached: bool = False) -> None:
+        """Add the timing of a single response."""
+        with self._lock:
+            if cached:
+                self.cached += 1
+            else:
+                self.requests += 1
+            self.network += network
+            self.decode += decode
+            self.bytes += size
+
+    def reset(self) -> None:
+        """Set all counters to zero."""
+        with self._lock:
+            self.requests = self.cached = self.bytes = 0
+            self.network = self.decode = 0.0
+
+
+@dataclass
+class ValidationStats:
+    """
+    Outcome of the pages requested with ``validate_responses=True``, to tell how often
+    YouTube Music returns short pages and what retrying and hedging them costs.
+    """
+
+    pages: int = 0  #: validated pages
+    short: int = 0  #: responses with fewer items than expected
+    retries: int = 0  #: requests sent again after a short response or an error
+    hedges: int = 0  #: duplicate requests sent because a response took longer than ``hedge_after``
+    unresolved: int = 0  #: pages still short after all retries, the longest response is used
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(
+        self, pages: int = 0, short: int = 0, retries: int = 0, hedges: int = 0, unresolved: int = 0
+    ) -> None:
+        """Add the outcome of a request."""
+        with self._lock:
+            self.pages += pages
+            self.short += short
+            self.retries += retries
+            self.hedges += hedges
+            self.unresolved += unresolved
+
+    def reset(self) -> None:
+        """Set all counters to zero."""
+        with self._lock:
+            self.pages = self.short = self.retries = self.hedges = self.unresolved = 0
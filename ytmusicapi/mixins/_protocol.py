@@ -1,10 +1,13 @@
 """protocol that defines the functions available to mixins"""
-from typing import Dict, Optional, Protocol
 
-from requests import Response
+from concurrent.futures import Executor
+from typing import Dict, Optional, Protocol
 
 from ytmusicapi.auth.types import AuthType
+from ytmusicapi.cache import ResponseCache
+from ytmusicapi.metrics import ValidationStats
 from ytmusicapi.parsers.i18n import Parser
+from ytmusicapi.transport import Transport, TransportResponse
 
 
 class MixinProtocol(Protocol):
@@ -16,15 +19,34 @@ class MixinProtocol(Protocol):
 
     proxies: Optional[Dict[str, str]]
 
+    _transport: Transport
+
+    cache: Optional[ResponseCache]
+
+    hedge_after: Optional[float]
+
+    validation_stats: ValidationStats
+
     def _check_auth(self, specific_type: Optional[AuthType] = None) -> None:
         """checks if self has authentication"""
 
     def _send_request(self, endpoint: str, body: Dict, additional_params: str = "") -> Dict:
         """for sending post requests to YouTube Music"""
 
-    def _send_get_request(self, url: str, params: Optional[Dict] = None) -> Response:
+    def _prepare_headers(self) -> None:
+        """sets up the shared headers before requests are sent concurrently"""
+
+    def _send_get_request(self, url: str, params: Optional[Dict] = None) -> TransportResponse:
         """for sending get requests to YouTube Music"""
 
+    @property
+    def _prefetcher(self) -> Optional[Executor]:
+        """executor requesting continuations ahead, if enabled"""
+
+    @property
+    def _hedger(self) -> Optional[Executor]:
+        """executor racing duplicate requests, if enabled"""
+
     @property
     def headers(self) -> Dict[str, str]:
         """property for getting request headers"""
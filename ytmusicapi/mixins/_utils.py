@@ -22,6 +22,24 @@ def validate_order_parameter(order):
         )
 
 
+def validate_track_format(track_format, columns=True):
+    track_formats = ["dict", "lazy", "record", "model"] + (["columns"] if columns else [])
+    if track_format not in track_formats:
+        raise Exception(
+            "Invalid track_format provided. Please use one of the following formats: "
+            + ", ".join(track_formats)
+        )
+
+
+def validate_result_format(result_format):
+    result_formats = ["dict", "model"]
+    if result_format not in result_formats:
+        raise Exception(
+            "Invalid result_format provided. Please use one of the following formats: "
+            + ", ".join(result_formats)
+        )
+
+
 def prepare_order_params(order):
     orders = ["a_to_z", "z_to_a", "recently_added"]
     if order is not None:
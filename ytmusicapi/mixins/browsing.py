@@ -1,21 +1,28 @@
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
+from ytmusicapi import bootstrap
+from ytmusicapi.bulk import BulkResult, fetch_concurrently
 from ytmusicapi.continuations import (
+    ContinuationIterator,
+    cursor_source,
     get_continuations,
     get_reloadable_continuation_params,
+    paginate,
+    parse_limited,
 )
 from ytmusicapi.helpers import YTM_DOMAIN
 from ytmusicapi.parsers.albums import parse_album_header
 from ytmusicapi.parsers.browsing import parse_album, parse_content_list, parse_mixed_content, parse_playlist
 from ytmusicapi.parsers.library import parse_albums
-from ytmusicapi.parsers.playlists import parse_playlist_items
+from ytmusicapi.parsers.playlists import PLAYLIST_ITEM_FIELDS, parse_playlist_items
+from ytmusicapi.parsers.songs import parse_video_details
 
-from ..models import CoreTrack
+from ..models import Album, Artist, CoreTrack
 from ..navigation import *
-from ..parsers.utils import get_ext, parse_real_count  # protected ?
+from ..parsers.utils import get_ext, parse_real_count, select_fields  # protected ?
 from ._protocol import MixinProtocol
-from ._utils import get_datestamp
+from ._utils import get_datestamp, validate_result_format, validate_track_format
 
 
 class BrowsingMixin(MixinProtocol):
@@ -108,9 +115,9 @@ class BrowsingMixin(MixinProtocol):
         endpoint = "browse"
         body = {"browseId": "FEmusic_home"}
         response = self._send_request(endpoint, body)
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
+        results = nav(response, SINGLE_COLUMN_SECTION_LIST)
         home = []
-        home.extend(parse_mixed_content(results))
+        home.extend(parse_limited(results, parse_mixed_content, limit))
 
         section_list = nav(response, SINGLE_COLUMN_TAB + ["sectionListRenderer"])
         if "continuations" in section_list:
@@ -120,13 +127,49 @@ class BrowsingMixin(MixinProtocol):
 
             home.extend(
                 get_continuations(
-                    section_list, "sectionListContinuation", limit - len(home), request_func, parse_func
+                    section_list,
+                    "sectionListContinuation",
+                    limit - len(home),
+                    request_func,
+                    parse_func,
+                    prefetch=self._prefetcher,
                 )
             )
 
         return home
 
-    def get_artist(self, channel_id: str) -> Dict:
+    def iter_home(self, cursor: Optional[str] = None) -> ContinuationIterator:
+        """
+        Iterate over all sections of the home page, like the ones returned by :py:func:`get_home`.
+        The next page of sections is only requested once the previous sections were consumed.
+
+        :param cursor: Optional. Value of the ``cursor`` attribute of a previous iterator,
+            to resume after the last section it returned. See :py:func:`iter_playlist_tracks`
+        :return: Iterator of sections. See :py:func:`get_home`
+        """
+        endpoint = "browse"
+        body = {"browseId": "FEmusic_home"}
+
+        request_func = lambda additional_params: self._send_request(endpoint, body, additional_params)
+        parse_func = lambda contents: parse_mixed_content(contents)
+
+        def first_page(limit):
+            response = self._send_request(endpoint, body)
+            section_list = nav(response, SINGLE_COLUMN_TAB + ["sectionListRenderer"])
+            rows = nav(response, SINGLE_COLUMN_SECTION_LIST)
+            return section_list, parse_limited(rows, parse_func, limit)
+
+        return paginate(
+            cursor_source(endpoint, body),
+            cursor,
+            first_page,
+            "sectionListContinuation",
+            request_func,
+            parse_func,
+            prefetch=self._prefetcher,
+        )
+
+    def get_artist(self, channel_id: str, result_format: str = "dict") -> Union[Dict, Artist]:
         """
         Get information about an artist and their top releases (songs,
         albums, singles, videos, and related artists). The top lists
@@ -136,6 +179,8 @@ class BrowsingMixin(MixinProtocol):
         For albums/singles, pass browseId and params to :py:func:`get_artist_albums`.
 
         :param channel_id: channel id of the artist
+        :param result_format: ``dict`` for a dictionary or ``model`` for an :py:class:`~ytmusicapi.models.Artist`
+            model, see :py:meth:`~ytmusicapi.models.FlexSchema.from_parsed`. Default: dict
         :return: Dictionary with requested information.
 
         .. warning::
@@ -218,8 +263,9 @@ class BrowsingMixin(MixinProtocol):
                 }
             }
         """
+        validate_result_format(result_format)
         response = self._send_request("browse", {"browseId": channel_id.lstrip("MPLA")})
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
+        results = nav(response, SINGLE_COLUMN_SECTION_LIST)
 
         artist: Dict[str, Any] = {"description": None}
         header = response["header"]["musicImmersiveHeaderRenderer"]
@@ -258,7 +304,21 @@ class BrowsingMixin(MixinProtocol):
         artist["thumbnails"] = nav(header, THUMBNAILS, True)
 
         artist = self.parser.append_channel_contents(artist, results)
-        return artist
+        return Artist.from_parsed(artist) if result_format == "model" else artist
+
+    def get_artists(self, channel_ids: Iterable[str], max_workers: int = 8) -> Iterator[BulkResult]:
+        """
+        Fetch many artists concurrently with :py:func:`get_artist`, on a pool of up to ``max_workers`` threads.
+        Results are yielded as soon as each artist is complete, failing artists are reported with
+        their exception instead of stopping the others. See :py:func:`get_playlists`
+
+        :param channel_ids: Channel ids of the artists
+        :param max_workers: Maximum number of artists requested at the same time. Default: 8
+        :return: Iterator of :py:class:`~ytmusicapi.bulk.BulkResult` tuples of the channel id,
+            the dictionary returned by :py:func:`get_artist` and the exception raised for the artist.
+        """
+        self._prepare_headers()
+        return fetch_concurrently(self.get_artist, channel_ids, max_workers)
 
     def get_artist_albums(
         self, ext: Dict, limit: Optional[int] = 100, order: Optional[str] = None
@@ -274,12 +334,65 @@ class BrowsingMixin(MixinProtocol):
 
         """
         extension = {"browseId": ext["browse_id"], "params": ext["params"]}
-        endpoint = "browse"
-        response = self._send_request(endpoint, extension)
+        request_func = lambda additionalParams: self._send_request("browse", extension, additionalParams)
+        results = self._artist_albums_results(request_func, order)
+        parse_func = lambda contents: parse_albums(contents)
+        contents = nav(results, GRID_ITEMS, True) or nav(results, CAROUSEL_CONTENTS)
+        albums = parse_limited(contents, parse_func, limit)
+
+        results = nav(results, GRID, True)
+        if "continuations" in results:
+            remaining_limit = None if limit is None else (limit - len(albums))
+            albums.extend(
+                get_continuations(
+                    results,
+                    "gridContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_func,
+                    prefetch=self._prefetcher,
+                )
+            )
+
+        return albums
+
+    def iter_artist_albums(
+        self, ext: Dict, order: Optional[str] = None, cursor: Optional[str] = None
+    ) -> ContinuationIterator:
+        """
+        Iterate over an artist's albums or singles page by page.
+        The next page is only requested once all albums of the previous page were consumed.
+
+        :param ext: dictionary containing browse_id and params by :py:func:`get_artist`
+        :param order: Order of albums to return. Allowed values: 'Recency', 'Popularity', 'Alphabetical order'. Default: Default order.
+        :param cursor: Optional. Value of the ``cursor`` attribute of a previous iterator with the same arguments,
+            to resume after the last album it returned. See :py:func:`iter_playlist_tracks`
+        :return: Iterator of albums in the format of :py:func:`get_artist_albums`
+        """
+        extension = {"browseId": ext["browse_id"], "params": ext["params"]}
+        request_func = lambda additionalParams: self._send_request("browse", extension, additionalParams)
 
-        request_func = lambda additionalParams: self._send_request(endpoint, extension, additionalParams)
         parse_func = lambda contents: parse_albums(contents)
 
+        def first_page(limit):
+            results = self._artist_albums_results(request_func, order)
+            contents = nav(results, GRID_ITEMS, True) or nav(results, CAROUSEL_CONTENTS)
+            return nav(results, GRID, True) or {}, parse_limited(contents, parse_func, limit)
+
+        return paginate(
+            cursor_source("browse", extension, order),
+            cursor,
+            first_page,
+            "gridContinuation",
+            request_func,
+            parse_func,
+            prefetch=self._prefetcher,
+        )
+
+    def _artist_albums_results(self, request_func: Callable, order: Optional[str]) -> Any:
+        """first page of an artist's albums in the requested order"""
+        response = request_func("")
+
         # todo: change to a mapping
         if order:
             # pick the correct continuation from response depending on the order chosen
@@ -327,19 +440,9 @@ class BrowsingMixin(MixinProtocol):
 
         else:
             # just use the results from the first request
-            results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM)
+            results = nav(response, SINGLE_COLUMN_SECTION_LIST_ITEM)
 
-        contents = nav(results, GRID_ITEMS, True) or nav(results, CAROUSEL_CONTENTS)
-        albums = parse_albums(contents)
-
-        results = nav(results, GRID, True)
-        if "continuations" in results:
-            remaining_limit = None if limit is None else (limit - len(albums))
-            albums.extend(
-                get_continuations(results, "gridContinuation", remaining_limit, request_func, parse_func)
-            )
-
-        return albums
+        return results
 
     def get_user(self, channel_id: str) -> Dict:
         """
@@ -395,7 +498,7 @@ class BrowsingMixin(MixinProtocol):
             "name": nav(response, ["header", "musicVisualHeaderRenderer"] + TITLE_TEXT),
             "page_type": "user",
         }
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
+        results = nav(response, SINGLE_COLUMN_SECTION_LIST)
         user = self.parser.append_channel_contents(user, results)
         return user
 
@@ -409,7 +512,7 @@ class BrowsingMixin(MixinProtocol):
 
         """
         response = self._send_request("browse", {"browseId": ext["browse_id"], "params": ext["params"]})
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + GRID_ITEMS, True)
+        results = nav(response, SINGLE_COLUMN_SECTION_LIST_ITEM + GRID_ITEMS, True)
         if not results:
             return []
 
@@ -427,18 +530,24 @@ class BrowsingMixin(MixinProtocol):
         params = {"list": playlist_id}
         response = self._send_get_request(YTM_DOMAIN + "/playlist", params)
 
-        matches = re.search(r"\"MPRE.+?\"", response.text.encode("utf8").decode("unicode_escape"))
+        # the id is quoted in escaped javascript (\x22MPRE...\x22), ids never contain escapes
+        matches = re.search(rb'(?:"|\\x22)(MPRE[\w-]+)', response.content)
         browse_id = None
         if matches:
-            browse_id = matches.group().strip('"')
+            browse_id = matches.group(1).decode()
         return browse_id
 
-    def get_album(self, browse_id: str) -> Dict:
+    def get_album(
+        self, browse_id: str, fields: Optional[Iterable[str]] = None, track_format: str = "dict"
+    ) -> Union[Dict, Album]:
         """
         Get information and tracks of an album
 
         :param browse_id: browseId of the album, for example
             returned by :py:func:`search`
+        :param fields: Optional. Keys to return for each track. See :py:func:`get_playlist`
+        :param track_format: Format of the tracks, ``dict``, ``lazy``, ``record``, ``model`` or ``columns``.
+            See :py:func:`get_playlist`. With ``model``, the album is an :py:class:`~ytmusicapi.models.Album` model.
         :return: Dictionary with album and track metadata.
 
         Each track is in the following format::
@@ -493,22 +602,47 @@ class BrowsingMixin(MixinProtocol):
               "duration_seconds": 4657
             }
         """
-
+        selected = select_fields(fields, PLAYLIST_ITEM_FIELDS)
+        validate_track_format(track_format)
         response = self._send_request("browse", {"browseId": browse_id})
         album = parse_album_header(response)
         album["browse_id"] = browse_id
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + MUSIC_SHELF)
-        album["tracks"] = parse_playlist_items(results["contents"], context=album)
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST + [1] + CAROUSEL, True)
+        results = nav(response, SINGLE_COLUMN_SECTION_LIST_ITEM + MUSIC_SHELF)
+        album["tracks"] = parse_playlist_items(
+            results["contents"], context=album, fields=selected, track_format=track_format
+        )
+        results = nav(response, SINGLE_COLUMN_SECTION_LIST + [1] + CAROUSEL, True)
         if results is not None:
             album["other_versions"] = parse_content_list(results["contents"], parse_album)
         # album["duration_s"] = sum_total_duration(album)
 
-        return album
+        return Album.from_parsed(album) if track_format == "model" else album
+
+    def get_albums(self, browse_ids: Iterable[str], max_workers: int = 8) -> Iterator[BulkResult]:
+        """
+        Fetch many albums concurrently with :py:func:`get_album`, on a pool of up to ``max_workers`` threads.
+        Results are yielded as soon as each album is complete, failing albums are reported with
+        their exception instead of stopping the others. See :py:func:`get_playlists`
+
+        :param browse_ids: browseIds of the albums
+        :param max_workers: Maximum number of albums requested at the same time. Default: 8
+        :return: Iterator of :py:class:`~ytmusicapi.bulk.BulkResult` tuples of the browseId,
+            the dictionary returned by :py:func:`get_album` and the exception raised for the album.
+        """
+        self._prepare_headers()
+        return fetch_concurrently(self.get_album, browse_ids, max_workers)
 
     def _player_response(self, video_id: str, signature_timestamp: Optional[int] = None):
         if not signature_timestamp:
-            signature_timestamp = get_datestamp() - 1
+            # value of the current player, its base.js is only downloaded on the first request per version
+            js_url = bootstrap.shared.get(self._send_get_request).js_url
+            if js_url:
+                try:
+                    signature_timestamp = bootstrap.shared.signature_timestamp(js_url, self._send_get_request)
+                except Exception:
+                    pass  # base.js couldn't be downloaded or parsed, the current date is used instead
+            if not signature_timestamp:
+                signature_timestamp = get_datestamp() - 1
 
         params = {
             "playbackContext": {"contentPlaybackContext": {"signatureTimestamp": signature_timestamp}},
@@ -522,7 +656,8 @@ class BrowsingMixin(MixinProtocol):
 
         :param video_id: Video id
         :param signature_timestamp: Provide the current YouTube signatureTimestamp.
-            If not provided a default value will be used, which might result in invalid streaming URLs
+            If not provided, the cached value of the current player is used. The first request for a new
+            player version downloads its base.js before the song is requested
         :return: Dictionary with song metadata.
 
         Example::
@@ -696,7 +831,10 @@ class BrowsingMixin(MixinProtocol):
         return response
 
     def get_track(self, video_id: str):
-        return CoreTrack(**self._player_response(video_id)["videoDetails"])
+        # the values are converted by the parser, so the model is built without validation
+        return CoreTrack.model_construct(
+            **parse_video_details(self._player_response(video_id)["videoDetails"])
+        )
 
     def get_song_related(self, browse_id: str):
         """
@@ -814,12 +952,11 @@ class BrowsingMixin(MixinProtocol):
 
         :return: URL to `base.js`
         """
-        response = self._send_get_request(url=YTM_DOMAIN)
-        match = re.search(r'jsUrl"\s*:\s*"([^"]+)"', response.text)
-        if match is None:
+        js_url = bootstrap.shared.get(self._send_get_request).js_url
+        if js_url is None:
             raise Exception("Could not identify the URL for base.js player.")
 
-        return YTM_DOMAIN + match.group(1)
+        return js_url
 
     def get_signature_timestamp(self, url: Optional[str] = None) -> int:
         """
@@ -828,16 +965,12 @@ class BrowsingMixin(MixinProtocol):
 
         :param url: Optional. Provide the URL of the `base.js` script. If this
             isn't specified a call will be made to :py:func:`get_basejs_url`.
+            The timestamp is cached per URL, so each player version is downloaded once.
         :return: `signatureTimestamp` string
         """
         if url is None:
             url = self.get_basejs_url()
-        response = self._send_get_request(url=url)
-        match = re.search(r"signatureTimestamp[:=](\d+)", response.text)
-        if match is None:
-            raise Exception("Unable to identify the signatureTimestamp.")
-
-        return int(match.group(1))
+        return bootstrap.shared.signature_timestamp(url, self._send_get_request)
 
     def get_taste_profile(self) -> Dict:
         """
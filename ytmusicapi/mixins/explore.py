@@ -52,7 +52,7 @@ class ExploreMixin(MixinProtocol):
         """
         sections: Dict[str, Any] = {}
         response = self._send_request("browse", {"browseId": "FEmusic_moods_and_genres"})
-        for section in nav(response, SINGLE_COLUMN_TAB + SECTION_LIST):
+        for section in nav(response, SINGLE_COLUMN_SECTION_LIST):
             title = nav(section, GRID + ["header", "gridHeaderRenderer"] + TITLE_TEXT)
             sections[title] = []
             for category in nav(section, GRID_ITEMS):
@@ -74,8 +74,8 @@ class ExploreMixin(MixinProtocol):
         response = self._send_request(
             "browse", {"browseId": "FEmusic_moods_and_genres_category", "params": params}
         )
-        for section in nav(response, SINGLE_COLUMN_TAB + SECTION_LIST):
-            path = []
+        for section in nav(response, SINGLE_COLUMN_SECTION_LIST):
+            path: List = []
             if "gridRenderer" in section:
                 path = GRID_ITEMS
             elif "musicCarouselShelfRenderer" in section:
@@ -193,7 +193,7 @@ class ExploreMixin(MixinProtocol):
             body["formData"] = {"selectedValues": [country]}
 
         response = self._send_request("browse", body)
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
+        results = nav(response, SINGLE_COLUMN_SECTION_LIST)
         charts: Dict[str, Any] = {"countries": {}}
         menu = nav(
             results[0],
@@ -1,10 +1,12 @@
 import warnings
 from random import randint
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Union
 
+from ytmusicapi.columns import TrackColumns
 from ytmusicapi.continuations import *
 from ytmusicapi.parsers.browsing import *
 from ytmusicapi.parsers.library import *
+from ytmusicapi.parsers.playlists import PLAYLIST_ITEM_FIELDS, parse_playlist_columns
 
 from ._protocol import MixinProtocol
 from ._utils import *
@@ -33,32 +35,50 @@ class LibraryMixin(MixinProtocol):
         response = self._send_request(endpoint, body)
 
         results = get_library_contents(response, GRID)
-        playlists = parse_content_list(results["items"][1:], parse_playlist)
+        parse_func = lambda contents: parse_content_list(contents, parse_playlist)
+        playlists = parse_limited(results["items"][1:], parse_func, limit)
 
         if "continuations" in results:
             request_func = lambda additional_params: self._send_request(endpoint, body, additional_params)
-            parse_func = lambda contents: parse_content_list(contents, parse_playlist)
             remaining_limit = None if limit is None else (limit - len(playlists))
             playlists.extend(
-                get_continuations(results, "gridContinuation", remaining_limit, request_func, parse_func)
+                get_continuations(
+                    results,
+                    "gridContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_func,
+                    prefetch=self._prefetcher,
+                )
             )
 
         return playlists
 
     def get_library_songs(
-        self, limit: int = 25, validate_responses: bool = False, order: Optional[str] = None
-    ) -> List[Dict]:
+        self,
+        limit: int = 25,
+        validate_responses: bool = False,
+        order: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        track_format: str = "dict",
+    ) -> Union[List[Dict], TrackColumns]:
         """
         Gets the songs in the user's library (liked videos are not included).
         To get liked songs and videos, use :py:func:`get_liked_songs`
 
         :param limit: Number of songs to retrieve
         :param validate_responses: Flag indicating if responses from YTM should be validated and retried in case
-            when some songs are missing. Default: False
+            when some songs are missing. Retries are sent concurrently if ``hedge_after`` is set on the instance,
+            their outcome is counted in ``validation_stats``. Default: False
         :param order: Order of songs to return. Allowed values: 'a_to_z', 'z_to_a', 'recently_added'. Default: Default order.
+        :param fields: Optional. Keys to return for each song. See :py:func:`get_playlist`
+        :param track_format: Format of the tracks, ``dict``, ``lazy``, ``record``, ``model`` or ``columns``.
+            See :py:func:`get_playlist`
         :return: List of songs. Same format as :py:func:`get_playlist`
         """
         self._check_auth()
+        selected = select_fields(fields, PLAYLIST_ITEM_FIELDS)
+        validate_track_format(track_format)
         body = {"browseId": "FEmusic_liked_videos"}
         validate_order_parameter(order)
         if order is not None:
@@ -67,7 +87,9 @@ class LibraryMixin(MixinProtocol):
         per_page = 25
 
         request_func = lambda additional_params: self._send_request(endpoint, body)
-        parse_func = lambda raw_response: parse_library_songs(raw_response)
+        parse_func = lambda raw_response: parse_library_songs(
+            raw_response, fields=selected, track_format=track_format
+        )
 
         if validate_responses and limit is None:
             raise Exception("Validation is not supported without a limit parameter.")
@@ -75,21 +97,34 @@ class LibraryMixin(MixinProtocol):
         if validate_responses:
             validate_func = lambda parsed: validate_response(parsed, per_page, limit, 0)
             response = resend_request_until_parsed_response_is_valid(
-                request_func, None, parse_func, validate_func, 3
+                request_func,
+                None,
+                parse_func,
+                validate_func,
+                3,
+                self._hedger,
+                self.hedge_after,
+                self.validation_stats,
             )
         else:
-            response = parse_func(request_func(None))
+            response = parse_library_songs(request_func(None), limit, selected, track_format)
 
         results = response["results"]
+        if response["parsed"] is None:
+            return parse_playlist_columns([], fields=selected) if track_format == "columns" else []
         songs = response["parsed"]
-        if songs is None:
-            return []
+        if validate_responses:  # validated first pages are parsed completely
+            songs = songs[:limit]
+        if not isinstance(songs, TrackColumns):  # lazy tracks are read-only
+            songs = list(songs)
 
         if "continuations" in results:
             request_continuations_func = lambda additional_params: self._send_request(
                 endpoint, body, additional_params
             )
-            parse_continuations_func = lambda contents: parse_playlist_items(contents)
+            parse_continuations_func = lambda contents: parse_playlist_items(
+                contents, fields=selected, track_format=track_format
+            )
 
             if validate_responses:
                 songs.extend(
@@ -100,22 +135,73 @@ class LibraryMixin(MixinProtocol):
                         per_page,
                         request_continuations_func,
                         parse_continuations_func,
+                        executor=self._hedger,
+                        hedge_after=self.hedge_after,
+                        stats=self.validation_stats,
+                        items=TrackColumns(songs.fields) if isinstance(songs, TrackColumns) else None,
                     )
                 )
             else:
                 remaining_limit = None if limit is None else (limit - len(songs))
-                songs.extend(
-                    get_continuations(
-                        results,
-                        "musicShelfContinuation",
-                        remaining_limit,
-                        request_continuations_func,
-                        parse_continuations_func,
-                    )
+                songs = get_continuations(
+                    results,
+                    "musicShelfContinuation",
+                    remaining_limit,
+                    request_continuations_func,
+                    parse_continuations_func,
+                    prefetch=self._prefetcher,
+                    items=songs,
                 )
 
         return songs
 
+    def iter_library_songs(
+        self,
+        order: Optional[str] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        track_format: str = "dict",
+    ) -> ContinuationIterator:
+        """
+        Iterate over all songs in the user's library page by page.
+        The next page is only requested once all songs of the previous page were consumed.
+
+        :param order: Order of songs to return. Allowed values: 'a_to_z', 'z_to_a', 'recently_added'. Default: Default order.
+        :param cursor: Optional. Value of the ``cursor`` attribute of a previous iterator with the same order,
+            to resume after the last song it returned. See :py:func:`iter_playlist_tracks`
+        :param fields: Optional. Keys to return for each song. See :py:func:`get_playlist`
+        :param track_format: Format of the tracks, ``dict``, ``lazy``, ``record`` or ``model``. See :py:func:`get_playlist`
+        :return: Iterator of songs. Same format as :py:func:`get_playlist`
+        """
+        self._check_auth()
+        selected = select_fields(fields, PLAYLIST_ITEM_FIELDS)
+        validate_track_format(track_format, columns=False)
+        body = {"browseId": "FEmusic_liked_videos"}
+        validate_order_parameter(order)
+        if order is not None:
+            body["params"] = prepare_order_params(order)
+        endpoint = "browse"
+
+        def first_page(limit):
+            response = parse_library_songs(self._send_request(endpoint, body), limit, selected, track_format)
+            if response["parsed"] is None:
+                return None
+            return response["results"], response["parsed"]
+
+        request_func = lambda additional_params: self._send_request(endpoint, body, additional_params)
+        parse_func = lambda contents: parse_playlist_items(
+            contents, fields=selected, track_format=track_format
+        )
+        return paginate(
+            cursor_source(endpoint, body),
+            cursor,
+            first_page,
+            "musicShelfContinuation",
+            request_func,
+            parse_func,
+            prefetch=self._prefetcher,
+        )
+
     def get_library_albums(self, limit: int = 25, order: Optional[str] = None) -> List[Dict]:
         """
         Gets the albums in the user's library.
@@ -148,7 +234,48 @@ class LibraryMixin(MixinProtocol):
         endpoint = "browse"
         response = self._send_request(endpoint, body)
         return parse_library_albums(
-            response, lambda additional_params: self._send_request(endpoint, body, additional_params), limit
+            response,
+            lambda additional_params: self._send_request(endpoint, body, additional_params),
+            limit,
+            prefetch=self._prefetcher,
+        )
+
+    def iter_library_albums(
+        self, order: Optional[str] = None, cursor: Optional[str] = None
+    ) -> ContinuationIterator:
+        """
+        Iterate over all albums in the user's library page by page.
+        The next page is only requested once all albums of the previous page were consumed.
+
+        :param order: Order of albums to return. Allowed values: 'a_to_z', 'z_to_a', 'recently_added'. Default: Default order.
+        :param cursor: Optional. Value of the ``cursor`` attribute of a previous iterator with the same order,
+            to resume after the last album it returned. See :py:func:`iter_playlist_tracks`
+        :return: Iterator of albums. Same format as :py:func:`get_library_albums`
+        """
+        self._check_auth()
+        body = {"browseId": "FEmusic_liked_albums"}
+        validate_order_parameter(order)
+        if order is not None:
+            body["params"] = prepare_order_params(order)
+        endpoint = "browse"
+
+        request_func = lambda additional_params: self._send_request(endpoint, body, additional_params)
+        parse_func = lambda contents: parse_albums(contents)
+
+        def first_page(limit):
+            results = get_library_contents(self._send_request(endpoint, body), GRID)
+            if results is None:
+                return None
+            return results, parse_limited(results["items"], parse_func, limit)
+
+        return paginate(
+            cursor_source(endpoint, body),
+            cursor,
+            first_page,
+            "gridContinuation",
+            request_func,
+            parse_func,
+            prefetch=self._prefetcher,
         )
 
     def get_library_artists(self, limit: int = 25, order: Optional[str] = None) -> List[Dict]:
@@ -176,7 +303,10 @@ class LibraryMixin(MixinProtocol):
         endpoint = "browse"
         response = self._send_request(endpoint, body)
         return parse_library_artists(
-            response, lambda additional_params: self._send_request(endpoint, body, additional_params), limit
+            response,
+            lambda additional_params: self._send_request(endpoint, body, additional_params),
+            limit,
+            prefetch=self._prefetcher,
         )
 
     def get_library_subscriptions(self, limit: int = 25, order: Optional[str] = None) -> List[Dict]:
@@ -195,21 +325,27 @@ class LibraryMixin(MixinProtocol):
         endpoint = "browse"
         response = self._send_request(endpoint, body)
         return parse_library_artists(
-            response, lambda additional_params: self._send_request(endpoint, body, additional_params), limit
+            response,
+            lambda additional_params: self._send_request(endpoint, body, additional_params),
+            limit,
+            prefetch=self._prefetcher,
         )
 
-    def get_history(self) -> List[Dict]:
+    def get_history(self, fields: Optional[Iterable[str]] = None) -> List[Dict]:
         """
         Gets your play history in reverse chronological order
 
+        :param fields: Optional. Keys to return for each item, including ``last_played`` and ``feedback_token``.
+          See :py:func:`get_playlist`
         :return: List of playlistItems, see :py:func:`get_playlist`
           The additional property ``played`` indicates when the playlistItem was played
           The additional property ``feedbackToken`` can be used to remove items with :py:func:`remove_history_items`
         """
         self._check_auth()
+        selected = select_fields(fields, PLAYLIST_ITEM_FIELDS | {"last_played", "feedback_token"})
 
         response = self._send_request("browse", {"browseId": "FEmusic_history"})
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
+        results = nav(response, SINGLE_COLUMN_SECTION_LIST)
         songs = []
         for content in results:
             data = nav(content, MUSIC_SHELF + ["contents"], True)
@@ -217,9 +353,10 @@ class LibraryMixin(MixinProtocol):
                 error = nav(content, ["musicNotifierShelfRenderer"] + TITLE, True)
                 raise Exception(error)
 
-            song_list = parse_playlist_items(data, MENU_ENTRIES)
-            for song in song_list:
-                song["last_played"] = nav(content["musicShelfRenderer"], TITLE_TEXT)
+            song_list = parse_playlist_items(data, MENU_ENTRIES, fields=selected)
+            if selected is None or "last_played" in selected:
+                for song in song_list:
+                    song["last_played"] = nav(content["musicShelfRenderer"], TITLE_TEXT)
 
             songs.extend(song_list)
 
@@ -320,7 +457,7 @@ class LibraryMixin(MixinProtocol):
         # self._check_auth()
 
         warnings.warn(
-            "API no longer allows multiple subs/unsubs in a single request, " "performing sequentially.",
+            "API no longer allows multiple subs/unsubs in a single request, performing sequentially.",
             DeprecationWarning,
         )
 
@@ -347,7 +484,7 @@ class LibraryMixin(MixinProtocol):
         # self._check_auth()
 
         warnings.warn(
-            "API no longer allows multiple subs/unsubs in a single request, " "performing sequentially.",
+            "API no longer allows multiple subs/unsubs in a single request, performing sequentially.",
             DeprecationWarning,
         )
 
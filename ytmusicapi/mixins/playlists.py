@@ -1,7 +1,10 @@
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
+from ytmusicapi.bulk import BulkResult, fetch_concurrently
+from ytmusicapi.columns import TrackColumns
 from ytmusicapi.continuations import *
 from ytmusicapi.helpers import to_int
+from ytmusicapi.models import Playlist
 from ytmusicapi.navigation import *
 from ytmusicapi.parsers.browsing import parse_content_list, parse_playlist
 from ytmusicapi.parsers.playlists import *
@@ -12,8 +15,14 @@ from ._utils import *
 
 class PlaylistsMixin(MixinProtocol):
     def get_playlist(
-        self, playlist_id: str, limit: int | None = 100, related: bool = False, suggestions_limit: int = 0
-    ) -> Dict:
+        self,
+        playlist_id: str,
+        limit: int | None = 100,
+        related: bool = False,
+        suggestions_limit: int = 0,
+        fields: Optional[Iterable[str]] = None,
+        track_format: str = "dict",
+    ) -> Union[Dict, Playlist]:
         """
         Returns a list of playlist items
 
@@ -23,8 +32,20 @@ class PlaylistsMixin(MixinProtocol):
         :param suggestions_limit: How many suggestions to return. The result is a list of
             suggested playlist items (videos) contained in a "suggestions" key.
             7 items are retrieved in each internal request. Default: 0
+        :param fields: Optional. Keys to return for each track and suggestion,
+            i.e. ``["video_id", "set_video_id", "duration_s"]``. Other keys are not parsed. Default: all keys
+        :param track_format: Format of the tracks and suggestions. ``dict`` for dictionaries, ``lazy`` for read-only
+            :py:class:`~ytmusicapi.tracks.LazyTrack` views parsing each key the first time it is read,
+            ``record`` for compact :py:class:`~ytmusicapi.records.TrackRecord` objects with the keys as
+            attributes, which use several times less memory, ``model`` for :py:class:`~ytmusicapi.models.Track`
+            models in a :py:class:`~ytmusicapi.models.Playlist` model instead of the dictionary,
+            see :py:meth:`~ytmusicapi.models.FlexSchema.from_parsed`, ``columns`` for a
+            :py:class:`~ytmusicapi.columns.TrackColumns` buffer per key, parsed without a dictionary per track
+            and convertible to Arrow tables or NumPy arrays. Default: dict
         :return: Dictionary with information about the playlist.
-            The key ``tracks`` contains a List of playlistItem dictionaries
+            The key ``tracks`` contains a List of playlistItem dictionaries.
+            If not all tracks were retrieved, ``cursor`` can be passed to :py:func:`iter_playlist_tracks`
+            to continue after the last track.
 
         Each item is in the following format::
 
@@ -60,6 +81,7 @@ class PlaylistsMixin(MixinProtocol):
                     "setVideoId": "to_be_updated_by_client"
                   }
               ],
+              "cursor": "WyI0ZjFh...",
               "related": [
                   {
                     "title": "Presenting MYRNE",
@@ -102,10 +124,13 @@ class PlaylistsMixin(MixinProtocol):
         The setVideoId is the unique id of this playlist item and
         needed for moving/removing playlist items
         """
+        selected = select_fields(fields, PLAYLIST_ITEM_FIELDS)
+        validate_track_format(track_format)
         body = {"browseId": "VL" + playlist_id if not playlist_id.startswith("VL") else playlist_id}
         endpoint = "browse"
+        source = cursor_source(endpoint, body)
         response = self._send_request(endpoint, body)
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + ["musicPlaylistShelfRenderer"])
+        results = nav(response, SINGLE_COLUMN_SECTION_LIST_ITEM + ["musicPlaylistShelfRenderer"])
         playlist = {"id": results["playlistId"]}
         own_playlist = "musicEditablePlaylistDetailHeaderRenderer" in response["header"]
         if not own_playlist:
@@ -153,23 +178,29 @@ class PlaylistsMixin(MixinProtocol):
         if "continuations" in section_list:
             additional_params = get_continuation_params(section_list)
             if own_playlist and (suggestions_limit > 0 or related):
-                parse_func = lambda results: parse_playlist_items(results)
+                parse_func = lambda results: parse_playlist_items(
+                    results, fields=selected, track_format=track_format
+                )
                 suggested = request_func(additional_params)
                 continuation = nav(suggested, SECTION_LIST_CONTINUATION)
                 additional_params = get_continuation_params(continuation)
                 suggestions_shelf = nav(continuation, CONTENT + MUSIC_SHELF)
-                playlist["suggestions"] = get_continuation_contents(suggestions_shelf, parse_func)
-
-                parse_func = lambda results: parse_playlist_items(results)
-                playlist["suggestions"].extend(
-                    get_continuations(
-                        suggestions_shelf,
-                        "musicShelfContinuation",
-                        suggestions_limit - len(playlist["suggestions"]),
-                        request_func,
-                        parse_func,
-                        reloadable=True,
-                    )
+                suggestions = get_continuation_contents(suggestions_shelf, parse_func)
+                if not isinstance(suggestions, TrackColumns):  # lazy tracks are read-only
+                    suggestions = list(suggestions)
+
+                parse_func = lambda results: parse_playlist_items(
+                    results, fields=selected, track_format=track_format
+                )
+                playlist["suggestions"] = get_continuations(
+                    suggestions_shelf,
+                    "musicShelfContinuation",
+                    suggestions_limit - len(suggestions),
+                    request_func,
+                    parse_func,
+                    reloadable=True,
+                    prefetch=self._prefetcher,
+                    items=suggestions,
                 )
 
             if related:
@@ -181,21 +212,121 @@ class PlaylistsMixin(MixinProtocol):
                         nav(continuation, CONTENT + CAROUSEL), parse_func
                     )
 
-        playlist["tracks"] = []
+        playlist["tracks"] = parse_playlist_columns([], fields=selected) if track_format == "columns" else []
+        playlist["cursor"] = None
         if "contents" in results:
-            playlist["tracks"] = parse_playlist_items(results["contents"])
-
-            # only get continuations when available AND required
-            if "continuations" in results and (limit is None or len(playlist["tracks"]) < limit):
-                parse_func = lambda contents: parse_playlist_items(contents)
-                playlist["tracks"].extend(
-                    get_continuations(
-                        results, "musicPlaylistShelfContinuation", limit, request_func, parse_func
-                    )
-                )
+            parse_func = lambda contents: parse_playlist_items(
+                contents, fields=selected, track_format=track_format
+            )
+            tracks = paginate(
+                source,
+                None,
+                lambda first_limit: (results, parse_limited(results["contents"], parse_func, first_limit)),
+                "musicPlaylistShelfContinuation",
+                request_func,
+                parse_func,
+                prefetch=self._prefetcher,
+                # only get continuations when available AND required
+                limit=limit,
+            )
+            # columns of the pages are merged, no rows are kept until the last page arrived
+            playlist["tracks"] = tracks.take_into(playlist["tracks"], limit)
+            playlist["cursor"] = tracks.cursor
 
         # playlist["duration_s"] = sum_total_duration(playlist)
-        return playlist
+        return Playlist.from_parsed(playlist) if track_format == "model" else playlist
+
+    def iter_playlist_tracks(
+        self,
+        playlist_id: str,
+        cursor: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        track_format: str = "dict",
+    ) -> ContinuationIterator:
+        """
+        Iterate over the tracks of a playlist page by page, so processing can start with the first page.
+        The next page is only requested once all tracks of the previous page were consumed.
+        An interrupted iteration can be resumed with the ``cursor`` attribute of the iterator::
+
+            tracks = ytmusic.iter_playlist_tracks(playlist_id)
+            for track in tracks:
+                save(track)
+                checkpoint = tracks.cursor
+            ...
+            remaining = ytmusic.iter_playlist_tracks(playlist_id, cursor=checkpoint)
+
+        :param playlist_id: Playlist id
+        :param cursor: Optional. Value of the ``cursor`` attribute of a previous iterator for this playlist,
+            or the ``cursor`` key returned by :py:func:`get_playlist`, to start at the next track.
+        :param fields: Optional. Keys to return for each track. See :py:func:`get_playlist`
+        :param track_format: Format of the tracks, ``dict``, ``lazy``, ``record`` or ``model``. See :py:func:`get_playlist`
+        :return: Iterator of playlistItem dictionaries. See :py:func:`get_playlist`
+        """
+        selected = select_fields(fields, PLAYLIST_ITEM_FIELDS)
+        validate_track_format(track_format, columns=False)
+        body = {"browseId": "VL" + playlist_id if not playlist_id.startswith("VL") else playlist_id}
+        endpoint = "browse"
+
+        request_func = lambda additional_params: self._send_request(endpoint, body, additional_params)
+        parse_func = lambda contents: parse_playlist_items(
+            contents, fields=selected, track_format=track_format
+        )
+
+        def first_page(limit):
+            response = self._send_request(endpoint, body)
+            results = nav(response, SINGLE_COLUMN_SECTION_LIST_ITEM + ["musicPlaylistShelfRenderer"])
+            if "contents" not in results:
+                return None
+            return results, parse_limited(results["contents"], parse_func, limit)
+
+        return paginate(
+            cursor_source(endpoint, body),
+            cursor,
+            first_page,
+            "musicPlaylistShelfContinuation",
+            request_func,
+            parse_func,
+            prefetch=self._prefetcher,
+        )
+
+    def get_playlists(
+        self,
+        playlist_ids: Iterable[str],
+        limit: Optional[int] = 100,
+        max_workers: int = 8,
+        fields: Optional[Iterable[str]] = None,
+        track_format: str = "dict",
+    ) -> Iterator[BulkResult]:
+        """
+        Fetch many playlists concurrently with :py:func:`get_playlist`, on a pool of up to
+        ``max_workers`` threads. Results are yielded as soon as each playlist is complete::
+
+            for playlist_id, playlist, error in ytmusic.get_playlists(playlist_ids, limit=None):
+                if error is None:
+                    save(playlist)
+
+        A failing playlist is reported with its exception instead of stopping the others.
+        Pending requests are cancelled if the iteration is stopped early.
+
+        :param playlist_ids: Playlist ids
+        :param limit: How many songs to return per playlist. `None` retrieves them all. Default: 100
+        :param max_workers: Maximum number of playlists requested at the same time. Default: 8
+        :param fields: Optional. Keys to return for each track. See :py:func:`get_playlist`
+        :param track_format: Format of the tracks, ``dict``, ``lazy``, ``record``, ``model`` or ``columns``.
+            See :py:func:`get_playlist`
+        :return: Iterator of :py:class:`~ytmusicapi.bulk.BulkResult` tuples of the playlist id,
+            the dictionary returned by :py:func:`get_playlist` and the exception raised for the playlist.
+        """
+        select_fields(fields, PLAYLIST_ITEM_FIELDS)
+        validate_track_format(track_format)
+        self._prepare_headers()
+        return fetch_concurrently(
+            lambda playlist_id: self.get_playlist(
+                playlist_id, limit, fields=fields, track_format=track_format
+            ),
+            playlist_ids,
+            max_workers,
+        )
 
     def get_liked_songs(self, limit: int | None = 100) -> Dict:
         """
@@ -204,7 +335,7 @@ class PlaylistsMixin(MixinProtocol):
         :param limit: How many items to return. Default: 100
         :return: List of playlistItem dictionaries. See :py:func:`get_playlist`
         """
-        return self.get_playlist("LM", limit)
+        return cast(Dict, self.get_playlist("LM", limit))
 
     def create_playlist(
         self,
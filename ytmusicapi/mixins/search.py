@@ -1,7 +1,16 @@
-from typing import Any, Dict, List, Optional, Union
-
-from ytmusicapi.continuations import get_continuations
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Union
+
+from ytmusicapi.continuations import (
+    ContinuationIterator,
+    Cursor,
+    Page,
+    cursor_source,
+    iter_continuation_requests,
+    parse_limited,
+)
 from ytmusicapi.mixins._protocol import MixinProtocol
+from ytmusicapi.mixins._utils import validate_result_format
+from ytmusicapi.models import SearchResult
 from ytmusicapi.parsers.search import *
 
 
@@ -13,7 +22,9 @@ class SearchMixin(MixinProtocol):
         scope: Optional[str] = None,
         limit: int = 20,
         ignore_spelling: bool = False,
-    ) -> List[Dict]:
+        fields: Optional[Iterable[str]] = None,
+        result_format: str = "dict",
+    ) -> Union[List[Dict], List[SearchResult]]:
         """
         Search YouTube music
         Returns results within the provided category.
@@ -32,6 +43,11 @@ class SearchMixin(MixinProtocol):
           If True, the exact search term will be searched for, and will not be corrected.
           This does not have any effect when the filter is set to ``uploads``.
           Default: False, will use YTM's default behavior of autocorrecting the search.
+        :param fields: Optional. Keys to return for each result, i.e. ``["result_type", "video_id"]``.
+          Other keys are not parsed. Default: all keys
+        :param result_format: ``dict`` for dictionaries or ``model`` for
+          :py:class:`~ytmusicapi.models.SearchResult` models, see :py:meth:`~ytmusicapi.models.FlexSchema.from_parsed`.
+          Default: dict
         :return: List of results depending on filter.
           resultType specifies the type of item (important for default search).
           albums, artists and playlists additionally contain a browseId, corresponding to
@@ -133,8 +149,60 @@ class SearchMixin(MixinProtocol):
 
 
         """
-        body = {"query": query}
+        validate_result_format(result_format)
         search_results: List[Dict[str, Any]] = []
+        selected = select_fields(fields, SEARCH_RESULT_FIELDS)
+        for page in self._search_pages(query, only, scope, ignore_spelling, limit, fields=selected):
+            search_results.extend(page.items)
+
+        if result_format == "model":
+            return [SearchResult.from_parsed(result) for result in search_results]
+        return search_results
+
+    def iter_search(
+        self,
+        query: str,
+        only: Optional[str] = None,
+        scope: Optional[str] = None,
+        ignore_spelling: bool = False,
+        cursor: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> ContinuationIterator:
+        """
+        Iterate over the results of :py:func:`search` without a limit.
+        With a filter, the next page of results is only requested once the previous page was consumed.
+
+        :param query: Query string, i.e. 'Oasis Wonderwall'
+        :param only: Filter for item types. See :py:func:`search`
+        :param scope: Search scope. See :py:func:`search`
+        :param ignore_spelling: Whether to ignore YTM spelling suggestions. Default: False
+        :param cursor: Optional. Value of the ``cursor`` attribute of a previous iterator with the same arguments,
+            to resume after the last result it returned. See :py:func:`iter_playlist_tracks`
+        :param fields: Optional. Keys to return for each result. See :py:func:`search`
+        :return: Iterator of results in the format of :py:func:`search`
+        """
+        selected = select_fields(fields, SEARCH_RESULT_FIELDS)
+        source = cursor_source("search", query, only, scope, ignore_spelling)
+        start = Cursor.loads(cursor, source) if cursor else None
+        pages = self._search_pages(query, only, scope, ignore_spelling, None, start, selected)
+        return ContinuationIterator(source, pages, start)
+
+    def _search_pages(
+        self,
+        query: str,
+        only: Optional[str],
+        scope: Optional[str],
+        ignore_spelling: bool,
+        limit: Optional[int],
+        start: Optional[Cursor] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Iterator[Page]:
+        """
+        parsed results of each shelf and continuation page, stopping continuations once limit is reached.
+        If start points to a continuation page, the pages start there.
+        """
+        body = {"query": query}
+        count = 0
         filters = [
             "albums",
             "artists",
@@ -177,11 +245,15 @@ class SearchMixin(MixinProtocol):
         if params:
             body["params"] = params
         endpoint = "search"
+        if start is not None and start.params is not None:
+            yield from self._search_continuations(body, start.context, {}, start.params, fields=fields)
+            return
+
         response = self._send_request(endpoint, body)
 
         # no results
         if "contents" not in response:
-            return search_results
+            return
 
         if "tabbedSearchResultsRenderer" in response["contents"]:
             tab_index = 0 if not scope or only else scopes.index(scope) + 1
@@ -195,7 +267,7 @@ class SearchMixin(MixinProtocol):
 
         # no results
         if len(results) == 1 and "itemSectionRenderer" in results:
-            return search_results
+            return
 
         # set filter for parser
         if only and "playlists" in only:
@@ -203,12 +275,12 @@ class SearchMixin(MixinProtocol):
         elif scope == scopes[1]:
             only = scopes[1]
 
+        search_result_types = self.parser.get_search_result_types()
         for res in results:
             if "musicCardShelfRenderer" in res:
-                top_result = parse_top_result(
-                    res["musicCardShelfRenderer"], self.parser.get_search_result_types()
-                )
-                search_results.append(top_result)
+                top_result = parse_top_result(res["musicCardShelfRenderer"], search_result_types, fields)
+                count += 1
+                yield Page(None, [top_result])
                 if results := nav(res, ["musicCardShelfRenderer", "contents"], True):
                     category = None
                     # category "more from youtube" is missing sometimes
@@ -230,28 +302,52 @@ class SearchMixin(MixinProtocol):
             else:
                 continue
 
-            search_result_types = self.parser.get_search_result_types()
-            search_results.extend(parse_search_results(results, search_result_types, result_type, category))
-
-            if only:  # if filter is set, there are continuations
-
-                def request_func(additional_params):
-                    return self._send_request(endpoint, body, additional_params)
-
-                def parse_func(contents):
-                    return parse_search_results(contents, search_result_types, result_type, category)
-
-                search_results.extend(
-                    get_continuations(
-                        res["musicShelfRenderer"],
-                        "musicShelfContinuation",
-                        limit - len(search_results),
-                        request_func,
-                        parse_func,
-                    )
-                )
-
-        return search_results
+            parse_func = lambda rows: parse_search_results(
+                rows, search_result_types, result_type, category, fields
+            )
+            # the limit only applies to filtered results, which have continuations
+            remaining = None if limit is None or not only else max(limit - count, 0)
+            contents = parse_limited(results, parse_func, remaining)
+            count += len(contents)
+            yield Page(None, contents)
+
+            if only and (remaining is None or len(contents) < remaining):
+                context = [result_type, category]
+                remaining = None if remaining is None else remaining - len(contents)
+                for page in self._search_continuations(
+                    body, context, res["musicShelfRenderer"], limit=remaining, fields=fields
+                ):
+                    count += len(page.items)
+                    yield page
+
+    def _search_continuations(
+        self,
+        body: Dict,
+        context: List,
+        results: Dict,
+        additional_params: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Iterator[Page]:
+        """continuation pages of a search shelf, context holds the result type and category of the shelf"""
+        search_result_types = self.parser.get_search_result_types()
+
+        def request_func(additional_params):
+            return self._send_request("search", body, additional_params)
+
+        def parse_func(contents):
+            return parse_search_results(contents, search_result_types, *context, fields)
+
+        for page in iter_continuation_requests(
+            results,
+            "musicShelfContinuation",
+            request_func,
+            parse_func,
+            additional_params=additional_params,
+            prefetch=self._prefetcher,
+            limit=limit,
+        ):
+            yield page._replace(context=context)
 
     def get_search_suggestions(self, query: str, detailed_runs=False) -> Union[List[str], List[Dict]]:
         """
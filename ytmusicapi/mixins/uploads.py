@@ -2,9 +2,7 @@ import ntpath
 import os
 from typing import Dict, List, Optional, Union
 
-import requests
-
-from ytmusicapi.continuations import get_continuations
+from ytmusicapi.continuations import get_continuations, parse_limited
 from ytmusicapi.helpers import *
 from ytmusicapi.navigation import *
 from ytmusicapi.parsers.albums import parse_album_header
@@ -15,6 +13,7 @@ from ytmusicapi.parsers.library import (
     pop_songs_random_mix,
 )
 from ytmusicapi.parsers.uploads import parse_uploaded_items
+from ytmusicapi.transport import TransportResponse
 
 from ..auth.types import AuthType
 from ._protocol import MixinProtocol
@@ -56,14 +55,19 @@ class UploadsMixin(MixinProtocol):
         if results is None:
             return []
         pop_songs_random_mix(results)
-        songs = parse_uploaded_items(results["contents"])
+        songs = parse_limited(results["contents"], parse_uploaded_items, limit)
 
         if "continuations" in results:
             request_func = lambda additional_params: self._send_request(endpoint, body, additional_params)
             remaining_limit = None if limit is None else (limit - len(songs))
             songs.extend(
                 get_continuations(
-                    results, "musicShelfContinuation", remaining_limit, request_func, parse_uploaded_items
+                    results,
+                    "musicShelfContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_uploaded_items,
+                    prefetch=self._prefetcher,
                 )
             )
 
@@ -85,7 +89,10 @@ class UploadsMixin(MixinProtocol):
         endpoint = "browse"
         response = self._send_request(endpoint, body)
         return parse_library_albums(
-            response, lambda additional_params: self._send_request(endpoint, body, additional_params), limit
+            response,
+            lambda additional_params: self._send_request(endpoint, body, additional_params),
+            limit,
+            prefetch=self._prefetcher,
         )
 
     def get_library_upload_artists(self, limit: int = 25, order: Optional[str] = None) -> List[Dict]:
@@ -104,7 +111,10 @@ class UploadsMixin(MixinProtocol):
         endpoint = "browse"
         response = self._send_request(endpoint, body)
         return parse_library_artists(
-            response, lambda additional_params: self._send_request(endpoint, body, additional_params), limit
+            response,
+            lambda additional_params: self._send_request(endpoint, body, additional_params),
+            limit,
+            prefetch=self._prefetcher,
         )
 
     def get_library_upload_artist(self, browse_id: str, limit: int = 25) -> List[Dict]:
@@ -112,7 +122,7 @@ class UploadsMixin(MixinProtocol):
         Returns a list of uploaded tracks for the artist.
 
         :param browse_id: Browse id of the upload artist, i.e. from :py:func:`get_library_upload_songs`
-        :param limit: Number of songs to return (increments of 25).
+        :param limit: Number of songs to return. Default: 25
         :return: List of uploaded songs.
 
         Example List::
@@ -138,11 +148,11 @@ class UploadsMixin(MixinProtocol):
         body = {"browseId": browse_id}
         endpoint = "browse"
         response = self._send_request(endpoint, body)
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + MUSIC_SHELF)
+        results = nav(response, SINGLE_COLUMN_SECTION_LIST_ITEM + MUSIC_SHELF)
         if len(results["contents"]) > 1:
             results["contents"].pop(0)
 
-        items = parse_uploaded_items(results["contents"])
+        items = parse_limited(results["contents"], parse_uploaded_items, limit)
 
         if "continuations" in results:
             request_func = lambda additional_params: self._send_request(endpoint, body, additional_params)
@@ -150,7 +160,12 @@ class UploadsMixin(MixinProtocol):
             remaining_limit = None if limit is None else (limit - len(items))
             items.extend(
                 get_continuations(
-                    results, "musicShelfContinuation", remaining_limit, request_func, parse_func
+                    results,
+                    "musicShelfContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_func,
+                    prefetch=self._prefetcher,
                 )
             )
 
@@ -192,12 +207,12 @@ class UploadsMixin(MixinProtocol):
 
         response = self._send_request("browse", {"browseId": browse_id})
         album = parse_album_header(response)
-        results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + MUSIC_SHELF)
+        results = nav(response, SINGLE_COLUMN_SECTION_LIST_ITEM + MUSIC_SHELF)
         album["tracks"] = parse_uploaded_items(results["contents"])
         album["duration_seconds"] = sum_total_duration(album)
         return album
 
-    def upload_song(self, filepath: str) -> Union[str, requests.Response]:
+    def upload_song(self, filepath: str) -> Union[str, TransportResponse]:
         """
         Uploads a song to YouTube Music
 
@@ -227,12 +242,12 @@ class UploadsMixin(MixinProtocol):
         headers["X-Goog-Upload-Command"] = "start"
         headers["X-Goog-Upload-Header-Content-Length"] = str(filesize)
         headers["X-Goog-Upload-Protocol"] = "resumable"
-        response = requests.post(upload_url, data=body, headers=headers, proxies=self.proxies)
+        response = self._transport.post(upload_url, data=body, headers=headers)
         headers["X-Goog-Upload-Command"] = "upload, finalize"
         headers["X-Goog-Upload-Offset"] = "0"
         upload_url = response.headers["X-Goog-Upload-URL"]
         with open(filepath, "rb") as file:
-            response = requests.post(upload_url, data=file, headers=headers, proxies=self.proxies)
+            response = self._transport.post(upload_url, data=file, headers=headers)
 
         if response.status_code == 200:
             return "STATUS_SUCCEEDED"
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 
 from ytmusicapi.continuations import get_continuations
 from ytmusicapi.mixins._protocol import MixinProtocol
@@ -13,6 +13,7 @@ class WatchMixin(MixinProtocol):
         limit=25,
         radio: bool = False,
         shuffle: bool = False,
+        fields: Optional[Iterable[str]] = None,
     ) -> Dict[str, Union[List[Dict], str, None]]:
         """
         Get a watch list of tracks. This watch playlist appears when you press
@@ -28,6 +29,8 @@ class WatchMixin(MixinProtocol):
         :param radio: get a radio playlist (changes each time)
         :param shuffle: shuffle the input playlist. only works when the playlistId parameter
             is set at the same time. does not work if radio=True
+        :param fields: Optional. Keys to return for each track, i.e. ``["video_id", "duration_s"]``.
+            Other keys are not parsed. A requested ``counterpart`` has all keys. Default: all keys
         :return: List of watch playlist items. The counterpart key is optional and only
             appears if a song has a corresponding video counterpart (UI song/video
             switcher).
@@ -104,6 +107,7 @@ class WatchMixin(MixinProtocol):
         """
         if not video_id and not playlist_id:
             raise Exception("You must provide either a video id, a playlist id, or both")
+        selected = select_fields(fields, WATCH_TRACK_FIELDS)
 
         body = {
             "enablePersistentPlaylistPanel": True,
@@ -148,7 +152,7 @@ class WatchMixin(MixinProtocol):
         output = {
             "lyrics": get_tab_browse_id(next_render, 1),
             "related": get_tab_browse_id(next_render, 2),
-            "tracks": parse_watch_playlist(results["contents"]),
+            "tracks": parse_watch_playlist(results["contents"], selected),
             "playlist": next(
                 (
                     x
@@ -161,7 +165,7 @@ class WatchMixin(MixinProtocol):
 
         if "continuations" in results:
             request_func = lambda additional_params: self._send_request(endpoint, body, additional_params)
-            parse_func = lambda contents: parse_watch_playlist(contents)
+            parse_func = lambda contents: parse_watch_playlist(contents, selected)
             output["tracks"].extend(
                 get_continuations(
                     results,
@@ -170,6 +174,7 @@ class WatchMixin(MixinProtocol):
                     request_func,
                     parse_func,
                     "" if is_playlist else "Radio",
+                    prefetch=self._prefetcher,
                 )
             )
 
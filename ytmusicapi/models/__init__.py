@@ -1,3 +1,20 @@
-from .browsing import CoreTrack
+from .base import FlexSchema, ParsedSchema
+from .browsing import Album, Artist, CoreTrack
+from .common import AlbumRef, ArtistRef, FeedbackTokens, Thumbnail
+from .playlists import Playlist, Track
+from .search import SearchResult
 
-__all__ = ["CoreTrack"]
+__all__ = [
+    "Album",
+    "AlbumRef",
+    "Artist",
+    "ArtistRef",
+    "CoreTrack",
+    "FeedbackTokens",
+    "FlexSchema",
+    "ParsedSchema",
+    "Playlist",
+    "SearchResult",
+    "Thumbnail",
+    "Track",
+]
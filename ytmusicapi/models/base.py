@@ -1,8 +1,11 @@
-from pydantic import BaseModel
+from typing import Any, Dict, Type, TypeVar
+
+from pydantic import BaseModel, ConfigDict
 
-# from pydantic import BaseModel, ConfigDict
 # from pydantic.alias_generators import to_snake
 
+Schema = TypeVar("Schema", bound="FlexSchema")
+
 
 class FlexSchema(BaseModel):
     # model_config = ConfigDict(
@@ -10,4 +13,18 @@ class FlexSchema(BaseModel):
     #     populate_by_name=True,
     #     from_attributes=True,
     # )
-    pass
+
+    @classmethod
+    def from_parsed(cls: Type[Schema], data: Dict[str, Any]) -> Schema:
+        """
+        Build the model from parser output, including nested models, with the compiled validator
+        of pydantic-core. Models that are already built, i.e. the tracks of a playlist, are kept as they are.
+        ``model_dump(exclude_unset=True)`` returns the parsed dictionary.
+        """
+        return cls.__pydantic_validator__.validate_python(data)
+
+
+class ParsedSchema(FlexSchema):
+    """base of the models of parser output, keys without a field are kept as extra attributes"""
+
+    model_config = ConfigDict(extra="allow")
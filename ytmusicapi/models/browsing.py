@@ -1,8 +1,10 @@
-from typing import Annotated
+from typing import Annotated, Any, Dict, List, Optional
 
 from pydantic import Field, field_validator
 
-from .base import FlexSchema
+from .base import FlexSchema, ParsedSchema
+from .common import ArtistRef, Thumbnail
+from .playlists import Track
 
 
 class CoreTrack(FlexSchema):
@@ -20,3 +22,39 @@ class CoreTrack(FlexSchema):
     @classmethod
     def validate_thumbnails(cls, v: dict):
         return v.get("thumbnails", [])
+
+
+class Album(ParsedSchema):
+    """album returned by :py:meth:`YTMusic.get_album`"""
+
+    browse_id: Optional[str] = None
+    name: Optional[str] = None
+    type: Optional[str] = None
+    thumbnails: List[Thumbnail] = []
+    explicit: Optional[bool] = None
+    artists: List[ArtistRef] = []
+    year: Optional[str] = None
+    description: Optional[str] = None
+    track_count: Optional[int] = None
+    duration_s: Optional[int] = None
+    playlist_id: Optional[str] = None
+    like_status: Optional[str] = None
+    tracks: List[Track] = []
+    other_versions: List[Dict] = []
+
+
+class Artist(ParsedSchema):
+    """artist returned by :py:meth:`YTMusic.get_artist`, shelves of albums, singles etc. are extra attributes"""
+
+    name: Optional[str] = None
+    description: Optional[str] = None
+    view_count: Optional[int] = None
+    channel_id: Optional[str] = None
+    artist_id: Optional[str] = None
+    shuffle_id: Optional[str] = None
+    radio_id: Optional[str] = None
+    page_type: Optional[str] = None
+    sub_count: Optional[int] = None
+    subscribed: Optional[bool] = None
+    thumbnails: Optional[List[Thumbnail]] = None
+    songs: Optional[Dict[str, Any]] = None
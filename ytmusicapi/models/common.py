@@ -0,0 +1,24 @@
+from typing import Optional
+
+from .base import ParsedSchema
+
+
+class Thumbnail(ParsedSchema):
+    url: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+
+
+class ArtistRef(ParsedSchema):
+    name: Optional[str] = None
+    id: Optional[str] = None
+
+
+class AlbumRef(ParsedSchema):
+    name: Optional[str] = None
+    id: Optional[str] = None
+
+
+class FeedbackTokens(ParsedSchema):
+    add: Optional[str] = None
+    remove: Optional[str] = None
@@ -0,0 +1,42 @@
+from typing import Dict, List, Optional
+
+from .base import ParsedSchema
+from .common import AlbumRef, ArtistRef, FeedbackTokens, Thumbnail
+
+
+class Track(ParsedSchema):
+    """track of a playlist, album or the library, see :py:meth:`YTMusic.get_playlist`"""
+
+    video_id: Optional[str] = None
+    set_video_id: Optional[str] = None
+    name: Optional[str] = None
+    artists: Optional[List[ArtistRef]] = None
+    album: Optional[AlbumRef] = None
+    track_number: Optional[int] = None
+    like_status: Optional[str] = None
+    in_library: Optional[bool] = None
+    available: bool = True
+    explicit: Optional[bool] = None
+    video_type: Optional[str] = None
+    duration_s: Optional[int] = None
+    thumbnails: List[Thumbnail] = []
+    feedback_tokens: Optional[FeedbackTokens] = None
+
+
+class Playlist(ParsedSchema):
+    """playlist returned by :py:meth:`YTMusic.get_playlist`"""
+
+    id: str
+    privacy: Optional[str] = None
+    name: Optional[str] = None
+    thumbnails: List[Thumbnail] = []
+    description: Optional[str] = None
+    author: Optional[ArtistRef] = None
+    year: Optional[str] = None
+    views: Optional[int] = None
+    duration: Optional[str] = None
+    track_count: Optional[int] = None
+    related: List[Dict] = []
+    tracks: List[Track] = []
+    suggestions: Optional[List[Track]] = None
+    cursor: Optional[str] = None
@@ -0,0 +1,32 @@
+from typing import List, Optional
+
+from .base import ParsedSchema
+from .common import AlbumRef, ArtistRef, FeedbackTokens, Thumbnail
+
+
+class SearchResult(ParsedSchema):
+    """
+    result of :py:meth:`YTMusic.search`, the keys depend on the result_type.
+    Keys without a field, i.e. views or subscribers, are extra attributes.
+    """
+
+    category: Optional[str] = None
+    result_type: Optional[str] = None
+    title: Optional[str] = None
+    name: Optional[str] = None
+    type: Optional[str] = None
+    artist: Optional[str] = None
+    artists: Optional[List[ArtistRef]] = None
+    author: Optional[str] = None
+    album: Optional[AlbumRef] = None
+    browse_id: Optional[str] = None
+    video_id: Optional[str] = None
+    playlist_id: Optional[str] = None
+    video_type: Optional[str] = None
+    year: Optional[str] = None
+    duration: Optional[str] = None
+    duration_s: Optional[int] = None
+    explicit: Optional[bool] = None
+    in_library: Optional[bool] = None
+    thumbnails: Optional[List[Thumbnail]] = None
+    feedback_tokens: Optional[FeedbackTokens] = None
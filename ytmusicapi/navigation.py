@@ -1,86 +1,171 @@
 """commonly used navigation paths"""
-from typing import Any, Dict, List, Literal, Optional, overload
-
-CONTENT = ["contents", 0]
-ZTEXT = [0, "text"]
-TTEXT = [2, "text"]
-RUN_TEXT = ["runs"] + ZTEXT
-TAB_CONTENT = ["tabs", 0, "tabRenderer", "content"]
-TAB_1_CONTENT = ["tabs", 1, "tabRenderer", "content"]
-SINGLE_COLUMN = ["contents", "singleColumnBrowseResultsRenderer"]
-SINGLE_COLUMN_TAB = SINGLE_COLUMN + TAB_CONTENT
-SECTION = ["sectionListRenderer"]
-SECTION_LIST = SECTION + ["contents"]
-SECTION_LIST_ITEM = SECTION + CONTENT
-ITEM_SECTION = ["itemSectionRenderer"] + CONTENT
-MUSIC_SHELF = ["musicShelfRenderer"]
-GRID = ["gridRenderer"]
-GRID_ITEMS = GRID + ["items"]
-MENU = ["menu", "menuRenderer"]
-MENU_ITEMS = MENU + ["items"]
-MENU_LIKE_STATUS = MENU + ["topLevelButtons", 0, "likeButtonRenderer", "likeStatus"]
-MENU_SERVICE = ["menuServiceItemRenderer", "serviceEndpoint"]
+
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple, overload
+
+
+class Path(list):
+    """
+    List of keys compiled once into a function indexing a nested object directly.
+    :py:func:`nav` uses it to return None for absent paths, avoiding the loop and the costly re-raise
+    of the generic lookup. Paths can't be modified, so the function always matches the keys.
+    Concatenating a path returns a plain list, so paths used in hot loops should be defined once.
+
+    :param keys: dictionary keys and list indices
+    :param sparse: The path is usually absent. Its keys are checked one by one instead of
+        raising and catching an exception, which is faster for missing keys and slower for present ones.
+    """
+
+    resolve_or_none: Callable[[Any], Any]  #: the nested object or None if absent
+
+    def __init__(self, keys: Iterable[Any], sparse: bool = False):
+        super().__init__(keys)
+        self.sparse = sparse
+        self.resolve_or_none = _compile(tuple(self), sparse)
+
+    def __reduce__(self):
+        return Path, (list(self), self.sparse)
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Paths can't be modified, concatenate them to build a new list")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable  # type: ignore[assignment]
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable  # type: ignore[assignment]
+
+
+def _compile(keys: Tuple[Any, ...], sparse: bool) -> Callable[[Any], Any]:
+    for key in keys:
+        if type(key) not in (str, int):
+            raise TypeError(f"Navigation keys must be strings or integers, not {key!r}")
+    lines = ["def resolve_or_none(root):", "    try:"]
+    if not sparse:
+        lines.append("        return root" + "".join(f"[{key!r}]" for key in keys))
+    else:
+        for key in keys:
+            if isinstance(key, str):
+                lines += [
+                    f"        root = root.get({key!r})",
+                    "        if root is None:",
+                    "            return None",
+                ]
+            else:
+                bound = key + 1 if key >= 0 else -key
+                lines += [
+                    f"        if len(root) < {bound}:",
+                    "            return None",
+                    f"        root = root[{key}]",
+                ]
+        lines.append("        return root")
+    # unexpected types, i.e. a list instead of a dict
+    lines += ["    except Exception:", "        return None"]
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["resolve_or_none"]
+
+
+CONTENT = Path(["contents", 0])
+ZTEXT = Path([0, "text"])
+TTEXT = Path([2, "text"])
+RUN_TEXT = Path(["runs"] + ZTEXT)
+TAB_CONTENT = Path(["tabs", 0, "tabRenderer", "content"])
+TAB_1_CONTENT = Path(["tabs", 1, "tabRenderer", "content"])
+SINGLE_COLUMN = Path(["contents", "singleColumnBrowseResultsRenderer"])
+SINGLE_COLUMN_TAB = Path(SINGLE_COLUMN + TAB_CONTENT)
+SECTION = Path(["sectionListRenderer"])
+SECTION_LIST = Path(SECTION + ["contents"])
+SECTION_LIST_ITEM = Path(SECTION + CONTENT)
+ITEM_SECTION = Path(["itemSectionRenderer"] + CONTENT)
+MUSIC_SHELF = Path(["musicShelfRenderer"])
+GRID = Path(["gridRenderer"])
+GRID_ITEMS = Path(GRID + ["items"])
+MENU = Path(["menu", "menuRenderer"])
+MENU_ITEMS = Path(MENU + ["items"])
+MENU_LIKE_STATUS = Path(MENU + ["topLevelButtons", 0, "likeButtonRenderer", "likeStatus"])
+MENU_SERVICE = Path(["menuServiceItemRenderer", "serviceEndpoint"])
 TOGGLE_MENU = "toggleMenuServiceItemRenderer"
-OVERLAY_RENDERER = ["musicItemThumbnailOverlayRenderer", "content", "musicPlayButtonRenderer"]
-PLAY_BUTTON = ["overlay"] + OVERLAY_RENDERER
-NAVIGATION_BROWSE = ["navigationEndpoint", "browseEndpoint"]
-NAVIGATION_BROWSE_ID = NAVIGATION_BROWSE + ["browseId"]
-PAGE_TYPE = ["browseEndpointContextSupportedConfigs", "browseEndpointContextMusicConfig", "pageType"]
-WATCH_VIDEO_ID = ["watchEndpoint", "videoId"]
-NAVIGATION_VIDEO_ID = ["navigationEndpoint"] + WATCH_VIDEO_ID
-QUEUE_VIDEO_ID = ["queueAddEndpoint", "queueTarget", "videoId"]
-NAVIGATION_PLAYLIST_ID = ["navigationEndpoint", "watchEndpoint", "playlistId"]
-WATCH_PID = ["watchPlaylistEndpoint", "playlistId"]
-NAVIGATION_WATCH_PLAYLIST_ID = ["navigationEndpoint"] + WATCH_PID
-NAVIGATION_VIDEO_TYPE = [
-    "watchEndpoint",
-    "watchEndpointMusicSupportedConfigs",
-    "watchEndpointMusicConfig",
-    "musicVideoType",
-]
-TITLE = ["title", "runs", 0]
-TITLE_TEXT = ["title"] + RUN_TEXT
-TEXT_RUNS = ["text", "runs"]
-TEXT_RUN = TEXT_RUNS + [0]
-TEXT_RUN_TEXT = TEXT_RUN + ["text"]
-SUBTITLE = ["subtitle"] + RUN_TEXT
-SUBTITLE_RUNS = ["subtitle", "runs"]
-LAST_RUN = ["runs", -1]
-TEXT_LAST_RUN = ["text"] + LAST_RUN
-LAST_SUB_RUN = ["subtitle"] + LAST_RUN
-SUBTITLE2 = SUBTITLE_RUNS + TTEXT
-SUBTITLE3 = SUBTITLE_RUNS + [4, "text"]
-THUMBNAIL = ["thumbnail", "thumbnails"]
-THUMBNAILS = ["thumbnail", "musicThumbnailRenderer"] + THUMBNAIL
-THUMBNAIL_RENDERER = ["thumbnailRenderer", "musicThumbnailRenderer"] + THUMBNAIL
-THUMBNAIL_OVERLAY = ["thumbnailOverlay"] + OVERLAY_RENDERER + ["playNavigationEndpoint"] + WATCH_PID
-THUMBNAIL_CROPPED = ["thumbnail", "croppedSquareThumbnailRenderer"] + THUMBNAIL
-FEEDBACK_TOKEN = ["feedbackEndpoint", "feedbackToken"]
+OVERLAY_RENDERER = Path(["musicItemThumbnailOverlayRenderer", "content", "musicPlayButtonRenderer"])
+PLAY_BUTTON = Path(["overlay"] + OVERLAY_RENDERER)
+NAVIGATION_BROWSE = Path(["navigationEndpoint", "browseEndpoint"])
+NAVIGATION_BROWSE_ID = Path(NAVIGATION_BROWSE + ["browseId"])
+PAGE_TYPE = Path(["browseEndpointContextSupportedConfigs", "browseEndpointContextMusicConfig", "pageType"])
+WATCH_VIDEO_ID = Path(["watchEndpoint", "videoId"])
+NAVIGATION_VIDEO_ID = Path(["navigationEndpoint"] + WATCH_VIDEO_ID)
+QUEUE_VIDEO_ID = Path(["queueAddEndpoint", "queueTarget", "videoId"])
+NAVIGATION_PLAYLIST_ID = Path(["navigationEndpoint", "watchEndpoint", "playlistId"])
+WATCH_PID = Path(["watchPlaylistEndpoint", "playlistId"])
+NAVIGATION_WATCH_PLAYLIST_ID = Path(["navigationEndpoint"] + WATCH_PID)
+NAVIGATION_VIDEO_TYPE = Path(
+    [
+        "watchEndpoint",
+        "watchEndpointMusicSupportedConfigs",
+        "watchEndpointMusicConfig",
+        "musicVideoType",
+    ]
+)
+TITLE = Path(["title", "runs", 0])
+TITLE_TEXT = Path(["title"] + RUN_TEXT)
+TEXT_RUNS = Path(["text", "runs"])
+TEXT_RUN = Path(TEXT_RUNS + [0])
+TEXT_RUN_TEXT = Path(TEXT_RUN + ["text"])
+SUBTITLE = Path(["subtitle"] + RUN_TEXT)
+SUBTITLE_RUNS = Path(["subtitle", "runs"])
+LAST_RUN = Path(["runs", -1])
+TEXT_LAST_RUN = Path(["text"] + LAST_RUN)
+LAST_SUB_RUN = Path(["subtitle"] + LAST_RUN)
+SUBTITLE2 = Path(SUBTITLE_RUNS + TTEXT)
+SUBTITLE3 = Path(SUBTITLE_RUNS + [4, "text"])
+THUMBNAIL = Path(["thumbnail", "thumbnails"])
+THUMBNAILS = Path(["thumbnail", "musicThumbnailRenderer"] + THUMBNAIL)
+THUMBNAIL_RENDERER = Path(["thumbnailRenderer", "musicThumbnailRenderer"] + THUMBNAIL)
+THUMBNAIL_OVERLAY = Path(["thumbnailOverlay"] + OVERLAY_RENDERER + ["playNavigationEndpoint"] + WATCH_PID)
+THUMBNAIL_CROPPED = Path(["thumbnail", "croppedSquareThumbnailRenderer"] + THUMBNAIL)
+FEEDBACK_TOKEN = Path(["feedbackEndpoint", "feedbackToken"])
 MENU_ENTRIES = [[-1] + MENU_SERVICE + FEEDBACK_TOKEN]
-BADGE_PATH = [0, "musicInlineBadgeRenderer", "accessibilityData", "accessibilityData", "label"]
-BADGE_LABEL = ["badges"] + BADGE_PATH
-SUBTITLE_BADGE_LABEL = ["subtitleBadges"] + BADGE_PATH
-CATEGORY_TITLE = ["musicNavigationButtonRenderer", "buttonText"] + RUN_TEXT
-CATEGORY_PARAMS = ["musicNavigationButtonRenderer", "clickCommand", "browseEndpoint", "params"]
+BADGE_PATH = Path([0, "musicInlineBadgeRenderer", "accessibilityData", "accessibilityData", "label"])
+BADGE_LABEL = Path(["badges"] + BADGE_PATH, sparse=True)
+SUBTITLE_BADGE_LABEL = Path(["subtitleBadges"] + BADGE_PATH, sparse=True)
+CATEGORY_TITLE = Path(["musicNavigationButtonRenderer", "buttonText"] + RUN_TEXT)
+CATEGORY_PARAMS = Path(["musicNavigationButtonRenderer", "clickCommand", "browseEndpoint", "params"])
 UNAVAILABLE = "MUSIC_ITEM_RENDERER_DISPLAY_POLICY_GREY_OUT"
 MRLIR = "musicResponsiveListItemRenderer"
 MTRIR = "musicTwoRowItemRenderer"
 MRLIFCR = "musicResponsiveListItemFlexColumnRenderer"
-TASTE_PROFILE_ITEMS = ["contents", "tastebuilderRenderer", "contents"]
-TASTE_PROFILE_ARTIST = ["title", "runs"]
-SECTION_LIST_CONTINUATION = ["continuationContents", "sectionListContinuation"]
-MENU_PLAYLIST_ID = MENU_ITEMS + [0, "menuNavigationItemRenderer"] + NAVIGATION_WATCH_PLAYLIST_ID
-MULTI_SELECT = ["musicMultiSelectMenuItemRenderer"]
-HEADER_DETAIL = ["header", "musicDetailHeaderRenderer"]
-HEADER_SIDE = ["header", "musicSideAlignedItemRenderer"]
-DESCRIPTION_SHELF = ["musicDescriptionShelfRenderer"]
-DESCRIPTION = ["description"] + RUN_TEXT
-CAROUSEL = ["musicCarouselShelfRenderer"]
-IMMERSIVE_CAROUSEL = ["musicImmersiveCarouselShelfRenderer"]
-CAROUSEL_CONTENTS = CAROUSEL + ["contents"]
-CAROUSEL_TITLE = ["header", "musicCarouselShelfBasicHeaderRenderer"] + TITLE
-CARD_SHELF_TITLE = ["header", "musicCardShelfHeaderBasicRenderer"] + TITLE_TEXT
-FRAMEWORK_MUTATIONS = ["frameworkUpdates", "entityBatchUpdate", "mutations"]
+TASTE_PROFILE_ITEMS = Path(["contents", "tastebuilderRenderer", "contents"])
+TASTE_PROFILE_ARTIST = Path(["title", "runs"])
+SECTION_LIST_CONTINUATION = Path(["continuationContents", "sectionListContinuation"])
+MENU_PLAYLIST_ID = Path(MENU_ITEMS + [0, "menuNavigationItemRenderer"] + NAVIGATION_WATCH_PLAYLIST_ID)
+MULTI_SELECT = Path(["musicMultiSelectMenuItemRenderer"])
+HEADER_DETAIL = Path(["header", "musicDetailHeaderRenderer"])
+HEADER_SIDE = Path(["header", "musicSideAlignedItemRenderer"])
+DESCRIPTION_SHELF = Path(["musicDescriptionShelfRenderer"])
+DESCRIPTION = Path(["description"] + RUN_TEXT)
+CAROUSEL = Path(["musicCarouselShelfRenderer"])
+IMMERSIVE_CAROUSEL = Path(["musicImmersiveCarouselShelfRenderer"])
+CAROUSEL_CONTENTS = Path(CAROUSEL + ["contents"])
+CAROUSEL_TITLE = Path(["header", "musicCarouselShelfBasicHeaderRenderer"] + TITLE)
+CARD_SHELF_TITLE = Path(["header", "musicCardShelfHeaderBasicRenderer"] + TITLE_TEXT)
+FRAMEWORK_MUTATIONS = Path(["frameworkUpdates", "entityBatchUpdate", "mutations"])
+
+# composed once instead of concatenating lists on every call
+SINGLE_COLUMN_SECTION_LIST = Path(SINGLE_COLUMN_TAB + SECTION_LIST)
+SINGLE_COLUMN_SECTION_LIST_ITEM = Path(SINGLE_COLUMN_TAB + SECTION_LIST_ITEM)
+TITLE_RUNS = Path(["title", "runs"])
+TITLE_BROWSE_ID = Path(TITLE + NAVIGATION_BROWSE_ID)
+TITLE_PAGE_TYPE = Path(TITLE + NAVIGATION_BROWSE + PAGE_TYPE)
+PLAY_VIDEO_ID = Path(PLAY_BUTTON + ["playNavigationEndpoint"] + WATCH_VIDEO_ID)
+PLAY_VIDEO_TYPE = Path(PLAY_BUTTON + ["playNavigationEndpoint"] + NAVIGATION_VIDEO_TYPE)
+MENU_ITEM_VIDEO_TYPE = Path(["menuNavigationItemRenderer", "navigationEndpoint"] + NAVIGATION_VIDEO_TYPE)
+MENU_VIDEO_TYPE = Path(MENU_ITEMS + [0] + MENU_ITEM_VIDEO_TYPE)
+MENU_TOP_LIKE_STATUS = Path(MENU_LIKE_STATUS[2:])
+PLAYLIST_EDIT_ACTION = Path(["playlistEditEndpoint", "actions", 0])
+PLAYLIST_EDIT_SET_VIDEO_ID = Path(PLAYLIST_EDIT_ACTION + ["setVideoId"])
+PLAYLIST_EDIT_VIDEO_ID = Path(PLAYLIST_EDIT_ACTION + ["removedVideoId"])
+INDEX_TEXT = Path(["index"] + RUN_TEXT)
+TEXT_RUN_VIDEO_ID = Path(TEXT_RUN + NAVIGATION_VIDEO_ID)
+TEXT_RUN_PLAYLIST_ID = Path(TEXT_RUN + NAVIGATION_PLAYLIST_ID)
+HEADER_RUN_TEXT = Path(["header"] + RUN_TEXT)
+CAROUSEL_TITLE_TEXT = Path(CAROUSEL_TITLE + ["text"])
+ON_TAP_VIDEO_ID = Path(["onTap"] + WATCH_VIDEO_ID)
+ON_TAP_VIDEO_TYPE = Path(["onTap"] + NAVIGATION_VIDEO_TYPE)
 
 
 @overload
@@ -94,7 +179,10 @@ def nav(root: Dict, items: List[Any], none_if_absent: Literal[True] = True) -> O
 
 
 def nav(root: Dict, items: List[Any], none_if_absent: bool = False) -> Optional[Any]:
-    """Access a nested object in root by item sequence."""
+    """Access a nested object in root by item sequence, or by a precompiled :py:class:`Path`."""
+    # walking a few keys is as fast as calling a compiled path, catching and re-raising exceptions is not
+    if none_if_absent and items.__class__ is Path:
+        return items.resolve_or_none(root)  # type: ignore[attr-defined]
     try:
         for k in items:
             root = root[k]
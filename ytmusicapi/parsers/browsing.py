@@ -7,19 +7,19 @@ def parse_mixed_content(rows):
     for row in rows:
         if DESCRIPTION_SHELF[0] in row:
             results = nav(row, DESCRIPTION_SHELF)
-            title = nav(results, ["header"] + RUN_TEXT)
+            title = nav(results, HEADER_RUN_TEXT)
             contents = nav(results, DESCRIPTION)
         else:
             results = next(iter(row.values()))
             if "contents" not in results:
                 continue
-            title = nav(results, CAROUSEL_TITLE + ["text"])
+            title = nav(results, CAROUSEL_TITLE_TEXT)
             contents = []
             for result in results["contents"]:
-                data = nav(result, [MTRIR], True)
+                data = result.get(MTRIR)
                 content = None
                 if data:
-                    page_type = nav(data, TITLE + NAVIGATION_BROWSE + PAGE_TYPE, True)
+                    page_type = nav(data, TITLE_PAGE_TYPE, True)
                     if page_type is None:  # song or watch_playlist
                         if nav(data, NAVIGATION_WATCH_PLAYLIST_ID, True) is not None:
                             content = parse_watch_playlist(data)
@@ -32,7 +32,7 @@ def parse_mixed_content(rows):
                     elif page_type == "MUSIC_PAGE_TYPE_PLAYLIST":
                         content = parse_playlist(data)
                 else:
-                    data = nav(result, [MRLIR], True)
+                    data = result.get(MRLIR)
                     if not data:
                         continue
                     content = parse_song_flat(data)
@@ -54,7 +54,7 @@ def parse_content_list(results, parse_func, key=MTRIR):
 def parse_album(result):
     album = {
         "title": nav(result, TITLE_TEXT),
-        "browse_id": nav(result, TITLE + NAVIGATION_BROWSE_ID),
+        "browse_id": nav(result, TITLE_BROWSE_ID),
         "playlist_id": nav(result, THUMBNAIL_OVERLAY, True),
         "thumbnails": nav(result, THUMBNAIL_RENDERER),
         "explicit": nav(result, SUBTITLE_BADGE_LABEL, True) is not None,
@@ -93,7 +93,7 @@ def parse_song_flat(data):
     columns = [get_flex_column_item(data, i) for i in range(0, len(data["flexColumns"]))]
     song = {
         "name": nav(columns[0], TEXT_RUN_TEXT),
-        "video_id": nav(columns[0], TEXT_RUN + NAVIGATION_VIDEO_ID, True),
+        "video_id": nav(columns[0], TEXT_RUN_VIDEO_ID, True),
         "artists": parse_pl_song_artists(data, 1),
         "thumbnails": nav(data, THUMBNAILS),
         "explicit": nav(data, BADGE_LABEL, True) is not None,
@@ -152,7 +152,7 @@ def parse_video(result):
 def parse_playlist(data):
     playlist = {
         "name": nav(data, TITLE_TEXT),
-        "playlist_id": nav(data, TITLE + NAVIGATION_BROWSE_ID)[2:],
+        "playlist_id": nav(data, TITLE_BROWSE_ID)[2:],
         "thumbnails": nav(data, THUMBNAIL_RENDERER),
     }
     runs = nav(data, SUBTITLE_RUNS)
@@ -180,7 +180,7 @@ def parse_playlist(data):
 def parse_related_artist(data):
     return {
         "name": nav(data, TITLE_TEXT),
-        "browse_id": nav(data, TITLE + NAVIGATION_BROWSE_ID),
+        "browse_id": nav(data, TITLE_BROWSE_ID),
         "sub_count": parse_real_count(nav(data, LAST_SUB_RUN, True)),
         "thumbnails": nav(data, THUMBNAIL_RENDERER),
     }
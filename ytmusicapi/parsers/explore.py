@@ -30,8 +30,8 @@ def parse_chart_trending(data):
     views = None if index == len(artists) else artists.pop()["name"].split(" ")[0]
     return {
         "title": nav(flex_0, TEXT_RUN_TEXT),
-        "videoId": nav(flex_0, TEXT_RUN + NAVIGATION_VIDEO_ID, True),
-        "playlistId": nav(flex_0, TEXT_RUN + NAVIGATION_PLAYLIST_ID, True),
+        "videoId": nav(flex_0, TEXT_RUN_VIDEO_ID, True),
+        "playlistId": nav(flex_0, TEXT_RUN_PLAYLIST_ID, True),
         "artists": artists,
         "thumbnails": nav(data, THUMBNAILS),
         "views": views,
@@ -1,4 +1,7 @@
-from typing import Dict, List
+import gettext
+import os
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
 
 from ytmusicapi.parsers.browsing import (
     parse_album,
@@ -7,37 +10,49 @@ from ytmusicapi.parsers.browsing import (
     parse_related_artist,
     parse_video,
 )
-from ytmusicapi.parsers.utils import get_ext, i18n
+from ytmusicapi.parsers.utils import get_ext
+
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "locales")
+
+
+@lru_cache(maxsize=None)
+def get_parser(language: str) -> "Parser":
+    """Parser of a language, created once and shared by all instances since it is never modified"""
+    return Parser(gettext.translation("base", localedir=LOCALE_DIR, languages=[language]))
 
 
 class Parser:
     def __init__(self, language):
         self.lang = language
-
-    @i18n
-    def get_search_result_types(self):
-        return [
-            _("artist"),
-            _("playlist"),
-            _("song"),
-            _("video"),
-            _("station"),
-            _("profile"),
-            _("podcast"),
-            _("episode"),
-        ]
-
-    @i18n
-    def append_channel_contents(self, channel: Dict, results: List) -> Dict:
-        cat_map = {
-            _("albums"): ("albums", parse_album),  # type: ignore[name-defined]
-            _("singles"): ("singles", parse_album),  # type: ignore[name-defined]
-            _("videos"): ("videos", parse_video),  # type: ignore[name-defined]
-            _("playlists"): ("playlists", parse_playlist),  # type: ignore[name-defined]
-            _("related"): ("related", parse_related_artist),  # type: ignore[name-defined]
+        # strings are translated once, the _ calls mark them for extraction into base.pot
+        _ = language.gettext
+        #: english result type by localized search result type
+        self.search_result_types: Dict[str, str] = {
+            _("artist"): "artist",
+            _("playlist"): "playlist",
+            _("song"): "song",
+            _("video"): "video",
+            _("station"): "station",
+            _("profile"): "profile",
+            _("podcast"): "podcast",
+            _("episode"): "episode",
+        }
+        #: key and parser by localized shelf title of a channel
+        self.channel_shelves: Dict[str, Tuple[str, Callable]] = {
+            _("albums"): ("albums", parse_album),
+            _("singles"): ("singles", parse_album),
+            _("videos"): ("videos", parse_video),
+            _("playlists"): ("playlists", parse_playlist),
+            _("related"): ("related", parse_related_artist),
             "featured on": ("features", parse_playlist),
         }
 
+    def get_search_result_types(self) -> Dict[str, str]:
+        return self.search_result_types
+
+    def append_channel_contents(self, channel: Dict, results: List) -> Dict:
+        cat_map = self.channel_shelves
+
         for shelf in results:
             if not (render := shelf.get("musicCarouselShelfRenderer")):
                 continue
@@ -1,4 +1,4 @@
-from ytmusicapi.continuations import get_continuations
+from ytmusicapi.continuations import get_continuations, parse_limited
 
 from .playlists import parse_playlist_items
 from .songs import parse_song_runs
@@ -26,17 +26,19 @@ def parse_artists(results, uploaded=False):
     return artists
 
 
-def parse_library_albums(response, request_func, limit):
+def parse_library_albums(response, request_func, limit, prefetch=None):
     results = get_library_contents(response, GRID)
     if results is None:
         return []
-    albums = parse_albums(results["items"])
+    parse_func = lambda contents: parse_albums(contents)
+    albums = parse_limited(results["items"], parse_func, limit)
 
     if "continuations" in results:
-        parse_func = lambda contents: parse_albums(contents)
         remaining_limit = None if limit is None else (limit - len(albums))
         albums.extend(
-            get_continuations(results, "gridContinuation", remaining_limit, request_func, parse_func)
+            get_continuations(
+                results, "gridContinuation", remaining_limit, request_func, parse_func, prefetch=prefetch
+            )
         )
 
     return albums
@@ -47,7 +49,7 @@ def parse_albums(results):
     for result in results:
         data = result[MTRIR]
         album = {
-            "browse_id": nav(data, TITLE + NAVIGATION_BROWSE_ID),
+            "browse_id": nav(data, TITLE_BROWSE_ID),
             "playlist_id": nav(data, MENU_PLAYLIST_ID, none_if_absent=True),
             "title": nav(data, TITLE_TEXT),
             "thumbnails": nav(data, THUMBNAIL_RENDERER),
@@ -62,17 +64,24 @@ def parse_albums(results):
     return albums
 
 
-def parse_library_artists(response, request_func, limit):
+def parse_library_artists(response, request_func, limit, prefetch=None):
     results = get_library_contents(response, MUSIC_SHELF)
     if results is None:
         return []
-    artists = parse_artists(results["contents"])
+    parse_func = lambda contents: parse_artists(contents)
+    artists = parse_limited(results["contents"], parse_func, limit)
 
     if "continuations" in results:
-        parse_func = lambda contents: parse_artists(contents)
         remaining_limit = None if limit is None else (limit - len(artists))
         artists.extend(
-            get_continuations(results, "musicShelfContinuation", remaining_limit, request_func, parse_func)
+            get_continuations(
+                results,
+                "musicShelfContinuation",
+                remaining_limit,
+                request_func,
+                parse_func,
+                prefetch=prefetch,
+            )
         )
 
     return artists
@@ -85,10 +94,14 @@ def pop_songs_random_mix(results) -> None:
             results["contents"].pop(0)
 
 
-def parse_library_songs(response):
+def parse_library_songs(response, limit=None, fields=None, track_format="dict"):
     results = get_library_contents(response, MUSIC_SHELF)
     pop_songs_random_mix(results)
-    return {"results": results, "parsed": parse_playlist_items(results["contents"]) if results else results}
+    parse_func = lambda contents: parse_playlist_items(contents, fields=fields, track_format=track_format)
+    return {
+        "results": results,
+        "parsed": parse_limited(results["contents"], parse_func, limit) if results else results,
+    }
 
 
 def get_library_contents(response, renderer):
@@ -100,14 +113,14 @@ def get_library_contents(response, renderer):
     :param renderer: GRID or MUSIC_SHELF
     :return: library contents or None
     """
-    section = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST, True)
+    section = nav(response, SINGLE_COLUMN_SECTION_LIST, True)
     contents = None
     if section is None:  # empty library
         contents = nav(response, SINGLE_COLUMN + TAB_1_CONTENT + SECTION_LIST_ITEM + renderer, True)
     else:
         results = find_object_by_key(section, "itemSectionRenderer")
         if results is None:
-            contents = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST_ITEM + renderer, True)
+            contents = nav(response, SINGLE_COLUMN_SECTION_LIST_ITEM + renderer, True)
         else:
             contents = nav(results, ITEM_SECTION + renderer, True)
     return contents
@@ -1,95 +1,214 @@
-from typing import List, Optional
+from typing import Any, FrozenSet, List, Optional, Tuple
+
+from ytmusicapi.columns import TRACK_COLUMN_FIELDS, TrackColumns
+from ytmusicapi.models import Track
+from ytmusicapi.records import TrackRecord
+from ytmusicapi.tracks import LazyTrack, LazyTracks
 
 from .songs import *
 
+#: keys of the items returned by :py:func:`parse_playlist_items`, album tracks have a track_number
+#: instead of album and thumbnails
+PLAYLIST_ITEM_FIELDS = frozenset(
+    {
+        "video_id",
+        "set_video_id",
+        "name",
+        "artists",
+        "album",
+        "track_number",
+        "like_status",
+        "in_library",
+        "available",
+        "explicit",
+        "video_type",
+        "duration_s",
+        "thumbnails",
+        "feedback_tokens",
+    }
+)
+MENU_FIELDS = frozenset({"video_id", "set_video_id", "like_status", "in_library", "feedback_tokens"})
+
+
+def parse_playlist_items(
+    results,
+    menu_entries: Optional[List[List]] = None,
+    context=None,
+    fields: Optional[FrozenSet[str]] = None,
+    track_format: str = "dict",
+):
+    # paths of menu_entries are relative to the menu items, composed once for all rows
+    entries = [
+        ("feedback_token" if entry[-1] == "feedbackToken" else entry[-1], Path(MENU_ITEMS + entry))
+        for entry in menu_entries or []
+    ]
+    # fields that are not requested are not parsed, see select_fields
+    wanted = PLAYLIST_ITEM_FIELDS if fields is None else fields
+    if fields is not None:
+        entries = [(key, path) for key, path in entries if key in fields]
+    wanted = wanted.union(key for key, _ in entries)
+
+    if track_format == "lazy":
+        return LazyTracks(
+            list(iter_playlist_rows(results)),
+            lambda row: LazyTrack(
+                lambda keys: parse_playlist_item(row[0], row[1], context, keys, entries, keys), wanted
+            ),
+        )
 
-def parse_playlist_items(results, menu_entries: Optional[List[List]] = None, context=None):
-    songs = []
+    if track_format == "columns":
+        return parse_playlist_columns(results, context, fields)
+
+    if track_format == "model":
+        return [
+            Track.from_parsed(parse_playlist_item(data, name, context, wanted, entries, fields))
+            for data, name in iter_playlist_rows(results)
+        ]
+
+    if track_format == "record":
+        return [
+            TrackRecord.from_dict(parse_playlist_item(data, name, context, wanted, entries, fields))
+            for data, name in iter_playlist_rows(results)
+        ]
+
+    return [
+        parse_playlist_item(data, name, context, wanted, entries, fields)
+        for data, name in iter_playlist_rows(results)
+    ]
+
+
+def parse_playlist_columns(results, context=None, fields: Optional[FrozenSet[str]] = None) -> TrackColumns:
+    """
+    Parse the rows of a playlist shelf straight into column buffers, without a dictionary per track.
+    The values are read by :py:func:`read_playlist_row` like those of :py:func:`parse_playlist_item`.
+    """
+    columns = TrackColumns(TRACK_COLUMN_FIELDS if fields is None else TRACK_COLUMN_FIELDS & fields)
+    appenders = [(PLAYLIST_ROW_KEYS.index(field), columns.appender(field)) for field in columns.fields]
+    for data, name in iter_playlist_rows(results):
+        row = read_playlist_row(data, name, context, columns.fields)
+        for index, append in appenders:
+            append(None if row[index] is ABSENT else row[index])
+        columns.rows += 1
+    return columns
+
+
+def iter_playlist_rows(results):
+    """renderers and names of the rows of a playlist shelf, skipping deleted songs"""
     for result in results:
         if not (data := result.get(MRLIR, {})):
             continue
         if (name := get_item_text(data, 0) if "menu" in data else None) == "Song deleted":
             continue
-
-        song = {
-            "video_id": None,
-            "name": name,
-            "artists": parse_pl_song_artists(data, 1, as_album=context),
-            "like_status": None,
-            "in_library": None,
-            "available": data.get("musicItemRendererDisplayPolicy", "GOOD_TO_GO") != UNAVAILABLE,
-            "explicit": nav(data, BADGE_LABEL, True) is not None,
-            "video_type": None,
-            "feedback_tokens": None,
-        }
-
-        if not song["available"] and song["name"] is None:
-            try:
-                song["name"] = data["flexColumns"][0][MRLIFCR]["text"]["runs"][0]["text"]
-            except KeyError:
-                pass
-
-        if context is None:
-            song["album"] = parse_song_album(data, -1)  # liked=2 songs=3
-            if "thumbnail" in data:
-                song["thumbnails"] = nav(data, THUMBNAILS)
-
-        # album contexts skip per-track album and thumbnail spec, but add track_numbers
-        else:
-            song["track_number"] = int(nav(data, ["index", "runs", 0, "text"])) if song["available"] else None
-
-        # if the item has a menu, find its setVideoId
-        if "menu" in data:
-            song["like_status"] = nav(data, MENU_LIKE_STATUS, True)
+        yield data, name
+
+
+#: keys of the values returned by :py:func:`read_playlist_row`, in the key order of a parsed track
+PLAYLIST_ROW_KEYS = (
+    "video_id",
+    "name",
+    "artists",
+    "like_status",
+    "in_library",
+    "available",
+    "explicit",
+    "video_type",
+    "feedback_tokens",
+    "album",
+    "thumbnails",
+    "track_number",
+    "set_video_id",
+    "duration_s",
+)
+#: keys of the values returned by :py:func:`read_playlist_row` that can be ABSENT
+OPTIONAL_ROW_KEYS = PLAYLIST_ROW_KEYS[9:]
+#: marks keys a parsed track doesn't have, i.e. album in album contexts
+ABSENT: Any = object()
+
+
+def read_playlist_row(data, name, context, wanted) -> Tuple:
+    """
+    Values of a playlist row for the keys :py:data:`PLAYLIST_ROW_KEYS`, shared by all track formats.
+    Keys that are not wanted are None or ABSENT.
+    """
+    available = data.get("musicItemRendererDisplayPolicy", "GOOD_TO_GO") != UNAVAILABLE
+    if not available and name is None:
+        try:
+            name = data["flexColumns"][0][MRLIFCR]["text"]["runs"][0]["text"]
+        except KeyError:
+            pass
+
+    album = thumbnails = track_number = ABSENT
+    if context is None:
+        if "album" in wanted:
+            album = parse_song_album(data, -1)  # liked=2 songs=3
+        if "thumbnail" in data and "thumbnails" in wanted:
+            thumbnails = nav(data, THUMBNAILS)
+
+    # album contexts skip per-track album and thumbnail spec, but add track_numbers
+    elif "track_number" in wanted:
+        track_number = int(nav(data, INDEX_TEXT)) if available else None
+
+    # the menu items are scanned once for the library toggle and the playlist edit service
+    video_id = like_status = in_library = feedback_tokens = None
+    set_video_id = ABSENT
+    items = None
+    if "menu" in data:
+        menu = data["menu"]["menuRenderer"]
+        items = menu.get("items", [])
+        if not MENU_FIELDS.isdisjoint(wanted):
+            toggle_menu, playlist_edit = index_song_menu(items)
+            like_status = nav(menu, MENU_TOP_LIKE_STATUS, True)
             # playlist specific
-            if context is None:
-                for item in nav(data, MENU_ITEMS):
-                    if "menuServiceItemRenderer" in item:
-                        menu_service = nav(item, MENU_SERVICE)
-                        if "playlistEditEndpoint" in menu_service:
-                            song["set_video_id"] = nav(
-                                menu_service, ["playlistEditEndpoint", "actions", 0, "setVideoId"], True
-                            )
-                            song["video_id"] = nav(
-                                menu_service, ["playlistEditEndpoint", "actions", 0, "removedVideoId"], True
-                            )
-
-                    if TOGGLE_MENU in item:
-                        song["feedback_tokens"] = parse_song_menu_tokens(item)
-                        song["in_library"] = parse_song_library_status(item)
-
-            # albums just search for present keys
-            elif targ := next((x for x in nav(data, MENU_ITEMS) if TOGGLE_MENU in x), None):
-                song["feedback_tokens"] = parse_song_menu_tokens(targ)
-                song["in_library"] = parse_song_library_status(targ)
-
-        # if item is not playable, the videoId was retrieved above
-        if song["video_id"] is None:
-            if (
-                play := nav(data, PLAY_BUTTON, none_if_absent=True)
-            ) is not None and "playNavigationEndpoint" in play:
-                song["video_id"] = play["playNavigationEndpoint"]["watchEndpoint"]["videoId"]
-
-        if "fixedColumns" in data:
-            # two variations
-            if "simpleText" in (fork := get_fixed_column_item(data, 0)["text"]):
-                song["duration_s"] = parse_duration(fork["simpleText"])
-            else:
-                song["duration_s"] = parse_duration(fork["runs"][0]["text"])
-
-        song["video_type"] = nav(
-            data,
-            MENU_ITEMS + [0, "menuNavigationItemRenderer", "navigationEndpoint"] + NAVIGATION_VIDEO_TYPE,
-            True,
-        )
-
-        if menu_entries:
-            for menu_entry in menu_entries:
-                if menu_entry[-1] == "feedbackToken":
-                    song["feedback_token"] = nav(data, MENU_ITEMS + menu_entry)
-                else:
-                    song[menu_entry[-1]] = nav(data, MENU_ITEMS + menu_entry)
-
-        songs.append(song)
-
-    return songs
+            if context is None and playlist_edit is not None:
+                set_video_id = nav(playlist_edit, PLAYLIST_EDIT_SET_VIDEO_ID, True)
+                video_id = nav(playlist_edit, PLAYLIST_EDIT_VIDEO_ID, True)
+
+            if toggle_menu is not None:
+                if "feedback_tokens" in wanted:
+                    feedback_tokens = parse_song_menu_tokens(toggle_menu)
+                in_library = parse_song_library_status(toggle_menu)
+
+    # if item is not playable, the videoId was retrieved above
+    if video_id is None and "video_id" in wanted:
+        if (
+            play := nav(data, PLAY_BUTTON, none_if_absent=True)
+        ) is not None and "playNavigationEndpoint" in play:
+            video_id = play["playNavigationEndpoint"]["watchEndpoint"]["videoId"]
+
+    duration_s = ABSENT
+    if "fixedColumns" in data and "duration_s" in wanted:
+        # two variations
+        if "simpleText" in (fork := get_fixed_column_item(data, 0)["text"]):
+            duration_s = parse_duration(fork["simpleText"])
+        else:
+            duration_s = parse_duration(fork["runs"][0]["text"])
+
+    return (
+        video_id,
+        name,
+        parse_pl_song_artists(data, 1, as_album=context) if "artists" in wanted else None,
+        like_status,
+        in_library,
+        available,
+        nav(data, BADGE_LABEL, True) is not None if "explicit" in wanted else None,
+        nav(items[0], MENU_ITEM_VIDEO_TYPE, True) if items and "video_type" in wanted else None,
+        feedback_tokens,
+        album,
+        thumbnails,
+        track_number,
+        set_video_id,
+        duration_s,
+    )
+
+
+def parse_playlist_item(data, name, context, wanted, entries, fields):
+    song = dict(zip(PLAYLIST_ROW_KEYS, read_playlist_row(data, name, context, wanted)))
+    for key in OPTIONAL_ROW_KEYS:
+        if song[key] is ABSENT:
+            del song[key]
+
+    for key, menu_entry in entries:
+        if key in wanted:
+            song[key] = nav(data, menu_entry)
+
+    return song if fields is None else project(song, fields)
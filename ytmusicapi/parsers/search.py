@@ -1,22 +1,52 @@
 from .songs import *
 from .utils import *
 
+#: keys of the results returned by :py:func:`parse_search_results` and :py:func:`parse_top_result`,
+#: depending on the result type
+SEARCH_RESULT_FIELDS = frozenset(
+    {
+        "category",
+        "result_type",
+        "title",
+        "name",
+        "artist",
+        "artists",
+        "album",
+        "type",
+        "author",
+        "item_count",
+        "subscribers",
+        "browse_id",
+        "video_id",
+        "playlist_id",
+        "video_type",
+        "shuffleId",
+        "radioId",
+        "release_date",
+        "year",
+        "views",
+        "duration",
+        "duration_s",
+        "explicit",
+        "in_library",
+        "feedback_tokens",
+        "thumbnails",
+    }
+)
+
 
 def get_search_result_type(result_type_local, result_types_local):
+    """
+    :param result_types_local: english result type by localized result type,
+        see :py:meth:`~ytmusicapi.parsers.i18n.Parser.get_search_result_types`
+    """
     if not result_type_local:
         return None
-    result_types = ["artist", "playlist", "song", "video", "station", "profile", "podcast", "episode"]
-    result_type_local = result_type_local.lower()
     # default to album since it's labeled with multiple values ('Single', 'EP', etc.)
-    if result_type_local not in result_types_local:
-        result_type = "album"
-    else:
-        result_type = result_types[result_types_local.index(result_type_local)]
-
-    return result_type
+    return result_types_local.get(result_type_local.lower(), "album")
 
 
-def parse_top_result(data, search_result_types):
+def parse_top_result(data, search_result_types, fields=None):
     result_type = get_search_result_type(nav(data, SUBTITLE), search_result_types)
     search_result = {"category": nav(data, CARD_SHELF_TITLE), "result_type": result_type}
     if result_type == "artist":
@@ -24,7 +54,7 @@ def parse_top_result(data, search_result_types):
         if subscribers:
             search_result["subscribers"] = subscribers.split(" ")[0]
 
-        artist_info = parse_song_runs(nav(data, ["title", "runs"]))
+        artist_info = parse_song_runs(nav(data, TITLE_RUNS))
         search_result.update(artist_info)
 
     if result_type in ["song", "video"]:
@@ -35,25 +65,27 @@ def parse_top_result(data, search_result_types):
 
     if result_type in ["song", "video", "album"]:
         if result_type != "album":
-            search_result["video_id"] = nav(data, ["onTap"] + WATCH_VIDEO_ID, True)
-            search_result["video_type"] = nav(data, ["onTap"] + NAVIGATION_VIDEO_TYPE, True)
+            search_result["video_id"] = nav(data, ON_TAP_VIDEO_ID, True)
+            search_result["video_type"] = nav(data, ON_TAP_VIDEO_TYPE, True)
 
         search_result["title"] = nav(data, TITLE_TEXT)
-        runs = nav(data, ["subtitle", "runs"])
+        runs = nav(data, SUBTITLE_RUNS)
         song_info = parse_song_runs(runs, search_result=True)
         search_result.update(song_info)
 
     if result_type in ["album"]:
-        search_result["browse_id"] = nav(data, TITLE + NAVIGATION_BROWSE_ID, True)
+        search_result["browse_id"] = nav(data, TITLE_BROWSE_ID, True)
 
     search_result["thumbnails"] = nav(data, THUMBNAILS, True)
-    return search_result
+    return search_result if fields is None else project(search_result, fields)
 
 
-def parse_search_result(data, search_result_types, result_type, category):
+def parse_search_result(data, search_result_types, result_type, category, fields=None):
+    # fields that are not requested are not parsed, see select_fields
+    wanted = SEARCH_RESULT_FIELDS if fields is None else fields
     default_offset = (not result_type or result_type == "album") * 2
     search_result = {"category": category}
-    video_type = nav(data, PLAY_BUTTON + ["playNavigationEndpoint"] + NAVIGATION_VIDEO_TYPE, True)
+    video_type = nav(data, PLAY_VIDEO_TYPE, True)
     if not result_type and video_type:
         result_type = "song" if video_type == "MUSIC_VIDEO_TYPE_ATV" else "video"
 
@@ -69,7 +101,8 @@ def parse_search_result(data, search_result_types, result_type, category):
 
     if result_type == "artist":
         search_result["artist"] = get_item_text(data, 0)
-        parse_menu_playlists(data, search_result)
+        if "shuffleId" in wanted or "radioId" in wanted:
+            parse_menu_playlists(data, search_result)
 
     elif result_type == "album":
         search_result["type"] = get_item_text(data, 1)
@@ -89,7 +122,7 @@ def parse_search_result(data, search_result_types, result_type, category):
 
     elif result_type == "song":
         search_result["album"] = None
-        if "menu" in data:
+        if "menu" in data and ("in_library" in wanted or "feedback_tokens" in wanted):
             toggle_menu = find_object_by_key(nav(data, MENU_ITEMS), TOGGLE_MENU)
             if toggle_menu:
                 search_result["in_library"] = parse_song_library_status(toggle_menu)
@@ -98,7 +131,7 @@ def parse_search_result(data, search_result_types, result_type, category):
     elif result_type == "upload":
         browse_id = nav(data, NAVIGATION_BROWSE_ID, True)
         if not browse_id:  # song result
-            flex_items = [nav(get_flex_column_item(data, i), ["text", "runs"], True) for i in range(2)]
+            flex_items = [nav(get_flex_column_item(data, i), TEXT_RUNS, True) for i in range(2)]
             if flex_items[0]:
                 search_result["video_id"] = nav(flex_items[0][0], NAVIGATION_VIDEO_ID, True)
                 search_result["playlist_id"] = nav(flex_items[0][0], NAVIGATION_PLAYLIST_ID, True)
@@ -120,33 +153,34 @@ def parse_search_result(data, search_result_types, result_type, category):
                 search_result["result_type"] = "album"
 
     if result_type in ["song", "video"]:
-        search_result["video_id"] = nav(
-            data, PLAY_BUTTON + ["playNavigationEndpoint", "watchEndpoint", "videoId"], True
-        )
+        search_result["video_id"] = nav(data, PLAY_VIDEO_ID, True)
         search_result["video_type"] = video_type
 
     if result_type in ["song", "video", "album"]:
         search_result["duration"] = None
         search_result["year"] = None
-        flex_item = get_flex_column_item(data, 1)
-        runs = flex_item["text"]["runs"]
-        song_info = parse_song_runs(runs)
-        search_result.update(song_info)
+        if not SONG_RUNS_FIELDS.isdisjoint(wanted):
+            flex_item = get_flex_column_item(data, 1)
+            runs = flex_item["text"]["runs"]
+            song_info = parse_song_runs(runs)
+            search_result.update(song_info)
 
     if result_type in ["artist", "album", "playlist", "profile"]:
         search_result["browse_id"] = nav(data, NAVIGATION_BROWSE_ID, True)
 
-    if result_type in ["song", "album"]:
+    if result_type in ["song", "album"] and "explicit" in wanted:
         search_result["explicit"] = nav(data, BADGE_LABEL, True) is not None
 
-    search_result["thumbnails"] = nav(data, THUMBNAILS, True)
+    if "thumbnails" in wanted:
+        search_result["thumbnails"] = nav(data, THUMBNAILS, True)
 
-    return search_result
+    return search_result if fields is None else project(search_result, fields)
 
 
-def parse_search_results(results, search_result_types, result_type=None, category=None):
+def parse_search_results(results, search_result_types, result_type=None, category=None, fields=None):
     return [
-        parse_search_result(result[MRLIR], search_result_types, result_type, category) for result in results
+        parse_search_result(result[MRLIR], search_result_types, result_type, category, fields)
+        for result in results
     ]
 
 
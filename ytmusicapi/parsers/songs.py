@@ -51,6 +51,10 @@ def artists_from_runs(runs, offset=2):
     return [parse_id_name(runs[idx]) for idx in range(offset, len(runs), 2)]
 
 
+#: keys that can be returned by :py:func:`parse_song_runs`
+SONG_RUNS_FIELDS = frozenset({"artists", "album", "views", "duration_s", "year"})
+
+
 def parse_song_runs(runs, search_result=False):
     parsed = {"artists": []}
     for i, run in enumerate(runs):
@@ -95,6 +99,26 @@ def parse_song_library_status(item) -> bool:
     return nav(item, [TOGGLE_MENU, "defaultIcon", "iconType"], True) == "LIBRARY_SAVED"
 
 
+def index_song_menu(items):
+    """
+    Find the library toggle and the playlist edit service of a song menu in a single pass.
+    Returns the toggle menu item and the playlist edit service endpoint, None if absent.
+    """
+    toggle_menu = playlist_edit = None
+    for item in items:
+        if TOGGLE_MENU in item:
+            toggle_menu = item
+            if playlist_edit is not None:
+                break
+        elif "menuServiceItemRenderer" in item:
+            endpoint = item["menuServiceItemRenderer"]["serviceEndpoint"]
+            if "playlistEditEndpoint" in endpoint:
+                playlist_edit = endpoint
+                if toggle_menu is not None:
+                    break
+    return toggle_menu, playlist_edit
+
+
 def parse_song_menu_tokens(item):
     toggle_menu = item[TOGGLE_MENU]
 
@@ -113,3 +137,18 @@ def parse_like_status(service):
     if service is None:
         return None
     return next((x for x in ["LIKE", "INDIFFERENT"] if x != service["likeEndpoint"]["status"]), None)
+
+
+def parse_video_details(details):
+    """keys of :py:class:`~ytmusicapi.models.CoreTrack` from the videoDetails of a player response"""
+    return {
+        "video_id": details["videoId"],
+        "name": details["title"],
+        "duration_s": int(details["lengthSeconds"]),
+        "channel_id": details["channelId"],
+        "crawlable": details["isCrawlable"],
+        "thumbnails": nav(details, ["thumbnail", "thumbnails"], True) or [],
+        "view_count": int(details["viewCount"]),
+        "author": details["author"],
+        "video_type": details.get("musicVideoType"),
+    }
@@ -1,9 +1,34 @@
 import re
-from functools import wraps
+from typing import FrozenSet, Iterable, Optional
 
 from ytmusicapi.navigation import *
 
 
+def select_fields(fields: Optional[Iterable[str]], available: FrozenSet[str]) -> Optional[FrozenSet[str]]:
+    """
+    Validate the keys requested with the ``fields`` parameter of a method returning parsed items.
+
+    :param fields: requested keys, None for all keys
+    :param available: keys the parsed items can have
+    :return: frozenset of the requested keys, None if all keys are requested
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = [fields]
+    selected = frozenset(fields)
+    if unknown := selected - available:
+        raise Exception(
+            f"Invalid fields {', '.join(sorted(unknown))}. Available fields: {', '.join(sorted(available))}"
+        )
+    return selected
+
+
+def project(item, fields):
+    """Copy of a parsed item with only the requested keys"""
+    return {key: value for key, value in item.items() if key in fields}
+
+
 def parse_menu_playlists(data, result):
     watch_menu = find_objects_by_key(nav(data, MENU_ITEMS), "menuNavigationItemRenderer")
     for item in [_x["menuNavigationItemRenderer"] for _x in watch_menu]:
@@ -112,12 +137,3 @@ def parse_duration(duration):
         matches = re.findall(r"(?:(\d*) hour)?(?:, )?(?:(\d*) minutes)?(?:, )?(?:(\d*) seconds)?", duration)
         hours, minutes, seconds = [int(x) if x else 0 for x in matches[0]]
         return seconds + minutes * 60 + hours * 3600
-
-
-def i18n(method):
-    @wraps(method)
-    def _impl(self, *method_args, **method_kwargs):
-        method.__globals__["_"] = self.lang.gettext
-        return method(self, *method_args, **method_kwargs)
-
-    return _impl
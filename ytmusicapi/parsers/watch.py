@@ -1,9 +1,32 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from .songs import *
 
+#: keys of the tracks returned by :py:func:`parse_watch_playlist`
+WATCH_TRACK_FIELDS = frozenset(
+    {
+        "video_id",
+        "title",
+        "length",
+        "thumbnail",
+        "feedback_tokens",
+        "like_status",
+        "in_library",
+        "video_type",
+        "artists",
+        "album",
+        "views",
+        "duration_s",
+        "year",
+        "counterpart",
+    }
+)
+WATCH_MENU_FIELDS = frozenset({"feedback_tokens", "like_status", "in_library"})
+
 
-def parse_watch_playlist(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def parse_watch_playlist(
+    results: List[Dict[str, Any]], fields: Optional[FrozenSet[str]] = None
+) -> List[Dict[str, Any]]:
     tracks = []
     PPVWR = "playlistPanelVideoWrapperRenderer"
     PPVR = "playlistPanelVideoRenderer"
@@ -18,17 +41,20 @@ def parse_watch_playlist(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         if "unplayableText" in data:
             continue
 
-        track = parse_watch_track(data)
-        if counterpart:
+        track = parse_watch_track(data, fields)
+        if counterpart and (fields is None or "counterpart" in fields):
+            # a requested counterpart is complete, the fields only apply to the top-level track
             track["counterpart"] = parse_watch_track(counterpart)
         tracks.append(track)
 
     return tracks
 
 
-def parse_watch_track(data):
+def parse_watch_track(data, fields: Optional[FrozenSet[str]] = None):
+    # fields that are not requested are not parsed, see select_fields
+    wanted = WATCH_TRACK_FIELDS if fields is None else fields
     feedback_tokens = like_status = library_status = None
-    for item in nav(data, MENU_ITEMS):
+    for item in nav(data, MENU_ITEMS) if not WATCH_MENU_FIELDS.isdisjoint(wanted) else []:
         if TOGGLE_MENU in item:
             library_status = parse_song_library_status(item)
             service = item[TOGGLE_MENU]["defaultServiceEndpoint"]
@@ -37,20 +63,19 @@ def parse_watch_track(data):
             if "likeEndpoint" in service:
                 like_status = parse_like_status(service)
 
-    song_info = parse_song_runs(data["longBylineText"]["runs"])
-
     track = {
         "video_id": data["videoId"],
-        "title": nav(data, TITLE_TEXT),
+        "title": nav(data, TITLE_TEXT) if "title" in wanted else None,
         "length": nav(data, ["lengthText", "runs", 0, "text"], True),
-        "thumbnail": nav(data, THUMBNAIL),
+        "thumbnail": nav(data, THUMBNAIL) if "thumbnail" in wanted else None,
         "feedback_tokens": feedback_tokens,
         "like_status": like_status,
         "in_library": library_status,
         "video_type": nav(data, ["navigationEndpoint"] + NAVIGATION_VIDEO_TYPE, True),
     }
-    track.update(song_info)
-    return track
+    if not SONG_RUNS_FIELDS.isdisjoint(wanted):
+        track.update(parse_song_runs(data["longBylineText"]["runs"]))
+    return track if fields is None else project(track, fields)
 
 
 def get_tab_browse_id(next_render, tab_id):
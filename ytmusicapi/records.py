@@ -0,0 +1,124 @@
+"""compact records holding parsed items with a fraction of the memory of dictionaries"""
+
+from typing import Any, ClassVar, Dict, Iterable, Tuple, Type
+
+
+class Record:
+    """
+    Base class of records with a slot per key of the dictionary they replace.
+    Keys missing in the dictionary, i.e. ``set_video_id`` of tracks that can't be removed from a playlist,
+    are unset attributes. Nested dictionaries and lists of dictionaries are records and tuples of records.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+    #: record type of keys holding a dictionary or a list of dictionaries
+    _nested: ClassVar[Dict[str, Type["Record"]]] = {}
+
+    def __init__(self, **values: Any):
+        for key, value in values.items():
+            setattr(self, key, value)
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> "Record":
+        """Convert a parsed dictionary, including nested dictionaries and lists."""
+        record = cls.__new__(cls)
+        for key, value in values.items():
+            if value is not None and key in cls._nested:
+                if isinstance(value, list):
+                    value = tuple(cls._nested[key].from_dict(item) for item in value)
+                else:
+                    value = cls._nested[key].from_dict(value)
+            setattr(record, key, value)
+        return record
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary returned by default, including nested records."""
+        values: Dict[str, Any] = {}
+        for key in self.__slots__:
+            try:
+                value = getattr(self, key)
+            except AttributeError:
+                continue
+            if isinstance(value, Record):
+                value = value.as_dict()
+            elif isinstance(value, tuple) and key in self._nested:
+                value = [item.as_dict() for item in value]
+            values[key] = value
+        return values
+
+    def _values(self) -> Iterable[Tuple[str, Any]]:
+        return ((key, getattr(self, key)) for key in self.__slots__ if hasattr(self, key))
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return list(self._values()) == list(other._values())  # type: ignore[attr-defined]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{key}={value!r}' for key, value in self._values())})"
+
+
+class Thumbnail(Record):
+    """thumbnail image of an item"""
+
+    __slots__ = ("url", "width", "height")
+
+
+class FeedbackTokens(Record):
+    """tokens adding a track to or removing it from the library"""
+
+    __slots__ = ("add", "remove")
+
+
+class ArtistRecord(Record):
+    """artist of a track or author of a playlist"""
+
+    __slots__ = ("id", "name")
+
+
+class AlbumRecord(Record):
+    """album of a track"""
+
+    __slots__ = ("id", "name")
+
+
+class TrackRecord(Record):
+    """track of a playlist, album or the library, see :py:meth:`YTMusic.get_playlist`"""
+
+    __slots__ = (
+        "video_id",
+        "set_video_id",
+        "name",
+        "artists",
+        "album",
+        "track_number",
+        "like_status",
+        "in_library",
+        "available",
+        "explicit",
+        "video_type",
+        "duration_s",
+        "thumbnails",
+        "feedback_tokens",
+    )
+    _nested = {
+        "artists": ArtistRecord,
+        "album": AlbumRecord,
+        "thumbnails": Thumbnail,
+        "feedback_tokens": FeedbackTokens,
+    }
+
+
+class PlaylistRecord(Record):
+    """playlist of the library or of a carousel, see :py:meth:`YTMusic.get_library_playlists`"""
+
+    __slots__ = (
+        "name",
+        "playlist_id",
+        "thumbnails",
+        "description",
+        "view_count",
+        "author",
+        "featured_artists",
+    )
+    _nested = {"thumbnails": Thumbnail, "author": ArtistRecord}
@@ -0,0 +1,3 @@
+from .server import InnerTubeServer
+
+__all__ = ["InnerTubeServer"]
@@ -0,0 +1,57 @@
+"""throughput of parsed tracks as dictionaries and as typed models"""
+
+import argparse
+import time
+from typing import Callable, Dict, Optional, Sequence
+
+from ytmusicapi.models import Track
+from ytmusicapi.parsers.playlists import parse_playlist_items
+
+from . import templates
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    """Fastest of repeat calls of func in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(rows: int = 1000, repeat: int = 5) -> Dict[str, float]:
+    """
+    Parse the synthetic rows of a playlist page in every format and return the tracks per second.
+    The last cases only convert tracks that were already parsed to dictionaries: ``from_parsed`` calls
+    the compiled validator of pydantic-core without the keyword arguments of ``keywords``, and
+    ``model_construct`` skips validation but leaves artists, album, thumbnails and tokens as dictionaries.
+    Printed by ``python -m ytmusicapi.testing.benchmark --rows 1000``
+
+    :param rows: Number of playlist rows. Default: 1000
+    :param repeat: Number of runs per case, the fastest is reported. Default: 5
+    """
+    contents = [templates.track("PLbenchmark", index) for index in range(rows)]
+    parsed = parse_playlist_items(contents)
+    cases = {
+        "dict": lambda: parse_playlist_items(contents),
+        "model": lambda: parse_playlist_items(contents, track_format="model"),
+        "from_parsed": lambda: [Track.from_parsed(track) for track in parsed],
+        "keywords": lambda: [Track(**track) for track in parsed],
+        "model_construct": lambda: [Track.model_construct(**track) for track in parsed],
+    }
+    return {name: rows / best_of(case, repeat) for name, case in cases.items()}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Throughput of parsed tracks as dictionaries and as models")
+    parser.add_argument("--rows", type=int, default=1000, help="playlist rows per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, the fastest is reported")
+    args = parser.parse_args(argv)
+
+    for name, throughput in run(args.rows, args.repeat).items():
+        print(f"{name:<24}{throughput:>12,.0f} tracks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""local stand-in for the InnerTube API used by YouTube Music"""
+
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from . import templates
+
+
+class InnerTubeServer:
+    """
+    HTTP server emulating the ``browse`` (playlists), ``next``, ``player``, ``search`` and
+    ``music/get_search_suggestions`` endpoints with synthetic, deterministic content.
+    Collections are split into pages linked by ``ctoken``/``continuation`` parameters,
+    so all pages of a playlist are fetched by ``get_playlist(playlist_id, limit=None)``.
+
+    The homepage and ``base.js`` are served as well, so a client sends no request to Google when
+    the environment variables ``YTM_DOMAIN`` and ``YTM_BASE_API`` point to the server before
+    ``ytmusicapi`` is imported::
+
+        with InnerTubeServer(latency=0.05, error_rate=0.01) as server:
+            os.environ["YTM_DOMAIN"] = server.url
+            os.environ["YTM_BASE_API"] = server.base_api
+
+    The server can also be started from the command line: ``python -m ytmusicapi.testing.server --port 8080``
+
+    :param host: Interface to listen on. Default: 127.0.0.1
+    :param port: Port to listen on. Default: 0, a free port
+    :param latency: Seconds to wait before each response. Default: 0
+    :param jitter: Maximum random seconds added to the latency. Default: 0
+    :param error_rate: Share of API requests answered with an error status. Default: 0
+    :param error_statuses: Error statuses to pick from. Default: 429, 500, 503
+    :param collection_size: Number of tracks of every playlist and filtered search. Default: 1000
+    :param page_size: Items per playlist page. Search and watch playlists use 20 and 25 items per page
+        like the real API, unless this is smaller. Default: 100
+    :param seed: Seed for latency jitter and error injection. Default: 0
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        error_statuses: Sequence[int] = (429, 500, 503),
+        collection_size: int = 1000,
+        page_size: int = 100,
+        seed: int = 0,
+    ):
+        self.host = host
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.collection_size = collection_size
+        self.page_size = page_size
+        self.requests: Counter = Counter()  #: number of requests per endpoint
+        self.errors: Counter = Counter()  #: number of injected errors per status
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.httpd = ThreadingHTTPServer((host, port), _handler(self))
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """address of the server, replacing ``https://music.youtube.com``"""
+        return f"http://{self.host}:{self.httpd.server_address[1]}"
+
+    @property
+    def base_api(self) -> str:
+        """API base address, replacing ``YTM_BASE_API``"""
+        return self.url + "/youtubei/v1/"
+
+    def start(self) -> "InnerTubeServer":
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "InnerTubeServer":
+        return self.start()
+
+    def __exit__(self, execType=None, execValue=None, trackback=None):
+        self.stop()
+
+    def respond(self, endpoint: str, query: Dict[str, str], body: Dict) -> Tuple[int, Dict]:
+        """
+        Build the response of an API request.
+
+        :param endpoint: path after ``/youtubei/v1/``, i.e. ``browse``
+        :param query: query parameters
+        :param body: parsed request body
+        :return: status code and response body
+        """
+        with self._lock:
+            self.requests[endpoint] += 1
+            delay = self.latency + self._random.uniform(0, self.jitter) if self.jitter else self.latency
+            status = (
+                self._random.choice(self.error_statuses)
+                if self.error_rate and self._random.random() < self.error_rate
+                else 200
+            )
+            if status != 200:
+                self.errors[status] += 1
+        if delay:
+            time.sleep(delay)
+        if status != 200:
+            return status, templates.error(status, "Injected error")
+
+        ctoken = query.get("ctoken") or query.get("continuation")
+        if ctoken:
+            try:
+                kind, key, offset = templates.decode_ctoken(ctoken)
+            except ValueError:
+                return 400, templates.error(400, "Request contains an invalid argument.")
+            return 200, self._continuation(kind, key, offset)
+
+        size = self.collection_size
+        if endpoint == "browse" and body.get("browseId", "").startswith("VL"):
+            return 200, templates.playlist(body["browseId"][2:], size, self.page_size)
+        if endpoint == "search":
+            return 200, templates.search(
+                body.get("query", ""), "params" in body, size, self._search_page_size
+            )
+        if endpoint == "next":
+            playlist_id = body.get("playlistId") or "RDAMVM" + body.get("videoId", "")
+            return 200, templates.watch_playlist(
+                body.get("videoId"), playlist_id, size, self._watch_page_size
+            )
+        if endpoint == "player":
+            return 200, templates.player(body.get("videoId") or body.get("video_id", ""))
+        if endpoint == "music/get_search_suggestions":
+            return 200, templates.search_suggestions(body.get("input", ""))
+        return 404, templates.error(404, f"Requested entity was not found: {endpoint}")
+
+    @property
+    def _search_page_size(self) -> int:
+        return min(20, self.page_size)
+
+    @property
+    def _watch_page_size(self) -> int:
+        return min(25, self.page_size)
+
+    def _continuation(self, kind: str, key: str, offset: int) -> Dict:
+        size = self.collection_size
+        if kind == "playlist":
+            return templates.playlist_continuation(key, offset, size, self.page_size)
+        if kind == "search":
+            return templates.search_continuation(key, offset, size, self._search_page_size)
+        return templates.watch_continuation(key, offset, size, self._watch_page_size)
+
+
+def _handler(server: InnerTubeServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            path = urlsplit(self.path).path
+            if path.endswith("/base.js"):
+                self._send(200, templates.BASE_JS.encode(), "text/javascript")
+            elif path in ("", "/"):
+                self._send(200, templates.HOMEPAGE.encode(), "text/html")
+            else:
+                self._send(404, b"Not Found", "text/plain")
+
+        def do_POST(self):
+            url = urlsplit(self.path)
+            raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            # browser auth files created by older versions send the header for uncompressed bodies
+            if raw[:2] == b"\x1f\x8b":
+                raw = gzip.decompress(raw)
+            try:
+                body = json.loads(raw) if raw else {}
+            except ValueError:
+                body = {}
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            endpoint = url.path.split("/youtubei/v1/", 1)[-1]
+            status, response = server.respond(endpoint, query, body)
+            self._send(status, json.dumps(response).encode(), "application/json; charset=UTF-8")
+
+        def _send(self, status: int, content: bytes, content_type: str):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(content)))
+            if status == 429:
+                self.send_header("Retry-After", "1")
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the YouTube Music InnerTube API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0, help="seconds to wait before each response")
+    parser.add_argument("--jitter", type=float, default=0, help="maximum random seconds added to the latency")
+    parser.add_argument(
+        "--error-rate", type=float, default=0, help="share of requests answered with an error"
+    )
+    parser.add_argument("--collection-size", type=int, default=1000, help="tracks per playlist and search")
+    parser.add_argument("--page-size", type=int, default=100, help="tracks per playlist page")
+    args = parser.parse_args(argv)
+
+    server = InnerTubeServer(
+        args.host,
+        args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        collection_size=args.collection_size,
+        page_size=args.page_size,
+    )
+    print(f"Serving on {server.url}, set YTM_DOMAIN={server.url} YTM_BASE_API={server.base_api}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+"""synthetic InnerTube responses in the shape expected by the parsers"""
+
+import base64
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from ytmusicapi.navigation import MRLIFCR, MRLIR
+
+HOMEPAGE = (
+    '<html><script>ytcfg.set({"VISITOR_DATA": "CgtTdGFuZEluVmlzaXRvcg%3D%3D"});'
+    'ytcfg.set({"jsUrl":"/s/player/standin/player_ias.vflset/en_US/base.js"});</script></html>'
+)
+BASE_JS = "var x={signatureTimestamp:19999};"
+
+
+def make_id(*parts: Any, length: int = 11) -> str:
+    """Deterministic url-safe id derived from parts"""
+    digest = hashlib.sha1(":".join(map(str, parts)).encode()).digest()
+    return base64.urlsafe_b64encode(digest).decode()[:length]
+
+
+def encode_ctoken(kind: str, key: str, offset: int) -> str:
+    """Continuation token pointing to the page of a collection starting at offset"""
+    return base64.urlsafe_b64encode(json.dumps([kind, key, offset]).encode()).decode()
+
+
+def decode_ctoken(ctoken: str) -> List:
+    """Inverse of :py:func:`encode_ctoken`"""
+    return json.loads(base64.urlsafe_b64decode(ctoken.encode()))
+
+
+def _runs(*runs: Dict) -> Dict:
+    return {"runs": list(runs)}
+
+
+def _browse_run(text: str, browse_id: str) -> Dict:
+    return {"text": text, "navigationEndpoint": {"browseEndpoint": {"browseId": browse_id}}}
+
+
+def _thumbnails(size: int = 60) -> Dict:
+    return {
+        "thumbnails": [
+            {"url": f"https://lh3.googleusercontent.com/standin=w{size}", "width": size, "height": size}
+        ]
+    }
+
+
+def _watch_endpoint(video_id: str, playlist_id: Optional[str] = None) -> Dict:
+    endpoint: Dict[str, Any] = {
+        "videoId": video_id,
+        "watchEndpointMusicSupportedConfigs": {
+            "watchEndpointMusicConfig": {"musicVideoType": "MUSIC_VIDEO_TYPE_ATV"}
+        },
+    }
+    if playlist_id:
+        endpoint["playlistId"] = playlist_id
+    return {"watchEndpoint": endpoint}
+
+
+def _continuations(kind: str, key: str, offset: int, total: int, radio: bool = False) -> Dict:
+    if offset >= total:
+        return {}
+    data = "nextRadioContinuationData" if radio else "nextContinuationData"
+    return {"continuations": [{data: {"continuation": encode_ctoken(kind, key, offset)}}]}
+
+
+def track(key: str, index: int) -> Dict:
+    """Song i of a collection, with artist, album and the playlist menu"""
+    video_id = make_id(key, index)
+    return {
+        MRLIR: {
+            "flexColumns": [
+                {
+                    MRLIFCR: {
+                        "text": _runs(
+                            {"text": f"Song {index}", "navigationEndpoint": _watch_endpoint(video_id)}
+                        )
+                    }
+                },
+                {
+                    MRLIFCR: {
+                        "text": _runs(
+                            _browse_run(
+                                f"Artist {index % 50}", "UC" + make_id("artist", index % 50, length=22)
+                            )
+                        )
+                    }
+                },
+                {
+                    MRLIFCR: {
+                        "text": _runs(
+                            _browse_run(f"Album {index % 200}", "MPREb_" + make_id("album", index % 200))
+                        )
+                    }
+                },
+            ],
+            "fixedColumns": [
+                {
+                    "musicResponsiveListItemFixedColumnRenderer": {
+                        "text": _runs({"text": f"{2 + index % 4}:{index % 60:02d}"})
+                    }
+                }
+            ],
+            "thumbnail": {"musicThumbnailRenderer": {"thumbnail": _thumbnails()}},
+            "overlay": {
+                "musicItemThumbnailOverlayRenderer": {
+                    "content": {
+                        "musicPlayButtonRenderer": {"playNavigationEndpoint": _watch_endpoint(video_id)}
+                    }
+                }
+            },
+            "menu": {
+                "menuRenderer": {
+                    "items": [
+                        {
+                            "menuNavigationItemRenderer": {
+                                "icon": {"iconType": "MIX"},
+                                "navigationEndpoint": _watch_endpoint(video_id, "RDAMVM" + video_id),
+                            }
+                        },
+                        {
+                            "toggleMenuServiceItemRenderer": {
+                                "defaultIcon": {"iconType": "LIBRARY_ADD"},
+                                "defaultServiceEndpoint": {
+                                    "feedbackEndpoint": {"feedbackToken": make_id("add", video_id, length=24)}
+                                },
+                                "toggledServiceEndpoint": {
+                                    "feedbackEndpoint": {
+                                        "feedbackToken": make_id("remove", video_id, length=24)
+                                    }
+                                },
+                            }
+                        },
+                        {
+                            "menuServiceItemRenderer": {
+                                "serviceEndpoint": {
+                                    "playlistEditEndpoint": {
+                                        "actions": [
+                                            {
+                                                "setVideoId": make_id("set", key, index, length=16),
+                                                "removedVideoId": video_id,
+                                            }
+                                        ]
+                                    }
+                                }
+                            }
+                        },
+                    ],
+                    "topLevelButtons": [{"likeButtonRenderer": {"likeStatus": "INDIFFERENT"}}],
+                }
+            },
+        }
+    }
+
+
+def playlist(playlist_id: str, total: int, page_size: int) -> Dict:
+    """First page of a playlist with total tracks, as returned by ``browse``"""
+    shelf = {
+        "playlistId": playlist_id,
+        "contents": [track(playlist_id, i) for i in range(min(page_size, total))],
+        **_continuations("playlist", playlist_id, page_size, total),
+    }
+    return {
+        "contents": {
+            "singleColumnBrowseResultsRenderer": {
+                "tabs": [
+                    {
+                        "tabRenderer": {
+                            "content": {
+                                "sectionListRenderer": {"contents": [{"musicPlaylistShelfRenderer": shelf}]}
+                            }
+                        }
+                    }
+                ]
+            }
+        },
+        "header": {
+            "musicDetailHeaderRenderer": {
+                "title": _runs({"text": f"Playlist {playlist_id}"}),
+                "thumbnail": {"croppedSquareThumbnailRenderer": {"thumbnail": _thumbnails(226)}},
+                "description": _runs({"text": "Generated by the stand-in server"}),
+                "subtitle": _runs(
+                    {"text": "Playlist"},
+                    {"text": " • "},
+                    _browse_run("Stand-in", "UC" + make_id("owner", length=22)),
+                    {"text": " • "},
+                    {"text": "2024"},
+                ),
+                "secondSubtitle": _runs(
+                    {"text": f"{total} views"},
+                    {"text": " • "},
+                    {"text": f"{total} songs"},
+                    {"text": " • "},
+                    {"text": f"{total * 3 // 60 + 1}+ hours"},
+                ),
+            }
+        },
+    }
+
+
+def playlist_continuation(playlist_id: str, offset: int, total: int, page_size: int) -> Dict:
+    """Page of a playlist starting at offset"""
+    return {
+        "continuationContents": {
+            "musicPlaylistShelfContinuation": {
+                "contents": [track(playlist_id, i) for i in range(offset, min(offset + page_size, total))],
+                **_continuations("playlist", playlist_id, offset + page_size, total),
+            }
+        }
+    }
+
+
+def search(query: str, filtered: bool, total: int, page_size: int) -> Dict:
+    """Search results for songs, with continuations if a filter is set"""
+    shelf = {
+        "title": _runs({"text": "Songs"}),
+        "contents": [search_song(query, i) for i in range(min(page_size, total))],
+        **(_continuations("search", query, page_size, total) if filtered else {}),
+    }
+    return {
+        "contents": {
+            "tabbedSearchResultsRenderer": {
+                "tabs": [
+                    {
+                        "tabRenderer": {
+                            "content": {"sectionListRenderer": {"contents": [{"musicShelfRenderer": shelf}]}}
+                        }
+                    }
+                ]
+            }
+        }
+    }
+
+
+def search_continuation(query: str, offset: int, total: int, page_size: int) -> Dict:
+    """Page of filtered search results starting at offset"""
+    return {
+        "continuationContents": {
+            "musicShelfContinuation": {
+                "contents": [search_song(query, i) for i in range(offset, min(offset + page_size, total))],
+                **_continuations("search", query, offset + page_size, total),
+            }
+        }
+    }
+
+
+def search_song(query: str, index: int) -> Dict:
+    """Song search result"""
+    item = track("search:" + query, index)
+    data = item[MRLIR]
+    artist, album = (data["flexColumns"][i][MRLIFCR]["text"]["runs"][0] for i in (1, 2))
+    duration = data.pop("fixedColumns")[0]["musicResponsiveListItemFixedColumnRenderer"]["text"]["runs"][0]
+    data["flexColumns"] = [
+        data["flexColumns"][0],
+        {MRLIFCR: {"text": _runs(artist, {"text": " • "}, album, {"text": " • "}, duration)}},
+    ]
+    return item
+
+
+def watch_track(key: str, index: int, playlist_id: str) -> Dict:
+    """Track of a watch playlist queue"""
+    video_id = make_id(key, index)
+    return {
+        "playlistPanelVideoRenderer": {
+            "videoId": video_id,
+            "title": _runs({"text": f"Song {index}"}),
+            "longBylineText": _runs(
+                _browse_run(f"Artist {index % 50}", "UC" + make_id("artist", index % 50, length=22)),
+                {"text": " • "},
+                _browse_run(f"Album {index % 200}", "MPREb_" + make_id("album", index % 200)),
+                {"text": " • "},
+                {"text": "2020"},
+            ),
+            "lengthText": _runs({"text": f"{2 + index % 4}:{index % 60:02d}"}),
+            "thumbnail": _thumbnails(),
+            "navigationEndpoint": _watch_endpoint(video_id, playlist_id),
+            "menu": {
+                "menuRenderer": {
+                    "items": [
+                        {
+                            "toggleMenuServiceItemRenderer": {
+                                "defaultIcon": {"iconType": "LIBRARY_ADD"},
+                                "defaultServiceEndpoint": {
+                                    "feedbackEndpoint": {"feedbackToken": make_id("add", video_id, length=24)}
+                                },
+                                "toggledServiceEndpoint": {
+                                    "feedbackEndpoint": {
+                                        "feedbackToken": make_id("remove", video_id, length=24)
+                                    }
+                                },
+                            }
+                        }
+                    ]
+                }
+            },
+        }
+    }
+
+
+def _is_radio(playlist_id: str) -> bool:
+    return not playlist_id.startswith(("PL", "OLA"))
+
+
+def watch_playlist(video_id: Optional[str], playlist_id: str, total: int, page_size: int) -> Dict:
+    """First page of a watch playlist, as returned by ``next``"""
+    panel = {
+        "contents": [watch_track(playlist_id, i, playlist_id) for i in range(min(page_size, total))],
+        **_continuations("next", playlist_id, page_size, total, _is_radio(playlist_id)),
+    }
+    seed = video_id or playlist_id
+    return {
+        "contents": {
+            "singleColumnMusicWatchNextResultsRenderer": {
+                "tabbedRenderer": {
+                    "watchNextTabbedResultsRenderer": {
+                        "tabs": [
+                            {
+                                "tabRenderer": {
+                                    "content": {
+                                        "musicQueueRenderer": {"content": {"playlistPanelRenderer": panel}}
+                                    }
+                                }
+                            },
+                            {
+                                "tabRenderer": {
+                                    "endpoint": {
+                                        "browseEndpoint": {"browseId": "MPLYt_" + make_id("lyrics", seed)}
+                                    }
+                                }
+                            },
+                            {
+                                "tabRenderer": {
+                                    "endpoint": {
+                                        "browseEndpoint": {"browseId": "MPTRt_" + make_id("related", seed)}
+                                    }
+                                }
+                            },
+                        ]
+                    }
+                }
+            }
+        }
+    }
+
+
+def watch_continuation(playlist_id: str, offset: int, total: int, page_size: int) -> Dict:
+    """Page of a watch playlist starting at offset"""
+    return {
+        "continuationContents": {
+            "playlistPanelContinuation": {
+                "contents": [
+                    watch_track(playlist_id, i, playlist_id)
+                    for i in range(offset, min(offset + page_size, total))
+                ],
+                **_continuations("next", playlist_id, offset + page_size, total, _is_radio(playlist_id)),
+            }
+        }
+    }
+
+
+def player(video_id: str) -> Dict:
+    """Metadata of a song as returned by ``player``, without playable streams"""
+    return {
+        "responseContext": {},
+        "playabilityStatus": {"status": "OK", "playableInEmbed": True},
+        "streamingData": {"expiresInSeconds": "21540", "formats": [], "adaptiveFormats": []},
+        "playbackTracking": {},
+        "videoDetails": {
+            "videoId": video_id,
+            "title": f"Song {video_id}",
+            "lengthSeconds": "205",
+            "channelId": "UC" + make_id("artist", video_id, length=22),
+            "isOwnerViewing": False,
+            "isCrawlable": True,
+            "thumbnail": _thumbnails(544),
+            "allowRatings": True,
+            "viewCount": "1234",
+            "author": "Stand-in Artist",
+            "isPrivate": False,
+            "isUnpluggedCorpus": False,
+            "musicVideoType": "MUSIC_VIDEO_TYPE_ATV",
+            "isLiveContent": False,
+        },
+        "microformat": {
+            "microformatDataRenderer": {"urlCanonical": f"https://music.youtube.com/watch?v={video_id}"}
+        },
+    }
+
+
+def search_suggestions(query: str, count: int = 7) -> Dict:
+    """Suggestions completing query, as returned by ``music/get_search_suggestions``"""
+    return {
+        "contents": [
+            {
+                "searchSuggestionsSectionRenderer": {
+                    "contents": [
+                        {
+                            "searchSuggestionRenderer": {
+                                "suggestion": _runs(
+                                    {"text": query, "bold": True}, {"text": f" suggestion {i}"}
+                                ),
+                                "navigationEndpoint": {
+                                    "searchEndpoint": {"query": f"{query} suggestion {i}"}
+                                },
+                            }
+                        }
+                        for i in range(count)
+                    ]
+                }
+            }
+        ]
+    }
+
+
+def error(status_code: int, message: str) -> Dict:
+    """Error body in the format returned by InnerTube"""
+    return {"error": {"code": status_code, "message": message, "status": "UNAVAILABLE"}}
@@ -0,0 +1,95 @@
+"""containers for track lists returned in a format other than plain dictionaries"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, overload
+
+
+#: cached for keys the track doesn't have, so they are only parsed once
+ABSENT: Any = object()
+
+
+class LazyTrack(Mapping):
+    """
+    Read-only view of a raw track renderer with the keys of a parsed track.
+    A key is parsed the first time it is read and then cached, rows that are never read cost
+    next to nothing. Iterating, ``len`` and comparisons parse all keys at once.
+
+    Returned by methods called with ``track_format="lazy"``. Use ``dict(track)`` for a plain copy.
+    """
+
+    __slots__ = ("_parse", "_fields", "_parsed", "_complete")
+
+    def __init__(self, parse: Callable[[FrozenSet[str]], Dict[str, Any]], fields: FrozenSet[str]):
+        """
+        :param parse: function parsing the requested keys of the track
+        :param fields: keys the track can have
+        """
+        self._parse = parse
+        self._fields = fields
+        self._parsed: Dict[str, Any] = {}
+        self._complete = False
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._parsed:
+            value = self._parsed[key]
+        elif self._complete or key not in self._fields:
+            raise KeyError(key)
+        else:
+            self._parsed.update(self._parse(frozenset((key,))))
+            value = self._parsed.setdefault(key, ABSENT)
+        if value is ABSENT:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parse_all())
+
+    def __len__(self) -> int:
+        return len(self._parse_all())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._parse_all()!r})"
+
+    def _parse_all(self) -> Dict[str, Any]:
+        if not self._complete:
+            self._parsed = self._parse(self._fields)
+            self._complete = True
+        return self._parsed
+
+
+class LazyTracks(Sequence):
+    """
+    Sequence of the :py:class:`LazyTrack` views of a page of raw rows.
+    Views are only created for the rows that are accessed.
+    """
+
+    __slots__ = ("_rows", "_view", "_tracks")
+
+    def __init__(self, rows: Sequence, view: Callable[[Any], LazyTrack]):
+        """
+        :param rows: raw rows
+        :param view: function creating the view of a row
+        """
+        self._rows = rows
+        self._view = view
+        self._tracks: List[Optional[LazyTrack]] = [None] * len(rows)
+
+    @overload
+    def __getitem__(self, index: int) -> LazyTrack: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[LazyTrack]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self._rows)))]
+        track = self._tracks[index]
+        if track is None:
+            track = self._tracks[index] = self._view(self._rows[index])
+        return track
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} of {len(self._rows)} tracks>"
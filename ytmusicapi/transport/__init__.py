@@ -0,0 +1,16 @@
+from .base import BufferedResponse, Transport, TransportResponse
+from .cassette import RecordingTransport, ReplayTransport
+from .fake import FakeRequest, FakeTransport
+from .http import HTTPXTransport, RequestsTransport
+
+__all__ = [
+    "Transport",
+    "TransportResponse",
+    "BufferedResponse",
+    "RequestsTransport",
+    "HTTPXTransport",
+    "FakeTransport",
+    "FakeRequest",
+    "RecordingTransport",
+    "ReplayTransport",
+]
@@ -0,0 +1,49 @@
+"""non-blocking transport used by AsyncYTMusic"""
+
+from typing import Optional
+
+import httpx
+
+from ytmusicapi._bridge import await_only
+
+from .base import Transport
+from .http import _buffer
+
+
+class AsyncHTTPXTransport(Transport):
+    """
+    Transport awaiting an ``httpx.AsyncClient``.
+
+    Only usable from methods of :py:class:`AsyncYTMusic`, which run on the greenlet bridge.
+
+    :param client: Optional. An ``httpx.AsyncClient`` to send requests with.
+        Default: A new client with a request timeout of 30s and up to 100 pooled connections.
+    :param http2: Whether a newly created client negotiates HTTP/2. Default: False
+    :param proxy: Optional. Proxy URL used by a newly created client.
+    """
+
+    def __init__(
+        self, client: Optional[httpx.AsyncClient] = None, http2: bool = False, proxy: Optional[str] = None
+    ):
+        self.client = (
+            client
+            if client is not None
+            else httpx.AsyncClient(
+                http2=http2, timeout=30, limits=httpx.Limits(max_connections=100), proxy=proxy
+            )
+        )
+
+    def post(self, url, data=None, json=None, headers=None, cookies=None):
+        if cookies:
+            self.client.cookies.update(cookies)
+        if hasattr(data, "read"):  # async clients only stream async iterables
+            data = data.read()
+        return _buffer(await_only(self.client.post(url, content=data, json=json, headers=headers)))
+
+    def get(self, url, params=None, headers=None, cookies=None):
+        if cookies:
+            self.client.cookies.update(cookies)
+        return _buffer(await_only(self.client.get(url, params=params, headers=headers)))
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
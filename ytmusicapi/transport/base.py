@@ -0,0 +1,110 @@
+"""interface shared by all http transports"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Mapping, Optional, Protocol
+
+
+class TransportResponse(Protocol):
+    """attributes of a response used by YTMusic. Satisfied by ``requests.Response``"""
+
+    @property
+    def status_code(self) -> int:
+        """HTTP status code"""
+
+    @property
+    def reason(self) -> str:
+        """HTTP reason phrase"""
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """response headers"""
+
+    @property
+    def content(self) -> bytes:
+        """raw response body"""
+
+    @property
+    def text(self) -> str:
+        """decoded response body"""
+
+    def json(self) -> Any:
+        """response body parsed as JSON"""
+
+
+class BufferedResponse:
+    """Fully read response returned by transports not based on requests."""
+
+    def __init__(
+        self,
+        status_code: int,
+        content: bytes = b"",
+        headers: Optional[Mapping[str, str]] = None,
+        reason: str = "",
+        url: str = "",
+    ):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers if headers is not None else {}
+        self.reason = reason
+        self.url = url
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} [{self.status_code}]>"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class Transport(ABC):
+    """
+    Sends the HTTP requests of a YTMusic instance.
+
+    Every request made by the mixins goes through :py:meth:`post` or :py:meth:`get`,
+    so implementations can change how and whether requests reach the network.
+    """
+
+    @abstractmethod
+    def post(
+        self,
+        url: str,
+        data: Any = None,
+        json: Optional[Dict] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+    ) -> TransportResponse:
+        """
+        Send a POST request.
+
+        :param url: full url including query parameters
+        :param data: raw request body, bytes or a binary file object
+        :param json: request body to be serialized as JSON, if data is not set
+        :param headers: request headers
+        :param cookies: request cookies
+        :return: response object
+        """
+
+    @abstractmethod
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+    ) -> TransportResponse:
+        """
+        Send a GET request.
+
+        :param url: url to request
+        :param params: additional query parameters
+        :param headers: request headers
+        :param cookies: request cookies
+        :return: response object
+        """
+
+    def close(self) -> None:
+        """Release pooled connections. The transport must not be used afterwards."""
@@ -0,0 +1,166 @@
+"""transports recording requests to a cassette file and replaying them offline"""
+
+import base64
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .base import BufferedResponse, Transport, TransportResponse
+from .fake import _maybe_json
+
+
+def _request_key(method: str, url: str, params: Optional[Dict], body: Any) -> str:
+    """Identifies equivalent requests, ignoring the daily changing client version."""
+    if isinstance(body, dict) and "context" in body:
+        body = {**body, "context": {**body["context"], "client": dict(body["context"]["client"])}}
+        body["context"]["client"].pop("clientVersion", None)
+    if isinstance(body, bytes):
+        body = base64.b64encode(body).decode("ascii")
+    return json.dumps([method, url, params, body], sort_keys=True, separators=(",", ":"))
+
+
+def _encode_content(content: bytes) -> Dict[str, str]:
+    try:
+        return {"text": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_content(record: Dict[str, str]) -> bytes:
+    if "base64" in record:
+        return base64.b64decode(record["base64"])
+    return record["text"].encode("utf-8")
+
+
+class RecordingTransport(Transport):
+    """
+    Passes requests to another transport and appends every exchange to a cassette file,
+    one JSON object per line, for later use with :py:class:`ReplayTransport`::
+
+        ytmusic = YTMusic(transport=RecordingTransport("session.jsonl"))
+        ytmusic.get_playlist(playlist_id)
+
+    :param path: Cassette file, appended to if it exists
+    :param transport: Optional. Transport sending the requests. Default: A new :py:class:`RequestsTransport`
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], transport: Optional[Transport] = None):
+        if transport is None:
+            from .http import RequestsTransport
+
+            transport = RequestsTransport()
+        self.transport = transport
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+
+    def post(self, url, data=None, json=None, headers=None, cookies=None):
+        if hasattr(data, "read"):
+            data = data.read()
+        start = time.perf_counter()
+        response = self.transport.post(url, data=data, json=json, headers=headers, cookies=cookies)
+        body = json if json is not None else _maybe_json(data)
+        self._record("POST", url, None, body, response, time.perf_counter() - start)
+        return response
+
+    def get(self, url, params=None, headers=None, cookies=None):
+        start = time.perf_counter()
+        response = self.transport.get(url, params=params, headers=headers, cookies=cookies)
+        self._record("GET", url, params, None, response, time.perf_counter() - start)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def _record(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        body: Any,
+        response: TransportResponse,
+        elapsed: float,
+    ) -> None:
+        record = {
+            "method": method,
+            "url": url,
+            "params": params,
+            "body": base64.b64encode(body).decode("ascii") if isinstance(body, bytes) else body,
+            "elapsed": round(elapsed, 6),
+            "response": {
+                "status_code": response.status_code,
+                "reason": response.reason,
+                "headers": dict(response.headers),
+                **_encode_content(response.content),
+            },
+        }
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as cassette:
+            cassette.write(line)
+
+
+class ReplayTransport(Transport):
+    """
+    Serves the responses of a cassette recorded by :py:class:`RecordingTransport` without network access.
+
+    Requests are matched by method, url, query parameters and body, ignoring the client version.
+    Repeated requests receive their recorded responses in order, repeating the last one.
+    Unmatched requests receive a 404 response.
+
+    :param path: Cassette file
+    :param latency: Seconds to wait before each response. Default: 0
+    :param recorded_latency: Additionally wait as long as the recorded request took. Default: False
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], latency: float = 0, recorded_latency: bool = False):
+        self.latency = latency
+        self.recorded_latency = recorded_latency
+        self._exchanges: Dict[str, List[Tuple[float, BufferedResponse]]] = defaultdict(list)
+        self._lock = threading.Lock()
+        with open(path, encoding="utf-8") as cassette:
+            for line in cassette:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                body = record["body"]
+                if record["method"] == "POST" and isinstance(body, str):
+                    body = base64.b64decode(body)
+                response = record["response"]
+                self._exchanges[_request_key(record["method"], record["url"], record["params"], body)].append(
+                    (
+                        record["elapsed"],
+                        BufferedResponse(
+                            response["status_code"],
+                            _decode_content(response),
+                            response["headers"],
+                            response["reason"],
+                            record["url"],
+                        ),
+                    )
+                )
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._exchanges.values())
+
+    def post(self, url, data=None, json=None, headers=None, cookies=None):
+        if hasattr(data, "read"):
+            data = data.read()
+        return self._replay("POST", url, None, json if json is not None else _maybe_json(data))
+
+    def get(self, url, params=None, headers=None, cookies=None):
+        return self._replay("GET", url, params, None)
+
+    def _replay(self, method: str, url: str, params: Optional[Dict], body: Any) -> BufferedResponse:
+        with self._lock:
+            responses = self._exchanges.get(_request_key(method, url, params, body))
+            if not responses:
+                error = {"error": {"message": f"No recorded response for {method} {url}"}}
+                return BufferedResponse(404, json.dumps(error).encode("utf-8"), url=url)
+            elapsed, response = responses.pop(0) if len(responses) > 1 else responses[0]
+
+        delay = self.latency + (elapsed if self.recorded_latency else 0)
+        if delay:
+            time.sleep(delay)
+        return response
@@ -0,0 +1,119 @@
+"""in-memory transport for tests and benchmarks"""
+
+import gzip
+import json
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+from ytmusicapi.constants import YTM_DOMAIN
+
+from .base import BufferedResponse, Transport, TransportResponse
+
+
+class FakeRequest(NamedTuple):
+    """request received by a :py:class:`FakeTransport`"""
+
+    method: str
+    url: str
+    params: Optional[Dict]
+    headers: Dict[str, str]
+    body: Any  #: parsed and decompressed JSON body, raw bytes or None
+
+
+FakeResponse = Union[Dict, List, str, bytes, TransportResponse]
+FakeHandler = Union[FakeResponse, Callable[[FakeRequest], FakeResponse]]
+
+#: minimal homepage for the visitor id lookup
+HOMEPAGE = 'ytcfg.set({"VISITOR_DATA": "CgtGYWtlVmlzaXRvcg%3D%3D"});'
+
+
+class FakeTransport(Transport):
+    """
+    Serves registered responses instantly without any network access.
+
+    Routes are matched against the request url without its query string,
+    either completely or by their last path segments, so ``"browse"`` matches
+    ``https://music.youtube.com/youtubei/v1/browse``.
+    When several responses are added for the same route they are served in order,
+    repeating the last one. Unmatched requests receive a 404 response::
+
+        fake = FakeTransport()
+        fake.add("browse", {"contents": ...})
+        fake.add("next", lambda request: build_response(request.body["videoId"]))
+        ytmusic = YTMusic(transport=fake)
+
+    :param routes: Optional. Initial mapping of route to response or handler.
+    """
+
+    def __init__(self, routes: Optional[Dict[str, FakeHandler]] = None):
+        self._routes: Dict[str, List[FakeHandler]] = {}
+        self.requests: List[FakeRequest] = []  #: all requests received, in order
+        self._routes[YTM_DOMAIN] = [HOMEPAGE]
+        self._default_homepage = True
+        for route, handler in (routes or {}).items():
+            self.add(route, handler)
+
+    def add(self, route: str, handler: FakeHandler) -> None:
+        """
+        Register a response for a route.
+
+        :param route: endpoint (i.e. ``browse``) or full url
+        :param handler: JSON-serializable object, text or bytes to respond with,
+            a prepared response, or a callable receiving the :py:class:`FakeRequest`
+            and returning one of those.
+        """
+        if route == YTM_DOMAIN and self._default_homepage:
+            self._routes[route] = []
+            self._default_homepage = False
+        self._routes.setdefault(route, []).append(handler)
+
+    def reset(self) -> None:
+        """Forget all received requests."""
+        self.requests.clear()
+
+    def post(self, url, data=None, json=None, headers=None, cookies=None):
+        if hasattr(data, "read"):
+            data = data.read()
+        body = json if json is not None else _maybe_json(data)
+        return self._respond(FakeRequest("POST", url, None, dict(headers or {}), body))
+
+    def get(self, url, params=None, headers=None, cookies=None):
+        return self._respond(FakeRequest("GET", url, params, dict(headers or {}), None))
+
+    def _respond(self, request: FakeRequest) -> TransportResponse:
+        self.requests.append(request)
+        handlers = self._match(request.url.split("?")[0])
+        if handlers is None:
+            return _to_response(404, {"error": {"message": f"No fake response for {request.url}"}})
+
+        handler = handlers.pop(0) if len(handlers) > 1 else handlers[0]
+        result = handler(request) if callable(handler) else handler
+        return _to_response(200, result)
+
+    def _match(self, path: str) -> Optional[List[FakeHandler]]:
+        if path in self._routes:
+            return self._routes[path]
+        for route, handlers in self._routes.items():
+            if path.endswith("/" + route):
+                return handlers
+        return None
+
+
+def _maybe_json(data: Any) -> Any:
+    if isinstance(data, bytes):
+        if data[:2] == b"\x1f\x8b":
+            data = gzip.decompress(data)
+        try:
+            return json.loads(data)
+        except ValueError:
+            return data
+    return data
+
+
+def _to_response(status_code: int, result: FakeResponse) -> TransportResponse:
+    if isinstance(result, (dict, list)):
+        return BufferedResponse(status_code, json.dumps(result).encode("utf-8"))
+    if isinstance(result, str):
+        return BufferedResponse(status_code, result.encode("utf-8"))
+    if isinstance(result, bytes):
+        return BufferedResponse(status_code, result)
+    return result
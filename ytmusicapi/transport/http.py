@@ -0,0 +1,87 @@
+"""transports sending requests over the network"""
+
+from functools import partial
+from typing import Any, Dict, Optional, Union
+
+import requests
+
+from .base import BufferedResponse, Transport
+
+
+class RequestsTransport(Transport):
+    """
+    Default transport based on requests.
+
+    :param session: A Requests session object or a truthy value to create one with a request timeout of 30s.
+        A falsy value sends every request without connection pooling.
+    :param proxies: Optional. Proxy configuration in requests format.
+    """
+
+    def __init__(
+        self, session: Union[requests.Session, bool] = True, proxies: Optional[Dict[str, str]] = None
+    ):
+        self.session: requests.Session  #: request session for connection pooling
+        self.proxies = proxies
+
+        if isinstance(session, requests.Session):
+            self.session = session
+        else:
+            if session:  # Build a new session.
+                self.session = requests.Session()
+                self.session.request = partial(self.session.request, timeout=30)  # type: ignore[method-assign]
+            else:  # Use the Requests API module as a "session".
+                self.session = requests.api  # type: ignore[assignment]
+
+    def post(self, url, data=None, json=None, headers=None, cookies=None) -> requests.Response:
+        return self.session.post(
+            url, data=data, json=json, headers=headers, proxies=self.proxies, cookies=cookies
+        )
+
+    def get(self, url, params=None, headers=None, cookies=None) -> requests.Response:
+        return self.session.get(url, params=params, headers=headers, proxies=self.proxies, cookies=cookies)
+
+    def close(self) -> None:
+        if isinstance(self.session, requests.Session):
+            self.session.close()
+
+
+class HTTPXTransport(Transport):
+    """
+    Transport based on a pooled ``httpx.Client``, with HTTP/2 enabled by default.
+
+    Requires ``pip install ytmusicapi[http2]``.
+
+    :param client: Optional. An ``httpx.Client`` to send requests with.
+        Default: A new client with a request timeout of 30s.
+    :param http2: Whether a newly created client negotiates HTTP/2. Default: True
+    :param proxy: Optional. Proxy URL used by a newly created client.
+    """
+
+    def __init__(self, client: Optional[Any] = None, http2: bool = True, proxy: Optional[str] = None):
+        import httpx
+
+        self.client: httpx.Client = (
+            client if client is not None else httpx.Client(http2=http2, timeout=30, proxy=proxy)
+        )
+
+    def post(self, url, data=None, json=None, headers=None, cookies=None) -> BufferedResponse:
+        self._set_cookies(cookies)
+        return _buffer(self.client.post(url, content=data, json=json, headers=headers))
+
+    def get(self, url, params=None, headers=None, cookies=None) -> BufferedResponse:
+        self._set_cookies(cookies)
+        return _buffer(self.client.get(url, params=params, headers=headers))
+
+    def close(self) -> None:
+        self.client.close()
+
+    def _set_cookies(self, cookies: Optional[Dict[str, str]]) -> None:
+        # httpx deprecated per-request cookies, keep them on the client instead
+        if cookies:
+            self.client.cookies.update(cookies)
+
+
+def _buffer(response) -> BufferedResponse:
+    return BufferedResponse(
+        response.status_code, response.content, response.headers, response.reason_phrase, str(response.url)
+    )
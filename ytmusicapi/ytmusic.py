@@ -1,16 +1,16 @@
-import gettext
+import gzip
 import json
 import locale
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
-from functools import partial
 from typing import Dict, Optional, Union
 
-import requests
-from requests import Response
 from requests.structures import CaseInsensitiveDict
 
+from ytmusicapi.cache import ResponseCache, cache_key, invalidation_targets
 from ytmusicapi.helpers import (
     SUPPORTED_LANGUAGES,
     SUPPORTED_LOCATIONS,
@@ -22,8 +22,11 @@ from ytmusicapi.helpers import (
     get_authorization,
     get_visitor_id,
     initialize_context,
+    json_dumps,
+    json_loads,
     sapisid_from_cookie,
 )
+from ytmusicapi.metrics import RequestTimings, ValidationStats
 from ytmusicapi.mixins.browsing import BrowsingMixin
 from ytmusicapi.mixins.explore import ExploreMixin
 from ytmusicapi.mixins.library import LibraryMixin
@@ -31,7 +34,8 @@ from ytmusicapi.mixins.playlists import PlaylistsMixin
 from ytmusicapi.mixins.search import SearchMixin
 from ytmusicapi.mixins.uploads import UploadsMixin
 from ytmusicapi.mixins.watch import WatchMixin
-from ytmusicapi.parsers.i18n import Parser
+from ytmusicapi.parsers.i18n import get_parser
+from ytmusicapi.transport import RequestsTransport, Transport, TransportResponse
 
 from .auth import OAuthCredentials, OAuthToken, RefreshingToken
 from .auth.types import AuthType
@@ -48,6 +52,12 @@ class YTMusicBase:
         language: str = "en",
         location: str = "",
         oauth_credentials: Optional[OAuthCredentials] = None,
+        transport: Optional[Transport] = None,
+        cache: Optional[ResponseCache] = None,
+        compression_threshold: Optional[int] = 16 * 1024,
+        prefetch: bool = False,
+        hedge_after: Optional[float] = None,
+        max_workers: int = 16,
     ):
         """
         Create a new instance to interact with YouTube Music.
@@ -85,10 +95,37 @@ class YTMusicBase:
             Available languages can be checked in the FAQ.
         :param oauth_credentials: Optional. Used to specify a different oauth client to be
             used for authentication flow.
+        :param transport: Optional. :py:class:`~ytmusicapi.transport.Transport` sending all requests,
+            i.e. a pooled HTTP/2 ``HTTPXTransport`` or an in-memory ``FakeTransport``.
+            Overrides ``requests_session`` and ``proxies``.
+            Default: A ``RequestsTransport`` built from ``requests_session`` and ``proxies``.
+        :param cache: Optional. :py:class:`~ytmusicapi.cache.ResponseCache` storing responses of
+            rarely changing pages like albums, artists and lyrics, i.e. a ``MemoryCache``
+            or a ``SQLiteCache`` shared between processes.
+            Requests modifying data bypass the cache and invalidate affected entries.
+            Caches should not be shared between instances authenticated with different accounts.
+            Default: No caching
+        :param compression_threshold: Optional. Request bodies of at least this many bytes,
+            like adding thousands of songs to a playlist, are sent gzip compressed. None disables compression.
+            Default: 16 KiB
+        :param prefetch: Optional. Request the next page of long listings like playlists in a background thread
+            while the current page is parsed. If an iteration is stopped early, one page may be requested in vain.
+            Default: False
+        :param hedge_after: Optional. Seconds after which a validated continuation (see ``validate_responses``
+            of :py:func:`get_library_songs`) is requested again while the first request is still running.
+            The first complete response is used and short responses are retried immediately.
+            Default: None, short responses are retried one after another
+        :param max_workers: Optional. Maximum number of threads requesting pages ahead with ``prefetch``,
+            and of the threads racing requests with ``hedge_after``. Each listing waits for one page at a time
+            and each validated request for up to four, and threads are only started when none is idle,
+            so calls from several threads, i.e. by :py:func:`get_playlists`, don't wait for each other.
+            Default: 16
         """
 
         self._base_headers = None  #: for authless initializing requests during OAuth flow
-        self._headers = None  #: cache formed headers including auth
+        self._headers: Optional[Dict] = None  #: shared headers and visitor id, never modified once set
+        # never held while requests are sent, greenlets of AsyncYTMusic share the thread holding it
+        self._headers_lock = threading.Lock()
 
         self.auth = auth  #: raw auth
         self._input_dict: CaseInsensitiveDict = (
@@ -100,17 +137,21 @@ class YTMusicBase:
         self._token: RefreshingToken  #: OAuth credential handler
         self.oauth_credentials: OAuthCredentials  #: Client used for OAuth refreshing
 
-        self._session: requests.Session  #: request session for connection pooling
         self.proxies: Optional[Dict[str, str]] = proxies  #: params for session modification
 
-        if isinstance(requests_session, requests.Session):
-            self._session = requests_session
-        else:
-            if requests_session:  # Build a new session.
-                self._session = requests.Session()
-                self._session.request = partial(self._session.request, timeout=30)  # type: ignore[method-assign]
-            else:  # Use the Requests API module as a "session".
-                self._session = requests.api  # type: ignore[assignment]
+        #: sends all requests, see :py:mod:`ytmusicapi.transport`
+        self._transport: Transport = (
+            transport if transport is not None else RequestsTransport(requests_session, proxies)
+        )
+        self.cache = cache  #: response cache, see :py:mod:`ytmusicapi.cache`
+        self.timings = RequestTimings()  #: network and JSON decoding time of all requests
+        self.compression_threshold = compression_threshold  #: minimum size of compressed request bodies
+        self.prefetch = prefetch  #: request the next continuation page while parsing the current one
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self.hedge_after = hedge_after  #: latency in seconds before a validated request is duplicated
+        self.max_workers = max_workers  #: size of the thread pools requesting pages ahead and racing requests
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self.validation_stats = ValidationStats()  #: short pages of validated responses
 
         # see google cookie docs: https://policies.google.com/technologies/cookies
         # value from https://github.com/yt-dlp/yt-dlp/blob/master/yt_dlp/extractor/youtube.py#L502
@@ -158,9 +199,9 @@ class YTMusicBase:
             with suppress(locale.Error):
                 locale.setlocale(locale.LC_ALL, "en_US.UTF-8")
 
-        locale_dir = os.path.abspath(os.path.dirname(__file__)) + os.sep + "locales"
-        self.lang = gettext.translation("base", localedir=locale_dir, languages=[language])
-        self.parser = Parser(self.lang)
+        # translations and lookup tables are shared by all instances with the same language
+        self.parser = get_parser(language)
+        self.lang = self.parser.lang
 
         if user:
             self.context["context"]["user"]["onBehalfOfUser"] = user
@@ -194,7 +235,6 @@ class YTMusicBase:
                     "accept": "*/*",
                     "accept-encoding": "gzip, deflate",
                     "content-type": "application/json",
-                    "content-encoding": "gzip",
                     "origin": YTM_DOMAIN,
                 }
 
@@ -202,48 +242,117 @@ class YTMusicBase:
 
     @property
     def headers(self):
-        # set on first use
-        if not self._headers:
-            self._headers = self.base_headers
+        """headers of a single request, a new dictionary on every access"""
+        self._prepare_headers()
+        headers = self._headers.copy()  # type: ignore[union-attr]
 
         # keys updated each use, custom oauth implementations left untouched
         if self.auth_type == AuthType.BROWSER:
-            self._headers["authorization"] = get_authorization(self.sapisid + " " + self.origin)
+            headers["authorization"] = get_authorization(self.sapisid + " " + self.origin)
 
         elif self.auth_type in AuthType.oauth_types():
-            self._headers["authorization"] = self._token.as_auth()
-            self._headers["X-Goog-Request-Time"] = str(int(time.time()))
+            headers["authorization"] = self._token.as_auth()
+            headers["X-Goog-Request-Time"] = str(int(time.time()))
 
-        return self._headers
+        return headers
 
-    def _send_request(self, endpoint: str, body: Dict, additional_params: str = "") -> Dict:
-        body.update(self.context)
+    @property
+    def _prefetcher(self) -> Optional[ThreadPoolExecutor]:
+        """threads requesting continuations ahead, one per concurrent listing, None if prefetching is disabled"""
+        if not self.prefetch:
+            return None
+        if self._prefetch_executor is None:
+            with self._headers_lock:  # created once if several threads start listings
+                if self._prefetch_executor is None:
+                    self._prefetch_executor = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix="ytmusicapi-prefetch"
+                    )
+        return self._prefetch_executor
 
+    @property
+    def _hedger(self) -> Optional[ThreadPoolExecutor]:
+        """threads racing duplicate validated requests of all callers, None if hedging is disabled"""
+        if self.hedge_after is None:
+            return None
+        if self._hedge_executor is None:
+            with self._headers_lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix="ytmusicapi-hedge"
+                    )
+        return self._hedge_executor
+
+    def _prepare_headers(self) -> None:
+        """
+        Build the headers shared by all requests once, including the visitor id,
+        so that requests sent from several threads don't race to set them.
+        Concurrent callers share the homepage download of the bootstrap cache.
+        """
+        if self._headers is not None:
+            return
+        headers = self.base_headers.copy()
         # only required for post requests (?)
-        if self._headers and "X-Goog-Visitor-Id" not in self._headers:
-            self._headers.update(get_visitor_id(self._send_get_request))
+        if "X-Goog-Visitor-Id" not in headers:
+            headers.update(get_visitor_id(self._send_get_request))
+        with self._headers_lock:
+            if self._headers is None:  # the first headers are kept if another caller set them meanwhile
+                self._headers = headers
+
+    def _send_request(self, endpoint: str, body: Dict, additional_params: str = "") -> Dict:
+        body.update(self.context)
 
-        response = self._session.post(
+        ttl, key = None, ""
+        if self.cache is not None:
+            tags, prefixes = invalidation_targets(endpoint, body)
+            if tags or prefixes:
+                self.cache.invalidate(tags, prefixes)
+            elif ttl := self.cache.ttl_for(endpoint, body):
+                key = cache_key(endpoint, body, self.context, additional_params)
+                if (cached := self.cache.get(key)) is not None:
+                    start = time.perf_counter()
+                    cached_json = json_loads(cached)
+                    self.timings.record(0.0, time.perf_counter() - start, len(cached), cached=True)
+                    return cached_json
+
+        data = json_dumps(body)
+        compress = self.compression_threshold is not None and len(data) >= self.compression_threshold
+        if compress:
+            data = gzip.compress(data, compresslevel=6, mtime=0)
+        # the content-encoding header must only be present for compressed bodies
+        headers = {
+            key: value
+            for key, value in self.headers.items()
+            if key.lower() not in ("content-encoding", "content-type")
+        }
+        headers["content-type"] = "application/json"
+        if compress:
+            headers["content-encoding"] = "gzip"
+
+        start = time.perf_counter()
+        response = self._transport.post(
             YTM_BASE_API + endpoint + self.params + additional_params,
-            json=body,
-            headers=self.headers,
-            proxies=self.proxies,
+            data=data,
+            headers=headers,
             cookies=self.cookies,
         )
-        response_text = json.loads(response.text)
+        received = time.perf_counter()
+        content = response.content
+        response_json = json_loads(content)
+        self.timings.record(received - start, time.perf_counter() - received, len(content))
         if response.status_code >= 400:
             message = "Server returned HTTP " + str(response.status_code) + ": " + response.reason + ".\n"
-            error = response_text.get("error", {}).get("message")
+            error = response_json.get("error", {}).get("message")
             raise Exception(message + error)
-        return response_text
+        if ttl and self.cache is not None:
+            self.cache.set(key, content, ttl, [body["browseId"]] if "browseId" in body else [])
+        return response_json
 
-    def _send_get_request(self, url: str, params: Optional[Dict] = None) -> Response:
-        response = self._session.get(
+    def _send_get_request(self, url: str, params: Optional[Dict] = None) -> TransportResponse:
+        response = self._transport.get(
             url,
             params=params,
             # handle first-use x-goog-visitor-id fetching
             headers=self.headers if self._headers else self.base_headers,
-            proxies=self.proxies,
             cookies=self.cookies,
         )
         return response
@@ -263,7 +372,12 @@ class YTMusicBase:
         return self
 
     def __exit__(self, execType=None, execValue=None, trackback=None):
-        pass
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+            self._prefetch_executor = None
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+            self._hedge_executor = None
 
 
 class YTMusic(